@@ -142,8 +142,8 @@ def store_session(metadata):
 
     # get the hashed user id for eq
     id_generator = current_app.eq["id_generator"]
-    user_id = id_generator.generate_id(metadata["response_id"])
-    user_ik = id_generator.generate_ik(metadata["response_id"])
+    response_id = metadata["response_id"]
+    user_id, user_ik = id_generator.generate_ids_and_iks([response_id])[response_id]
 
     eq_session_id = str(uuid4())
 
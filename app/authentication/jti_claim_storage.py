@@ -1,11 +1,20 @@
-from datetime import timedelta
+import threading
+from datetime import datetime, timedelta
+from typing import Dict
 
+from dateutil.tz import tzutc
 from flask import current_app
 from structlog import get_logger
 
 from app.data_models.app_models import UsedJtiClaim
 from app.helpers.uuid_helper import is_valid_uuid
+from app.settings import (
+    EQ_JTI_CLAIM_FILTER_BUCKET_SECONDS,
+    EQ_JTI_CLAIM_FILTER_CAPACITY,
+    EQ_JTI_CLAIM_FILTER_ERROR_RATE,
+)
 from app.storage.errors import ItemAlreadyExistsError
+from app.utilities.bloom_filter import BloomFilter
 
 logger = get_logger()
 
@@ -21,6 +30,83 @@ class JtiTokenUsed(Exception):
         )
 
 
+class RecentJtiClaims:
+    """
+    An in-process record of the jti claims recently used, so a replayed token can be rejected
+    without a round trip to ephemeral storage, which remains the record of first use.
+
+    Claims are held in Bloom filters bucketed by when they expire. A replayed token has the same
+    expiry as the original, so only one bucket is checked, and buckets are dropped once every
+    claim in them has expired. A false positive rejects an unused token, so `error_rate` should
+    be very small, and once `capacity` claims have been added to a bucket no more are added, so
+    that error rate holds. Claims which are not added are still rejected by ephemeral storage.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, bucket_seconds: int):
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._bucket_seconds = bucket_seconds
+        self._lock = threading.Lock()
+        # {<bucket index>: <BloomFilter of jti claims expiring in the bucket>}
+        self._buckets: Dict[int, BloomFilter] = {}
+        self.local_rejections = 0
+        self.remote_rejections = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _get_bucket_index(self, expires_at: datetime) -> int:
+        return int(expires_at.timestamp()) // self._bucket_seconds
+
+    def _drop_expired_buckets(self) -> None:
+        current_index = self._get_bucket_index(datetime.now(tz=tzutc()))
+        for index in [index for index in self._buckets if index < current_index]:
+            del self._buckets[index]
+
+    def might_contain(self, jti_claim: str, expires_at: datetime) -> bool:
+        with self._lock:
+            bloom_filter = self._buckets.get(self._get_bucket_index(expires_at))
+            return bool(bloom_filter and bloom_filter.might_contain(jti_claim))
+
+    def add(self, jti_claim: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._drop_expired_buckets()
+            index = self._get_bucket_index(expires_at)
+            bloom_filter = self._buckets.get(index)
+            if bloom_filter is None:
+                bloom_filter = self._buckets[index] = BloomFilter(
+                    self._capacity, self._error_rate
+                )
+            if not bloom_filter.is_full:
+                bloom_filter.add(jti_claim)
+
+    def record_rejection(self, locally: bool) -> None:
+        with self._lock:
+            if locally:
+                self.local_rejections += 1
+            else:
+                self.remote_rejections += 1
+
+    def rejections(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "local_rejections": self.local_rejections,
+                "remote_rejections": self.remote_rejections,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self.local_rejections = self.remote_rejections = 0
+
+
+recent_jti_claims = RecentJtiClaims(
+    capacity=EQ_JTI_CLAIM_FILTER_CAPACITY,
+    error_rate=EQ_JTI_CLAIM_FILTER_ERROR_RATE,
+    bucket_seconds=EQ_JTI_CLAIM_FILTER_BUCKET_SECONDS,
+)
+
+
 def use_jti_claim(jti_claim, expires_at):
     """
     Use a jti claim
@@ -36,12 +122,36 @@ def use_jti_claim(jti_claim, expires_at):
         logger.info("jti claim is invalid", jti_claim=jti_claim)
         raise TypeError
 
-    try:
-        # Make claim expire a little later than exp to avoid race conditions with out of sync clocks.
-        expires_at += timedelta(seconds=60)
+    # Make claim expire a little later than exp to avoid race conditions with out of sync clocks.
+    expires_at += timedelta(seconds=60)
 
+    filter_enabled = current_app.config["EQ_JTI_CLAIM_FILTER_ENABLED"]
+    if filter_enabled and recent_jti_claims.might_contain(jti_claim, expires_at):
+        recent_jti_claims.record_rejection(locally=True)
+        logger.error(
+            "jti claim has already been used",
+            jti_claim=jti_claim,
+            rejected_locally=True,
+            **recent_jti_claims.rejections(),
+        )
+        raise JtiTokenUsed(jti_claim)
+
+    try:
         jti = UsedJtiClaim(jti_claim, expires_at)
+        # Not grouped with other writes in a pipelined block, as the result is needed before
+        # the session is created, and a replayed token must not create a session
         current_app.eq["ephemeral_storage"].put(jti, overwrite=False)
     except ItemAlreadyExistsError as e:
-        logger.error("jti claim has already been used", jti_claim=jti_claim)
+        recent_jti_claims.record_rejection(locally=False)
+        if filter_enabled:
+            recent_jti_claims.add(jti_claim, expires_at)
+        logger.error(
+            "jti claim has already been used",
+            jti_claim=jti_claim,
+            **recent_jti_claims.rejections(),
+        )
         raise JtiTokenUsed(jti_claim) from e
+
+    # Only recorded once ephemeral storage has recorded the first use
+    if filter_enabled:
+        recent_jti_claims.add(jti_claim, expires_at)
@@ -1,8 +1,10 @@
 from functools import wraps
 
+from flask import request
 from flask_login import current_user
 from werkzeug.exceptions import Forbidden
 
+from app.authentication.authenticator import decrypt_token
 from app.globals import get_metadata
 
 
@@ -37,3 +39,21 @@ def role_required(role):
         return role_required_wrapper
 
     return role_required_decorator
+
+
+def get_token_with_role(role):
+    """
+    Decrypt the token passed in the `token` query string parameter of the current request,
+    for views which are called by other services rather than by a logged in user. The
+    decrypted token is returned if it grants the specified role, otherwise None.
+
+    :param role: The role the token must grant
+    """
+    encrypted_token = request.args.get("token")
+    if not encrypted_token:
+        return None
+
+    decrypted_token = decrypt_token(encrypted_token)
+    roles = decrypted_token.get("roles") or []
+
+    return decrypted_token if role in roles else None
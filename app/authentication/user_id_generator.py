@@ -1,4 +1,9 @@
 import binascii
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 
 from cryptography.hazmat.backends.openssl.backend import backend
 from cryptography.hazmat.primitives import hashes
@@ -6,12 +11,21 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from structlog import get_logger
 
 from app.utilities.strings import to_bytes, to_str
+from app.utilities.ttl_cache import TTLCache
 
 logger = get_logger()
 
 
 class UserIDGenerator:
-    def __init__(self, iterations, user_id_salt, user_ik_salt):
+    def __init__(
+        self,
+        iterations,
+        user_id_salt,
+        user_ik_salt,
+        cache_max_size=0,
+        cache_ttl_seconds=0,
+        max_workers=None,
+    ):
         if user_id_salt is None:
             raise ValueError("user_id_salt is required")
         if user_ik_salt is None:
@@ -20,13 +34,71 @@ class UserIDGenerator:
         self._iterations = iterations
         self._user_id_salt = user_id_salt
         self._user_ik_salt = user_ik_salt
+        # Threads are only started once derivations are submitted
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="user-id-generator"
+        )
+
+        # Derived ids and iks are cached so a response_id which is seen repeatedly, e.g. a
+        # relaunch or a flush, is only run through PBKDF2 once. Entries are keyed by an HMAC
+        # of the response_id under a key generated for each cache, so it is never held.
+        self.cache: Optional[TTLCache] = None
+        if cache_max_size > 0 and cache_ttl_seconds > 0:
+            self.cache = TTLCache(cache_max_size, cache_ttl_seconds)
+            self._cache_hmac_key = os.urandom(32)
 
     def generate_id(self, response_id):
+        if self.cache is not None:
+            return self.cache.get_or_set(
+                self._get_cache_key("user_id", response_id),
+                lambda: self._generate_id(response_id),
+            )
+        return self._generate_id(response_id)
+
+    def generate_ik(self, response_id):
+        if self.cache is not None:
+            return self.cache.get_or_set(
+                self._get_cache_key("user_ik", response_id),
+                lambda: self._generate_ik(response_id),
+            )
+        return self._generate_ik(response_id)
+
+    def generate_ids_and_iks(
+        self, response_ids: Iterable[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate the user id and ik for each response_id, concurrently in a thread pool, as
+        PBKDF2 releases the GIL while deriving. Cached values are used where there are any.
+
+        :return: {<response_id>: (<user_id>, <user_ik>)}
+        """
+        futures = {
+            response_id: (
+                self._executor.submit(self.generate_id, response_id),
+                self._executor.submit(self.generate_ik, response_id),
+            )
+            for response_id in response_ids
+        }
+
+        return {
+            response_id: (user_id.result(), user_ik.result())
+            for response_id, (user_id, user_ik) in futures.items()
+        }
+
+    def _get_cache_key(self, purpose, response_id) -> Tuple[str, bytes]:
+        return (
+            purpose,
+            hmac.new(
+                self._cache_hmac_key, to_bytes(response_id), hashlib.sha256
+            ).digest(),
+        )
+
+    def _generate_id(self, response_id):
         salt = to_bytes(self._user_id_salt)
         user_id = self._generate(response_id, salt)
         return to_str(user_id)
 
-    def generate_ik(self, response_id):
+    def _generate_ik(self, response_id):
         salt = to_bytes(self._user_ik_salt)
         user_ik = self._generate(response_id, salt)
         return to_str(user_ik)
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, Mapping, Optional, Union
 
+from app.utilities.strings import intern_str
 
-@dataclass
+
+@dataclass(init=False)
 class Answer:
+    # Stores hold thousands of answers, so they are slotted and their ids are interned
+    __slots__ = ("answer_id", "value", "list_item_id")
+
     answer_id: str
     value: Union[str, int, float, List, Mapping]
-    list_item_id: Optional[str] = field(default=None)
+    list_item_id: Optional[str]
+
+    def __init__(
+        self,
+        answer_id: str,
+        value: Union[str, int, float, List, Mapping],
+        list_item_id: Optional[str] = None,
+    ):
+        self.answer_id = intern_str(answer_id)
+        self.value = value
+        self.list_item_id = intern_str(list_item_id)
 
     @classmethod
     def from_dict(cls, answer_dict: Dict) -> Answer:
@@ -19,10 +34,14 @@ class Answer:
         )
 
     def for_json(self) -> Dict:
-        output = self.to_dict()
-        if not self.list_item_id:
-            del output["list_item_id"]
+        output = {"answer_id": self.answer_id, "value": self.value}
+        if self.list_item_id:
+            output["list_item_id"] = self.list_item_id
         return output
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "answer_id": self.answer_id,
+            "value": self.value,
+            "list_item_id": self.list_item_id,
+        }
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from jinja2 import escape
 
@@ -19,6 +19,18 @@ class AnswerStore:
             Answer
         }
     }
+
+    Answers with a list_item_id are also indexed by list_item_id, and their list_item_ids by answer_id:
+
+    {
+        <list_item_id>: {(<answer_id>, <list_item_id>), ...}
+    }
+
+    {
+        <answer_id>: {<list_item_id>, ...}
+    }
+
+    Dicts are used as insertion ordered sets.
     """
 
     def __init__(self, existing_answers: List[Dict] = None):
@@ -28,7 +40,16 @@ class AnswerStore:
             existing_answers: If a list of answer dictionaries is provided, this will be used to initialise the store.
         """
         self.answer_map = self._build_map(existing_answers or [])
+        self._keys_by_list_item_id: Dict[
+            str, Dict[Tuple[str, Optional[str]], None]
+        ] = {}
+        self._list_item_ids_by_answer_id: Dict[str, Dict[str, None]] = {}
+        for key in self.answer_map:
+            self._add_to_index(key)
+
         self._is_dirty = False
+        self._version = 0
+        self._answer_versions: Dict[str, int] = {}
 
     def __iter__(self):
         return iter(self.answer_map.values())
@@ -54,10 +75,45 @@ class AnswerStore:
                 f"Method only supports Answer argument type, found type: {type(answer)}"
             )
 
+    def _add_to_index(self, key: Tuple[str, Optional[str]]):
+        answer_id, list_item_id = key
+        if list_item_id:
+            self._keys_by_list_item_id.setdefault(list_item_id, {})[key] = None
+            self._list_item_ids_by_answer_id.setdefault(answer_id, {})[
+                list_item_id
+            ] = None
+
+    def _remove_from_index(self, key: Tuple[str, Optional[str]]):
+        answer_id, list_item_id = key
+        if list_item_id:
+            self._discard_from_index(self._keys_by_list_item_id, list_item_id, key)
+            self._discard_from_index(
+                self._list_item_ids_by_answer_id, answer_id, list_item_id
+            )
+
+    @staticmethod
+    def _discard_from_index(index: Dict, index_key, value):
+        values = index.get(index_key)
+        if values is not None:
+            values.pop(value, None)
+            if not values:
+                del index[index_key]
+
     @property
     def is_dirty(self):
         return self._is_dirty
 
+    def _mark_changed(self, answer_id: str):
+        self._version += 1
+        self._answer_versions[answer_id] = self._version
+
+    def get_answer_version(self, answer_id: str) -> int:
+        """
+        A number that changes whenever any answer with this answer_id is added,
+        updated or removed. Used to detect when derived state needs recomputing.
+        """
+        return self._answer_versions.get(answer_id, 0)
+
     def add_or_update(self, answer: Answer):
         """
         Add a new answer into the answer store, or update if it exists.
@@ -70,6 +126,8 @@ class AnswerStore:
         if existing_answer != answer:
             self._is_dirty = True
             self.answer_map[key] = answer
+            self._add_to_index(key)
+            self._mark_changed(answer.answer_id)
 
     def get_answer(self, answer_id: str, list_item_id: str = None) -> Optional[Answer]:
         """Get a single answer from the store
@@ -104,11 +162,41 @@ class AnswerStore:
 
         return output_answers
 
+    def get_answers_for_list_item_id(self, list_item_id: str) -> List[Answer]:
+        """Get all answers for a list item
+
+        Args:
+            list_item_id: The list item id to match
+
+        Returns:
+            A list of Answer objects, in the order they were added
+        """
+        return [
+            self.answer_map[key]
+            for key in self._keys_by_list_item_id.get(list_item_id, {})
+        ]
+
+    def get_list_item_ids_for_answer_id(self, answer_id: str) -> List[str]:
+        """Get the list item ids of every answer with an answer_id
+
+        Args:
+            answer_id: The answer id to match
+
+        Returns:
+            A list of list item ids, in the order their answers were added
+        """
+        return list(self._list_item_ids_by_answer_id.get(answer_id, {}))
+
     def clear(self):
         """
         Clears answers *in place*
         """
+        for answer_id, _ in self.answer_map:
+            self._mark_changed(answer_id)
+
         self.answer_map.clear()
+        self._keys_by_list_item_id.clear()
+        self._list_item_ids_by_answer_id.clear()
 
     def remove_answer(self, answer_id: str, list_item_id: str = None):
         """
@@ -117,22 +205,21 @@ class AnswerStore:
 
         if self.answer_map.get((answer_id, list_item_id)):
             del self.answer_map[(answer_id, list_item_id)]
+            self._remove_from_index((answer_id, list_item_id))
             self._is_dirty = True
+            self._mark_changed(answer_id)
 
     def remove_all_answers_for_list_item_id(self, list_item_id: str):
-        """Remove all answers associated with a particular list_item_id.
-        This method iterates through the entire list of answers.
-
-        *Not efficient.*
-        """
-        keys_to_delete = []
-        for answer in self:
-            if answer.list_item_id == list_item_id:
-                keys_to_delete.append((answer.answer_id, answer.list_item_id))
+        """Remove all answers associated with a particular list_item_id."""
+        keys_to_delete = self._keys_by_list_item_id.pop(list_item_id, {})
 
         for key in keys_to_delete:
             del self.answer_map[key]
+            self._discard_from_index(
+                self._list_item_ids_by_answer_id, key[0], list_item_id
+            )
             self._is_dirty = True
+            self._mark_changed(key[0])
 
     def serialize(self):
         return list(self.answer_map.values())
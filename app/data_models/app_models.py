@@ -5,10 +5,20 @@ from marshmallow import Schema, fields, post_load, pre_dump
 
 
 class QuestionnaireState:
-    def __init__(self, user_id, state_data, version):
+    def __init__(self, user_id, state_data, version, delta_key=None, delta_sequence=0):
         self.user_id = user_id
         self.state_data = state_data
         self.version = version
+        self.delta_key = delta_key
+        self.delta_sequence = delta_sequence
+        self.created_at = datetime.now(tz=tzutc())
+        self.updated_at = datetime.now(tz=tzutc())
+
+
+class QuestionnaireStateDelta:
+    def __init__(self, delta_id, state_data):
+        self.delta_id = delta_id
+        self.state_data = state_data
         self.created_at = datetime.now(tz=tzutc())
         self.updated_at = datetime.now(tz=tzutc())
 
@@ -56,6 +66,8 @@ class QuestionnaireStateSchema(Schema, DateTimeSchemaMixin):
     user_id = fields.Str()
     state_data = fields.Str()
     version = fields.Integer()
+    delta_key = fields.Str(allow_none=True)
+    delta_sequence = fields.Integer()
 
     @post_load
     def make_model(self, data, **kwargs):
@@ -67,6 +79,20 @@ class QuestionnaireStateSchema(Schema, DateTimeSchemaMixin):
         return model
 
 
+class QuestionnaireStateDeltaSchema(Schema, DateTimeSchemaMixin):
+    delta_id = fields.Str()
+    state_data = fields.Str()
+
+    @post_load
+    def make_model(self, data, **kwargs):
+        created_at = data.pop("created_at", None)
+        updated_at = data.pop("updated_at", None)
+        model = QuestionnaireStateDelta(**data)
+        model.created_at = created_at
+        model.updated_at = updated_at
+        return model
+
+
 class EQSessionSchema(Schema, DateTimeSchemaMixin):
     eq_session_id = fields.Str()
     user_id = fields.Str()
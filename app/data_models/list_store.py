@@ -1,7 +1,7 @@
 import random
 from functools import cached_property
 from string import ascii_letters
-from typing import List, Mapping, Optional
+from typing import Dict, List, Mapping, Optional
 
 from structlog import get_logger
 
@@ -115,6 +115,8 @@ class ListStore:
         self._lists = self._build_map(existing_items)
 
         self._is_dirty = False
+        self._version = 0
+        self._list_versions: Dict[str, int] = {}
 
     def __iter__(self):
         for list_item in self._lists.values():
@@ -128,6 +130,7 @@ class ListStore:
 
     def __delitem__(self, list_name):
         del self._lists[list_name]
+        self._mark_changed(list_name)
 
     def __repr__(self):
         return f"<ListStore lists={self._lists}>"
@@ -163,6 +166,17 @@ class ListStore:
     def is_dirty(self):
         return self._is_dirty
 
+    def _mark_changed(self, list_name: str):
+        self._version += 1
+        self._list_versions[list_name] = self._version
+
+    def get_list_version(self, list_name: str) -> int:
+        """
+        A number that changes whenever the named list is modified.
+        Used to detect when derived state needs recomputing.
+        """
+        return self._list_versions.get(list_name, 0)
+
     def delete_list_item(self, list_name, item_id):
         try:
             self[list_name].items.remove(item_id)
@@ -176,6 +190,7 @@ class ListStore:
             del self[list_name]
 
         self._is_dirty = True
+        self._mark_changed(list_name)
 
     def add_list_item(self, list_name, primary_person=False):
         """Add a new list item to a named list.
@@ -201,6 +216,7 @@ class ListStore:
 
         self._lists[list_name] = named_list
         self._is_dirty = True
+        self._mark_changed(list_name)
 
         return list_item_id
 
@@ -3,13 +3,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Mapping, Optional
 
+from app.utilities.strings import intern_str
 
-@dataclass
+
+@dataclass(init=False)
 class Progress:
+    # Slotted, with interned ids, as a store holds one per section and list item
+    __slots__ = ("section_id", "block_ids", "status", "list_item_id")
+
     section_id: str
     block_ids: List[Optional[str]]
-    status: Optional[str] = None
-    list_item_id: Optional[str] = None
+    status: Optional[str]
+    list_item_id: Optional[str]
+
+    def __init__(
+        self,
+        section_id: str,
+        block_ids: List[Optional[str]],
+        status: Optional[str] = None,
+        list_item_id: Optional[str] = None,
+    ):
+        self.section_id = intern_str(section_id)
+        self.block_ids = [intern_str(block_id) for block_id in block_ids]
+        self.status = status
+        self.list_item_id = intern_str(list_item_id)
 
     @classmethod
     def from_dict(cls, progress_dict: Mapping) -> Progress:
@@ -21,5 +38,9 @@ class Progress:
         )
 
     def for_json(self) -> Mapping:
-        attributes = vars(self)
-        return {k: v for k, v in attributes.items() if v is not None}
+        output = {"section_id": self.section_id, "block_ids": self.block_ids}
+        if self.status is not None:
+            output["status"] = self.status
+        if self.list_item_id is not None:
+            output["list_item_id"] = self.list_item_id
+        return output
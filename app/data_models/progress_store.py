@@ -1,5 +1,5 @@
 from dataclasses import astuple, dataclass
-from typing import Iterable, List, Mapping, MutableMapping, Optional
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple
 
 from app.data_models.progress import Progress
 from app.questionnaire.location import Location
@@ -16,10 +16,16 @@ class CompletionStatus:
         return iter(astuple(self))
 
 
+SectionKey = Tuple[str, Optional[str]]
+
+
 class ProgressStore:
     """
     An object that stores and updates references to sections and blocks
     that have been started.
+
+    Section keys are indexed by status, and the completed block ids of each section are
+    held as a set, so that completion queries don't need to scan the progress.
     """
 
     def __init__(self, in_progress_sections: List[Mapping] = None) -> None:
@@ -32,6 +38,11 @@ class ProgressStore:
         self._progress = self._build_map(
             in_progress_sections or []
         )  # type: MutableMapping
+        # Dicts are used as insertion ordered sets of section keys
+        self._section_keys_by_status: Dict[Optional[str], Dict[SectionKey, None]] = {}
+        self._completed_block_ids: Dict[SectionKey, Set[Optional[str]]] = {}
+        for section_key, section_progress in self._progress.items():
+            self._add_to_index(section_key, section_progress)
 
     def __contains__(self, section_key) -> bool:
         return section_key in self._progress
@@ -67,26 +78,64 @@ class ProgressStore:
     def is_dirty(self) -> bool:
         return self._is_dirty
 
+    def _add_to_index(self, section_key: SectionKey, section_progress: Progress):
+        self._section_keys_by_status.setdefault(section_progress.status, {})[
+            section_key
+        ] = None
+        self._completed_block_ids[section_key] = set(section_progress.block_ids)
+
+    def _remove_from_index(self, section_key: SectionKey):
+        section_progress = self._progress[section_key]
+        section_keys = self._section_keys_by_status.get(section_progress.status)
+        if section_keys is not None:
+            section_keys.pop(section_key, None)
+        self._completed_block_ids.pop(section_key, None)
+
+    def _add_progress(self, section_key: SectionKey, section_progress: Progress):
+        self._progress[section_key] = section_progress
+        self._add_to_index(section_key, section_progress)
+
+    def _remove_progress(self, section_key: SectionKey):
+        self._remove_from_index(section_key)
+        del self._progress[section_key]
+
     def is_section_complete(
         self, section_id: str, list_item_id: Optional[str] = None
     ) -> bool:
-        return (section_id, list_item_id) in self.section_keys(
-            statuses={
+        section_key = (section_id, list_item_id)
+        return any(
+            section_key in self._section_keys_by_status.get(status, {})
+            for status in (
                 CompletionStatus.COMPLETED,
                 CompletionStatus.INDIVIDUAL_RESPONSE_REQUESTED,
-            }
+            )
         )
 
+    def is_block_complete(
+        self,
+        block_id: Optional[str],
+        section_id: str,
+        list_item_id: Optional[str] = None,
+    ) -> bool:
+        return block_id in self._completed_block_ids.get((section_id, list_item_id), ())
+
     def section_keys(
         self, statuses: Iterable[str] = None, section_ids: Iterable[str] = None
     ):
         if not statuses:
             statuses = {*CompletionStatus()}
 
+        # Keys are returned in progress order, using the index to check their status
+        section_keys_by_status = [
+            self._section_keys_by_status.get(status, {}) for status in set(statuses)
+        ]
         section_keys = [
             section_key
-            for section_key, section_progress in self._progress.items()
-            if section_progress.status in statuses
+            for section_key in self._progress
+            if any(
+                section_key in status_section_keys
+                for status_section_keys in section_keys_by_status
+            )
         ]
 
         if section_ids is None:
@@ -103,18 +152,23 @@ class ProgressStore:
     ) -> None:
         section_key = (section_id, list_item_id)
         if section_key in self._progress:
+            self._remove_from_index(section_key)
             self._progress[section_key].status = section_status
+            self._add_to_index(section_key, self._progress[section_key])
             self._is_dirty = True
 
         elif (
             section_status == CompletionStatus.INDIVIDUAL_RESPONSE_REQUESTED
             and section_key not in self._progress
         ):
-            self._progress[section_key] = Progress(
-                section_id=section_id,
-                list_item_id=list_item_id,
-                block_ids=[],
-                status=section_status,
+            self._add_progress(
+                section_key,
+                Progress(
+                    section_id=section_id,
+                    list_item_id=list_item_id,
+                    block_ids=[],
+                    status=section_status,
+                ),
             )
             self._is_dirty = True
 
@@ -139,35 +193,36 @@ class ProgressStore:
     def add_completed_location(self, location: Location) -> None:
         section_id = location.section_id
         list_item_id = location.list_item_id
+        section_key = (section_id, list_item_id)
 
-        completed_block_ids = self.get_completed_block_ids(section_id, list_item_id)
-
-        if location.block_id not in completed_block_ids:
-            completed_block_ids.append(location.block_id)
-
-            section_key = (section_id, list_item_id)
+        if self.is_block_complete(location.block_id, section_id, list_item_id):
+            return
 
-            if section_key in self._progress:
-                self._progress[section_key].block_ids = completed_block_ids
-            else:
-                self._progress[section_key] = Progress(
+        if section_key in self._progress:
+            self._progress[section_key].block_ids.append(location.block_id)
+            self._completed_block_ids[section_key].add(location.block_id)
+        else:
+            self._add_progress(
+                section_key,
+                Progress(
                     section_id=section_id,
                     list_item_id=list_item_id,
-                    block_ids=completed_block_ids,
-                )
+                    block_ids=[location.block_id],
+                ),
+            )
 
-            self._is_dirty = True
+        self._is_dirty = True
 
     def remove_completed_location(self, location: Location) -> None:
         section_key = (location.section_id, location.list_item_id)
-        if (
-            section_key in self._progress
-            and location.block_id in self._progress[section_key].block_ids
+        if self.is_block_complete(
+            location.block_id, location.section_id, location.list_item_id
         ):
             self._progress[section_key].block_ids.remove(location.block_id)
+            self._completed_block_ids[section_key].discard(location.block_id)
 
             if not self._progress[section_key].block_ids:
-                del self._progress[section_key]
+                self._remove_progress(section_key)
 
             self._is_dirty = True
 
@@ -185,7 +240,7 @@ class ProgressStore:
         ]
 
         for section_key in section_keys_to_delete:
-            del self._progress[section_key]
+            self._remove_progress(section_key)
 
             self._is_dirty = True
 
@@ -194,4 +249,6 @@ class ProgressStore:
 
     def clear(self) -> None:
         self._progress.clear()
+        self._section_keys_by_status.clear()
+        self._completed_block_ids.clear()
         self._is_dirty = True
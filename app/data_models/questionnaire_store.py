@@ -1,17 +1,28 @@
+from copy import deepcopy
 from types import MappingProxyType
 
 import simplejson as json
 
+from app.data_models import questionnaire_store_codec
 from app.data_models.answer_store import AnswerStore
 from app.data_models.list_store import ListStore
 from app.data_models.progress_store import ProgressStore
+from app.questionnaire.routing_path_cache import RoutingPathCache
 
 
 class QuestionnaireStore:
-    LATEST_VERSION = 1
+    # Version 1 is verbose, version 2 is encoded with questionnaire_store_codec. Both are
+    # read, but version 2 is only written when compact encoding is enabled
+    LATEST_VERSION = 2
+    VERBOSE_VERSION = 1
+    COMPACT_SECTION_DECODERS = {
+        "ANSWERS": questionnaire_store_codec.decode_answers,
+        "PROGRESS": questionnaire_store_codec.decode_progress,
+    }
 
-    def __init__(self, storage, version=None):
+    def __init__(self, storage, version=None, compact_encoding_enabled=False):
         self._storage = storage
+        self._compact_encoding_enabled = compact_encoding_enabled
         if version is None:
             version = self.get_latest_version_number()
         self.version = version
@@ -19,18 +30,93 @@ class QuestionnaireStore:
         # self.metadata is a read-only view over self._metadata
         self.metadata = MappingProxyType(self._metadata)
         self.response_metadata = {}
-        self.list_store = ListStore()
-        self.answer_store = AnswerStore()
-        self.progress_store = ProgressStore()
+        # The answer, list and progress stores are built from their serialized data on first use
+        self._serialized_data = {}
+        self._serialized_version = None
+        self._list_store = None
+        self._answer_store = None
+        self._progress_store = None
+        self.routing_path_cache = RoutingPathCache()
 
         raw_data, version = self._storage.get_user_data()
         if raw_data:
-            self._deserialize(raw_data)
+            self._deserialize(raw_data, version)
         if version is not None:
             self.version = version
 
+        self._mark_clean()
+
     def get_latest_version_number(self):
-        return self.LATEST_VERSION
+        if self._compact_encoding_enabled:
+            return self.LATEST_VERSION
+        return self.VERBOSE_VERSION
+
+    @property
+    def answer_store(self):
+        if self._answer_store is None:
+            self._answer_store = AnswerStore(self._pop_serialized_section("ANSWERS"))
+        return self._answer_store
+
+    @answer_store.setter
+    def answer_store(self, answer_store):
+        self._answer_store = answer_store
+
+    @property
+    def list_store(self):
+        if self._list_store is None:
+            self._list_store = ListStore.deserialize(
+                self._pop_serialized_section("LISTS")
+            )
+        return self._list_store
+
+    @list_store.setter
+    def list_store(self, list_store):
+        self._list_store = list_store
+
+    @property
+    def progress_store(self):
+        if self._progress_store is None:
+            self._progress_store = ProgressStore(
+                self._pop_serialized_section("PROGRESS")
+            )
+        return self._progress_store
+
+    @progress_store.setter
+    def progress_store(self, progress_store):
+        self._progress_store = progress_store
+
+    def _pop_serialized_section(self, key):
+        if key not in self._serialized_data:
+            return None
+
+        if self._serialized_version and self._serialized_version >= 2:
+            decoder = self.COMPACT_SECTION_DECODERS.get(key)
+            if decoder:
+                section = decoder(self._serialized_data)
+                del self._serialized_data[key]
+                return section
+
+        return self._serialized_data.pop(key)
+
+    @property
+    def is_dirty(self):
+        """
+        Whether anything has changed since the store was loaded or last saved.
+        The answer, list and progress stores track their own changes, metadata and
+        response metadata are compared with a copy taken when the store was clean.
+        Stores that haven't been built yet can't have changed.
+        """
+        return any(
+            store is not None and store.is_dirty
+            for store in (self._answer_store, self._list_store, self._progress_store)
+        ) or (
+            self._metadata != self._clean_metadata
+            or self.response_metadata != self._clean_response_metadata
+        )
+
+    def _mark_clean(self):
+        self._clean_metadata = deepcopy(self._metadata)
+        self._clean_response_metadata = deepcopy(self.response_metadata)
 
     def set_metadata(self, to_set):
         """
@@ -42,15 +128,34 @@ class QuestionnaireStore:
 
         return self
 
-    def _deserialize(self, data):
+    def _deserialize(self, data, version=None):
         json_data = json.loads(data, use_decimal=True)
-        self.progress_store = ProgressStore(json_data.get("PROGRESS"))
-        self.set_metadata(json_data.get("METADATA", {}))
-        self.answer_store = AnswerStore(json_data.get("ANSWERS"))
-        self.list_store = ListStore.deserialize(json_data.get("LISTS"))
-        self.response_metadata = json_data.get("RESPONSE_METADATA", {})
 
-    def serialize(self):
+        self.set_metadata(json_data.pop("METADATA", {}))
+        self.response_metadata = json_data.pop("RESPONSE_METADATA", {})
+
+        self._serialized_data = json_data
+        self._serialized_version = version
+        self._answer_store = self._list_store = self._progress_store = None
+
+    def serialize(self, version=None):
+        """
+        Serialize the store in the format of `version`, defaulting to the version new data
+        is written in. Version 1 is verbose, so is still used where the output is read by people.
+        """
+        if version is None:
+            version = self.get_latest_version_number()
+
+        if version >= 2:
+            data = questionnaire_store_codec.encode(
+                metadata=self._metadata,
+                answers=self.answer_store,
+                lists=self.list_store.serialize(),
+                progress=self.progress_store.serialize(),
+                response_metadata=self.response_metadata,
+            )
+            return json.dumps(data, for_json=True, separators=(",", ":"))
+
         data = {
             "METADATA": self._metadata,
             "ANSWERS": list(self.answer_store),
@@ -64,9 +169,17 @@ class QuestionnaireStore:
         self._storage.delete()
         self._metadata.clear()
         self.response_metadata = {}
+        self._serialized_data = {}
         self.answer_store.clear()
         self.progress_store.clear()
+        self.routing_path_cache.clear()
+        self._mark_clean()
 
     def save(self):
-        data = self.serialize()
-        self._storage.save(data=data)
+        if not self.is_dirty:
+            return
+
+        version = self.get_latest_version_number()
+        data = self.serialize(version)
+        self._storage.save(data=data, version=version)
+        self._mark_clean()
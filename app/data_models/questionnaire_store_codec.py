@@ -0,0 +1,205 @@
+"""
+Compact encoding of the questionnaire store, used from version 2 onwards.
+
+Version 1 stores every answer and section progress as an object, repeating keys such as
+`answer_id`, `list_item_id`, `section_id` and `block_ids` for every entry. The compact
+encoding instead interns each id once in a table of ids and refers to it by index, and stores
+answers as columns:
+
+{
+    "METADATA": {...},
+    "RESPONSE_METADATA": {...},
+    "LISTS": [...],
+    "IDS": [<id>, ...],
+    "ANSWERS": [[<answer_id index>, ...], [<list_item_id index or -1>, ...], [<value>, ...]],
+    "PROGRESS": [[<section_id index>, <list_item_id index or -1>, <status index>, [<block_id index>, ...]], ...]
+}
+
+Ids are interned per payload rather than against the schema, so stored state can be decoded
+without loading the schema and remains valid when a schema is updated.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from app.data_models.answer import Answer
+from app.data_models.progress import Progress
+
+NO_ID = -1
+
+
+class _IdTable:
+    def __init__(self):
+        self.ids: List[str] = []
+        self._indexes: Dict[str, int] = {}
+
+    def intern(self, id_: Optional[str]) -> int:
+        if id_ is None:
+            return NO_ID
+
+        index = self._indexes.get(id_)
+        if index is None:
+            index = self._indexes[id_] = len(self.ids)
+            self.ids.append(id_)
+        return index
+
+
+def encode(
+    metadata: Mapping,
+    answers: Iterable[Answer],
+    lists: List[Mapping],
+    progress: Iterable[Progress],
+    response_metadata: Mapping,
+) -> Dict:
+    id_table = _IdTable()
+    intern = id_table.intern
+
+    answer_ids = []
+    list_item_ids = []
+    values = []
+    for answer in answers:
+        answer_ids.append(intern(answer.answer_id))
+        list_item_ids.append(intern(answer.list_item_id))
+        values.append(answer.value)
+
+    encoded_progress = [
+        [
+            intern(section_progress.section_id),
+            intern(section_progress.list_item_id),
+            intern(section_progress.status),
+            [intern(block_id) for block_id in section_progress.block_ids],
+        ]
+        for section_progress in progress
+    ]
+
+    return {
+        "METADATA": metadata,
+        "RESPONSE_METADATA": response_metadata,
+        "LISTS": lists,
+        "IDS": id_table.ids,
+        "ANSWERS": [answer_ids, list_item_ids, values],
+        "PROGRESS": encoded_progress,
+    }
+
+
+def _get_id_lookup(ids: List[str]):
+    def lookup(index: int) -> Optional[str]:
+        return None if index == NO_ID else ids[index]
+
+    return lookup
+
+
+def decode_answers(data: Mapping) -> List[Dict]:
+    ids = data.get("IDS", [])
+    answers = []
+    if encoded_answers := data.get("ANSWERS"):
+        for answer_id, list_item_id, value in zip(*encoded_answers):
+            answer = {"answer_id": ids[answer_id], "value": value}
+            if list_item_id != NO_ID:
+                answer["list_item_id"] = ids[list_item_id]
+            answers.append(answer)
+
+    return answers
+
+
+def decode_progress(data: Mapping) -> List[Dict]:
+    lookup = _get_id_lookup(data.get("IDS", []))
+    return [
+        {
+            "section_id": lookup(section_id),
+            "list_item_id": lookup(list_item_id),
+            "status": lookup(status),
+            "block_ids": [lookup(block_id) for block_id in block_ids],
+        }
+        for section_id, list_item_id, status, block_ids in data.get("PROGRESS", [])
+    ]
+
+
+def decode(data: Mapping) -> Dict:
+    """
+    Decode compact data into the shape of version 1 data, which is what the
+    answer, list and progress stores are built from.
+    """
+    return {
+        "METADATA": data.get("METADATA", {}),
+        "ANSWERS": decode_answers(data),
+        "LISTS": data.get("LISTS"),
+        "PROGRESS": decode_progress(data),
+        "RESPONSE_METADATA": data.get("RESPONSE_METADATA", {}),
+    }
+
+
+def _answer_key(answer: Mapping):
+    return answer["answer_id"], answer.get("list_item_id")
+
+
+def _progress_key(progress: Mapping):
+    return progress["section_id"], progress.get("list_item_id")
+
+
+def _get_keyed_delta(
+    previous: Optional[List[Mapping]], current: Optional[List[Mapping]], get_key
+) -> Dict[str, List]:
+    previous_by_key = {get_key(item): item for item in previous or []}
+    current_by_key = {get_key(item): item for item in current or []}
+
+    delta: Dict[str, List] = {}
+    updated = [
+        item for key, item in current_by_key.items() if previous_by_key.get(key) != item
+    ]
+    if updated:
+        delta["updated"] = updated
+
+    removed = [list(key) for key in previous_by_key if key not in current_by_key]
+    if removed:
+        delta["removed"] = removed
+
+    return delta
+
+
+def get_delta(previous: Mapping, current: Mapping) -> Dict:
+    """
+    The changes between two decoded stores. Answers and progress are diffed by key,
+    metadata, response metadata and lists are included whole when they have changed.
+    An empty delta means the stores are the same.
+    """
+    delta: Dict[str, Any] = {}
+    for key, get_key in (("ANSWERS", _answer_key), ("PROGRESS", _progress_key)):
+        if keyed_delta := _get_keyed_delta(
+            previous.get(key), current.get(key), get_key
+        ):
+            delta[key] = keyed_delta
+
+    for key in ("METADATA", "LISTS", "RESPONSE_METADATA"):
+        if previous.get(key) != current.get(key):
+            delta[key] = current.get(key)
+
+    return delta
+
+
+def _apply_keyed_delta(
+    items: Optional[List[Mapping]], delta: Mapping, get_key
+) -> List[Mapping]:
+    items_by_key = {get_key(item): item for item in items or []}
+
+    for key in delta.get("removed", []):
+        items_by_key.pop(tuple(key), None)
+
+    for item in delta.get("updated", []):
+        items_by_key[get_key(item)] = item
+
+    return list(items_by_key.values())
+
+
+def apply_delta(data: Mapping, delta: Mapping) -> Dict:
+    """
+    Apply a delta from `get_delta` to a decoded store, returning the updated store.
+    """
+    updated_data = dict(data)
+    for key, get_key in (("ANSWERS", _answer_key), ("PROGRESS", _progress_key)):
+        if key in delta:
+            updated_data[key] = _apply_keyed_delta(data.get(key), delta[key], get_key)
+
+    for key in ("METADATA", "LISTS", "RESPONSE_METADATA"):
+        if key in delta:
+            updated_data[key] = delta[key]
+
+    return updated_data
@@ -11,7 +11,7 @@ logger = get_logger()
 
 
 class SessionStore:
-    def __init__(self, user_ik, pepper, eq_session_id=None):
+    def __init__(self, user_ik, pepper, eq_session_id=None, eq_session=None):
         self.eq_session_id = eq_session_id
         self.user_id = None
         self.user_ik = user_ik
@@ -19,7 +19,7 @@ class SessionStore:
         self._eq_session = None
         self.pepper = pepper
         if eq_session_id:
-            self._load()
+            self._load(eq_session)
 
     @property
     def expiration_time(self):
@@ -80,11 +80,20 @@ class SessionStore:
             self.user_id = None
             self.session_data = None
 
-    def _load(self):
-        logger.debug(
-            "finding eq_session_id in database", eq_session_id=self.eq_session_id
-        )
-        self._eq_session = current_app.eq["storage"].get(EQSession, self.eq_session_id)
+    def _load(self, eq_session=None):
+        """
+        Load the eq_session from storage, unless it has already been read
+        :param eq_session: the eq_session if it has already been read
+        """
+        if eq_session:
+            self._eq_session = eq_session
+        else:
+            logger.debug(
+                "finding eq_session_id in database", eq_session_id=self.eq_session_id
+            )
+            self._eq_session = current_app.eq["storage"].get(
+                EQSession, self.eq_session_id
+            )
 
         if self._eq_session:
             self.user_id = self._eq_session.user_id
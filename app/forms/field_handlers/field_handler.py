@@ -66,20 +66,31 @@ class FieldHandler(ABC):
         return validators.Optional()
 
     def get_schema_value(self, schema_element):
-        if isinstance(schema_element["value"], dict):
-            if schema_element["value"]["source"] == "metadata":
-                identifier = schema_element["value"].get("identifier")
-                return self.metadata.get(identifier)
-            if schema_element["value"]["source"] == "answers":
-                schema = load_schema_from_metadata(self.metadata)
-                answer_id = schema_element["value"].get("identifier")
-                list_item_id = self.location.list_item_id if self.location else None
-
-                return get_answer_value(
-                    answer_id, self.answer_store, schema, list_item_id=list_item_id
-                )
-        return schema_element["value"]
+        return get_schema_value(
+            schema_element, self.answer_store, self.metadata, self.location
+        )
 
     @abstractmethod
     def get_field(self) -> Field:
         pass  # pragma: no cover
+
+
+def get_schema_value(
+    schema_element: dict,
+    answer_store: AnswerStore,
+    metadata: dict,
+    location: Location = None,
+):
+    if isinstance(schema_element["value"], dict):
+        if schema_element["value"]["source"] == "metadata":
+            identifier = schema_element["value"].get("identifier")
+            return metadata.get(identifier)
+        if schema_element["value"]["source"] == "answers":
+            schema = load_schema_from_metadata(metadata)
+            answer_id = schema_element["value"].get("identifier")
+            list_item_id = location.list_item_id if location else None
+
+            return get_answer_value(
+                answer_id, answer_store, schema, list_item_id=list_item_id
+            )
+    return schema_element["value"]
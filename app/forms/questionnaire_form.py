@@ -2,14 +2,19 @@ import itertools
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Hashable, Optional
 
 from dateutil.relativedelta import relativedelta
 from flask_wtf import FlaskForm
 from werkzeug.datastructures import ImmutableMultiDict, MultiDict
 from wtforms import validators
 
+from app.data_models.answer_store import AnswerStore
 from app.forms.field_handlers import DateHandler, get_field_handler
+from app.forms.field_handlers.field_handler import get_schema_value
 from app.forms.validators import DateRangeCheck, MutuallyExclusiveCheck, SumCheck
+from app.settings import EQ_FORM_CLASS_CACHE_MAX_SIZE
+from app.utilities.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -405,6 +410,15 @@ def _clear_detail_answer_field(form_data, question_schema):
     return form_data
 
 
+# Form classes are cached so the unbound fields, validators and choices of a question are built
+# once rather than on every GET and POST of its page. They are keyed by the identity of the
+# frozen answers of a question, along with everything else that affects how the fields are
+# constructed (see `_get_form_class_key`), so the answers and error messages are held in the
+# cached value alongside the form class to stop their ids from being reused.
+# {<key>: (<answers>, <error messages>, <form class>)}
+form_class_cache = LRUCache(EQ_FORM_CLASS_CACHE_MAX_SIZE)
+
+
 def generate_form(
     schema,
     question_schema,
@@ -414,13 +428,10 @@ def generate_form(
     data=None,
     form_data=None,
 ):
-    class DynamicForm(QuestionnaireForm):
-        pass
-
     if form_data:
         form_data = _clear_detail_answer_field(form_data, question_schema)
 
-    answer_fields = get_answer_fields(
+    form_class = get_form_class(
         question_schema,
         form_data if form_data is not None else data,
         schema.error_messages,
@@ -429,10 +440,7 @@ def generate_form(
         location,
     )
 
-    for answer_id, field in answer_fields.items():
-        setattr(DynamicForm, answer_id, field)
-
-    return DynamicForm(
+    return form_class(
         schema,
         question_schema,
         answer_store,
@@ -441,3 +449,88 @@ def generate_form(
         data=data,
         formdata=form_data,
     )
+
+
+def get_form_class(question, data, error_messages, answer_store, metadata, location):
+    key = _get_form_class_key(
+        question, data, error_messages, answer_store, metadata, location
+    )
+    if key is not None:
+        entry = form_class_cache.get(key)
+        if entry:
+            return entry[-1]
+
+    class DynamicForm(QuestionnaireForm):
+        pass
+
+    answer_fields = get_answer_fields(
+        question, data, error_messages, answer_store, metadata, location
+    )
+
+    for answer_id, field in answer_fields.items():
+        setattr(DynamicForm, answer_id, field)
+
+    if key is not None:
+        form_class_cache.set(key, (question["answers"], error_messages, DynamicForm))
+
+    return DynamicForm
+
+
+def _get_form_class_key(
+    question, data, error_messages, answer_store, metadata, location
+) -> Optional[Hashable]:
+    """
+    Form classes are only cached for answers taken from a frozen schema. Answers that have
+    been copied to render placeholders are new objects on every request so are never cached.
+    """
+    answers = question.get("answers")
+    if not isinstance(answers, tuple):
+        return None
+
+    detail_answers_selected = []
+    dynamic_values = []
+    for answer in answers:
+        for option in answer.get("options", []):
+            if "detail_answer" in option:
+                detail_answers_selected.append(
+                    _option_value_in_data(answer, option, data)
+                )
+                dynamic_values.extend(
+                    _get_dynamic_field_values(
+                        option["detail_answer"], answer_store, metadata, location
+                    )
+                )
+
+        dynamic_values.extend(
+            _get_dynamic_field_values(answer, answer_store, metadata, location)
+        )
+
+    key = (
+        id(answers),
+        id(error_messages),
+        str(question.get("title")),
+        tuple(detail_answers_selected),
+        tuple(dynamic_values),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _get_dynamic_field_values(answer, answer_store, metadata, location):
+    """
+    The minimum and maximum values of an answer that are resolved from answers or metadata,
+    or relative to today, when its field is constructed.
+    """
+    for key in ("minimum", "maximum"):
+        if key in answer:
+            value = answer[key].get("value")
+            if isinstance(value, dict):
+                yield get_schema_value(
+                    answer[key], answer_store or AnswerStore(), metadata or {}, location
+                )
+            elif value == "now":
+                yield datetime.utcnow().date()
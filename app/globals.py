@@ -10,13 +10,28 @@ from structlog import get_logger
 from app.authentication.user import User
 from app.data_models import QuestionnaireStore
 from app.data_models.answer_store import AnswerStore
+from app.data_models.app_models import EQSession, QuestionnaireState
 from app.data_models.session_store import SessionStore
 from app.questionnaire import QuestionnaireSchema
-from app.settings import EQ_SESSION_ID, USER_IK
+from app.settings import (
+    EQ_SESSION_ID,
+    EQ_SESSION_TIMEOUT_SECONDS,
+    EQ_STORAGE_PREFETCH_CACHE_MAX_SIZE,
+    USER_IK,
+)
 from app.storage.encrypted_questionnaire_storage import EncryptedQuestionnaireStorage
+from app.utilities.ttl_cache import TTLCache
 
 logger = get_logger()
 
+# The user_id of each eq_session seen by this process, so the questionnaire state, which is
+# keyed by user_id, can be read along with the eq_session. The user_id is kept server side as,
+# unlike the user_ik, it isn't needed by the client.
+session_user_ids = TTLCache(
+    max_size=EQ_STORAGE_PREFETCH_CACHE_MAX_SIZE,
+    ttl_seconds=EQ_SESSION_TIMEOUT_SECONDS,
+)
+
 
 def get_questionnaire_store(user_id: str, user_ik: str) -> QuestionnaireStore:
     # Sets up a single QuestionnaireStore instance per request.
@@ -25,8 +40,20 @@ def get_questionnaire_store(user_id: str, user_ik: str) -> QuestionnaireStore:
         pepper = current_app.eq["secret_store"].get_secret_by_name(
             "EQ_SERVER_SIDE_STORAGE_ENCRYPTION_USER_PEPPER"
         )
-        storage = EncryptedQuestionnaireStorage(user_id, user_ik, pepper)
-        store = g._questionnaire_store = QuestionnaireStore(storage)
+        questionnaire_state = None
+        prefetched = g.pop("_prefetched_questionnaire_state", None)
+        if prefetched and prefetched.user_id == user_id:
+            questionnaire_state = prefetched
+
+        storage = EncryptedQuestionnaireStorage(
+            user_id, user_ik, pepper, questionnaire_state=questionnaire_state
+        )
+        store = g._questionnaire_store = QuestionnaireStore(
+            storage,
+            compact_encoding_enabled=current_app.config[
+                "EQ_QUESTIONNAIRE_STATE_COMPACT_ENCODING_ENABLED"
+            ],
+        )
 
     return store
 
@@ -42,13 +69,48 @@ def get_session_store() -> Union[SessionStore, None]:
         pepper = current_app.eq["secret_store"].get_secret_by_name(
             "EQ_SERVER_SIDE_STORAGE_ENCRYPTION_USER_PEPPER"
         )
+        eq_session_id = cookie_session[EQ_SESSION_ID]
         store = g._session_store = SessionStore(
-            cookie_session[USER_IK], pepper, cookie_session[EQ_SESSION_ID]
+            cookie_session[USER_IK],
+            pepper,
+            eq_session_id,
+            eq_session=_prefetch_user_data(eq_session_id),
         )
+        if current_app.config["EQ_STORAGE_PREFETCH_ENABLED"]:
+            if store.session_data:
+                session_user_ids.set(eq_session_id, store.user_id)
+            else:
+                session_user_ids.pop(eq_session_id)
 
     return store if store.session_data else None
 
 
+def _prefetch_user_data(eq_session_id: str) -> Union[EQSession, None]:
+    """
+    Reads the eq_session and, where its user_id is known to this process, the questionnaire
+    state in a single storage round trip, rather than one after the other. The questionnaire
+    state is kept for `get_questionnaire_store` if it belongs to the same user as the eq_session.
+    """
+    if not current_app.config["EQ_STORAGE_PREFETCH_ENABLED"]:
+        return None
+
+    user_id = session_user_ids.get(eq_session_id)
+    if not user_id:
+        return None
+
+    eq_session, questionnaire_state = current_app.eq["storage"].get_many(
+        [
+            (EQSession, eq_session_id),
+            (QuestionnaireState, user_id),
+        ]
+    )
+    if eq_session and eq_session.user_id == user_id:
+        # pylint: disable=W0212
+        g._prefetched_questionnaire_state = questionnaire_state
+
+    return eq_session
+
+
 def get_session_timeout_in_seconds(schema: QuestionnaireSchema) -> int:
     """
     Gets the session timeout in seconds from the schema/env variable.
@@ -82,6 +144,8 @@ def create_session_store(
         .create(eq_session_id, user_id, session_data, expires_at)
         .save()
     )
+    if current_app.config["EQ_STORAGE_PREFETCH_ENABLED"]:
+        session_user_ids.set(eq_session_id, user_id)
 
 
 def get_metadata(user: User) -> Union[None, MappingProxyType]:
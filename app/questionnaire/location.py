@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, Optional
+from typing import ClassVar, Mapping, Optional
 
 from flask import url_for
 
+from app.utilities.strings import intern_str
+
 
 class InvalidLocationException(Exception):
     def __init__(self, value):
@@ -12,7 +14,7 @@ class InvalidLocationException(Exception):
         self.value = value
 
 
-@dataclass
+@dataclass(frozen=True, init=False)
 class Location:
     """
     Store a location in the questionnaire.
@@ -21,15 +23,39 @@ class Location:
     block_id: The id of the current block. This could be a block inside a list collector
     list_item_id: The list_item_id if this location is associated with a list
     list_name: The list name
+
+    Locations are immutable, so their hash is computed once when they are created.
     """
 
+    __slots__ = ("section_id", "block_id", "list_name", "list_item_id", "_hash")
+
     section_id: str
-    block_id: Optional[str] = None
-    list_name: Optional[str] = None
-    list_item_id: Optional[str] = None
+    block_id: Optional[str]
+    list_name: Optional[str]
+    list_item_id: Optional[str]
+    # Set on each instance by __init__, declared as a ClassVar so it is not a dataclass field
+    _hash: ClassVar[int]
+
+    def __init__(
+        self,
+        section_id: str,
+        block_id: Optional[str] = None,
+        list_name: Optional[str] = None,
+        list_item_id: Optional[str] = None,
+    ):
+        attributes = (section_id, block_id, list_name, list_item_id)
+        for name, value in zip(self.__slots__, attributes):
+            object.__setattr__(self, name, intern_str(value))
+        object.__setattr__(self, "_hash", hash(attributes))
 
     def __hash__(self):
-        return hash(frozenset(self.__dict__.values()))
+        return self._hash
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.section_id, self.block_id, self.list_name, self.list_item_id),
+        )
 
     @classmethod
     def from_dict(cls, location_dict: Mapping):
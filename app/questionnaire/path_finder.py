@@ -6,11 +6,8 @@ from app.data_models.progress_store import ProgressStore
 from app.questionnaire.location import Location
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.routing_path import RoutingPath
-from app.questionnaire.rules import (
-    evaluate_goto,
-    evaluate_skip_conditions,
-    is_goto_rule,
-)
+from app.questionnaire.routing_path_cache import RoutingPathCache
+from app.questionnaire.rules import is_goto_rule
 
 
 class PathFinder:
@@ -21,15 +18,60 @@ class PathFinder:
         list_store: ListStore,
         progress_store: ProgressStore,
         metadata: Mapping,
+        routing_path_cache: Optional[RoutingPathCache] = None,
     ):
         self.answer_store = answer_store
         self.metadata = metadata
         self.schema = schema
         self.progress_store = progress_store
         self.list_store = list_store
+        self.routing_path_cache = routing_path_cache
 
     def routing_path(
         self, section_id: str, list_item_id: Optional[str] = None
+    ) -> RoutingPath:
+        """
+        Returns the routing path for a section, reusing a cached path when none of the
+        answers, lists or metadata the section's rules depend on have changed.
+        """
+        if self.routing_path_cache is None:
+            return self._build_routing_path(section_id, list_item_id)
+
+        # The key must be taken before building the path, as building it can remove
+        # answers when routing backwards.
+        dependency_key = self._get_dependency_key(section_id)
+        routing_path = self.routing_path_cache.get(
+            section_id, list_item_id, dependency_key
+        )
+
+        if routing_path is None:
+            routing_path = self._build_routing_path(section_id, list_item_id)
+            self.routing_path_cache.set(
+                section_id, list_item_id, dependency_key, routing_path
+            )
+
+        return routing_path
+
+    def _get_dependency_key(self, section_id):
+        dependencies = self.schema.get_routing_dependencies_for_section(section_id)
+
+        return (
+            tuple(
+                self.answer_store.get_answer_version(answer_id)
+                for answer_id in dependencies.answer_ids
+            ),
+            tuple(
+                self.list_store.get_list_version(list_name)
+                for list_name in dependencies.list_names
+            ),
+            tuple(
+                self.metadata.get(metadata_key)
+                for metadata_key in dependencies.metadata_keys
+            ),
+        )
+
+    def _build_routing_path(
+        self, section_id: str, list_item_id: Optional[str] = None
     ) -> RoutingPath:
         """
         Visits all the blocks in a section and returns a path given a list of answers.
@@ -42,35 +84,64 @@ class PathFinder:
             current_location.section_id
         )
 
+        is_group_skipped = False
         for group in section["groups"]:
             if "skip_conditions" in group:
-                if evaluate_skip_conditions(
-                    group["skip_conditions"],
-                    self.schema,
-                    self.metadata,
-                    self.answer_store,
-                    self.list_store,
-                    current_location=current_location,
+                if self._evaluate_skip_conditions(
+                    group["skip_conditions"], current_location
                 ):
+                    is_group_skipped = True
                     continue
 
             blocks.extend(group["blocks"])
 
         if blocks:
+            block_positions: Mapping[str, int]
+            if is_group_skipped:
+                block_positions = {
+                    block["id"]: position for position, block in enumerate(blocks)
+                }
+            else:
+                block_positions = self.schema.get_block_positions_for_section(
+                    section_id
+                )
+
             routing_path_block_ids = self._build_routing_path_block_ids(
-                blocks, current_location
+                blocks, block_positions, current_location
             )
 
         return RoutingPath(routing_path_block_ids, section_id, list_item_id, list_name)
 
-    @staticmethod
-    def _block_index_for_block_id(blocks, block_id):
-        return next(
-            (index for (index, block) in enumerate(blocks) if block["id"] == block_id),
-            None,
+    def _evaluate_when_rules(
+        self, when_rules, current_location, routing_path_block_ids=None
+    ):
+        return self.schema.get_compiled_when_rules(when_rules).evaluate(
+            self.schema,
+            self.metadata,
+            self.answer_store,
+            self.list_store,
+            current_location=current_location,
+            routing_path_block_ids=routing_path_block_ids,
+        )
+
+    def _evaluate_skip_conditions(
+        self, skip_conditions, current_location, routing_path_block_ids=None
+    ):
+        return any(
+            self._evaluate_when_rules(
+                skip_condition["when"], current_location, routing_path_block_ids
+            )
+            for skip_condition in skip_conditions
         )
 
-    def _build_routing_path_block_ids(self, blocks, current_location):
+    def _evaluate_goto(self, goto_rule, current_location, routing_path_block_ids=None):
+        if "when" in goto_rule:
+            return self._evaluate_when_rules(
+                goto_rule["when"], current_location, routing_path_block_ids
+            )
+        return True
+
+    def _build_routing_path_block_ids(self, blocks, block_positions, current_location):
         # Keep going unless we've hit the last block
         routing_path_block_ids = []
         block_index = 0
@@ -81,13 +152,11 @@ class PathFinder:
         while block_index < len(blocks):
             block = blocks[block_index]
 
-            is_skipping = block.get("skip_conditions") and evaluate_skip_conditions(
+            is_skipping = block.get(
+                "skip_conditions"
+            ) and self._evaluate_skip_conditions(
                 block["skip_conditions"],
-                self.schema,
-                self.metadata,
-                self.answer_store,
-                self.list_store,
-                current_location=current_location,
+                current_location,
                 routing_path_block_ids=routing_path_block_ids,
             )
 
@@ -113,7 +182,7 @@ class PathFinder:
                 if routing_rules:
                     block_index = self._evaluate_routing_rules(
                         this_location,
-                        blocks,
+                        block_positions,
                         routing_rules,
                         block_index,
                         routing_path_block_ids,
@@ -131,16 +200,17 @@ class PathFinder:
             block_index = block_index + 1
 
     def _evaluate_routing_rules(
-        self, this_location, blocks, routing_rules, block_index, routing_path_block_ids
+        self,
+        this_location,
+        block_positions,
+        routing_rules,
+        block_index,
+        routing_path_block_ids,
     ):
         for rule in filter(is_goto_rule, routing_rules):
-            should_goto = evaluate_goto(
+            should_goto = self._evaluate_goto(
                 rule["goto"],
-                self.schema,
-                self.metadata,
-                self.answer_store,
-                self.list_store,
-                current_location=this_location,
+                this_location,
                 routing_path_block_ids=routing_path_block_ids,
             )
 
@@ -149,9 +219,7 @@ class PathFinder:
                     return None
 
                 next_block_id = self._get_next_block_id(rule)
-                next_block_index = PathFinder._block_index_for_block_id(
-                    blocks, next_block_id
-                )
+                next_block_index = block_positions.get(next_block_id)
                 next_precedes_current = (
                     next_block_index is not None and next_block_index < block_index
                 )
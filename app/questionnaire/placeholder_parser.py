@@ -2,8 +2,8 @@ from typing import Dict, List, Mapping, Sequence, Union
 
 from app.data_models.answer_store import AnswerStore
 from app.data_models.list_store import ListModel
-from app.questionnaire import QuestionnaireSchema
 from app.questionnaire.placeholder_transforms import PlaceholderTransforms
+from app.questionnaire.placeholder_value_cache import get_placeholder_value_cache
 
 
 class PlaceholderParser:
@@ -23,6 +23,7 @@ class PlaceholderParser:
         list_store=None,
     ):
 
+        self._language = language
         self._schema = schema
         self._answer_store = answer_store or AnswerStore()
         self._metadata = metadata
@@ -33,14 +34,48 @@ class PlaceholderParser:
         self._placeholder_map = {}
 
     def __call__(self, placeholder_list: Sequence[Mapping]) -> Mapping:
-        placeholder_list = QuestionnaireSchema.get_mutable_deepcopy(placeholder_list)
         for placeholder in placeholder_list:
             if placeholder["placeholder"] not in self._placeholder_map:
                 self._placeholder_map[
                     placeholder["placeholder"]
-                ] = self._parse_placeholder(placeholder)
+                ] = self._get_placeholder_value(placeholder)
         return self._placeholder_map
 
+    def _get_placeholder_value(self, placeholder: Mapping):
+        placeholder_value_cache = get_placeholder_value_cache()
+        if self._schema is None or placeholder_value_cache is None:
+            return self._parse_placeholder(placeholder)
+
+        answer_ids, list_names = placeholder_value_cache.get_dependencies(
+            self._schema, placeholder
+        )
+        key = (
+            id(placeholder),
+            self._language,
+            self._list_item_id,
+            getattr(self._location, "list_item_id", None),
+            getattr(self._location, "to_list_item_id", None),
+            placeholder_value_cache.reference(self._answer_store),
+            placeholder_value_cache.reference(self._list_store),
+            placeholder_value_cache.reference(self._metadata),
+            tuple(
+                self._answer_store.get_answer_version(answer_id)
+                for answer_id in answer_ids
+            ),
+            tuple(
+                self._list_store.get_list_version(list_name)
+                for list_name in list_names
+                if self._list_store is not None
+            ),
+        )
+
+        is_cached, value = placeholder_value_cache.get(key)
+        if not is_cached:
+            value = self._parse_placeholder(placeholder)
+            placeholder_value_cache.set(key, value)
+
+        return value
+
     def _resolve_value_source(self, value_source):
         if value_source["source"] == "answers":
             return self._resolve_answer_value(value_source)
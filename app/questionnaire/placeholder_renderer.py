@@ -1,10 +1,8 @@
-from jsonpointer import resolve_pointer, set_pointer
+from jsonpointer import resolve_pointer
 
 from app.data_models.answer_store import AnswerStore
-from app.questionnaire import QuestionnaireSchema
 from app.questionnaire.placeholder_parser import PlaceholderParser
 from app.questionnaire.plural_forms import get_plural_form_key
-from app.questionnaire.schema_utils import find_pointers_containing
 
 
 class PlaceholderRenderer:
@@ -55,31 +53,41 @@ class PlaceholderRenderer:
             list_store=self._list_store,
         )
 
-        placeholder_data = QuestionnaireSchema.get_mutable_deepcopy(placeholder_data)
-
         if "text_plural" in placeholder_data:
             plural_schema = placeholder_data["text_plural"]
             count = self.get_plural_count(plural_schema["count"])
 
             plural_form_key = get_plural_form_key(count, self._language)
-            placeholder_data["text"] = plural_schema["forms"][plural_form_key]
-
-        if "text" not in placeholder_data and "placeholders" not in placeholder_data:
+            text = plural_schema["forms"][plural_form_key]
+        elif "text" not in placeholder_data and "placeholders" not in placeholder_data:
             raise ValueError("No placeholder found to render")
+        else:
+            text = placeholder_data["text"]
 
         transformed_values = placeholder_parser(placeholder_data["placeholders"])
 
-        return placeholder_data["text"].format(**transformed_values)
+        return text.format(**transformed_values)
 
     def render(self, dict_to_render, list_item_id):
         """
-        Transform the current schema json to a fully rendered dictionary
-        """
-        dict_to_render = QuestionnaireSchema.get_mutable_deepcopy(dict_to_render)
-        pointers = find_pointers_containing(dict_to_render, "placeholders")
+        Transform the current schema json to a fully rendered dictionary.
 
-        for pointer in pointers:
-            rendered_text = self.render_pointer(dict_to_render, pointer, list_item_id)
-            set_pointer(dict_to_render, pointer, rendered_text)
-
-        return dict_to_render
+        Only the dicts and lists on the path to a placeholder are copied, everything
+        else is shared with `dict_to_render`, which is left unchanged.
+        """
+        rendered = dict(dict_to_render)
+        copied_ids = {id(rendered)}
+
+        for *parent_path, key in self._schema.get_placeholder_paths(dict_to_render):
+            parent = rendered
+            for part in parent_path:
+                child = parent[part]
+                if id(child) not in copied_ids:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    copied_ids.add(id(child))
+                    parent[part] = child
+                parent = child
+
+            parent[key] = self.render_placeholder(parent[key], list_item_id)
+
+        return rendered
@@ -0,0 +1,67 @@
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from flask import g, has_app_context
+
+
+class PlaceholderValueCache:
+    """
+    Holds the resolved values of placeholders for the duration of a request, so a placeholder
+    used by many renderers, e.g. a person's name on a summary or hub, is only resolved once.
+
+    Values are keyed by the identity of the placeholder definition and the stores it was
+    resolved from, along with the list item and the versions of the answers and lists it
+    depends on, so any change to those is a miss.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+        self._dependencies: Dict[int, Tuple[Tuple, Tuple]] = {}
+        # Objects keyed by identity are held for the lifetime of the cache so ids can't be reused
+        self._referenced: Dict[int, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get_dependencies(self, schema, placeholder) -> Tuple[Tuple, Tuple]:
+        """
+        The answer ids and list names a placeholder definition depends on.
+        """
+        placeholder_id = id(placeholder)
+        if placeholder_id not in self._dependencies:
+            dependencies = schema.get_dependencies(placeholder)
+            self._dependencies[placeholder_id] = (
+                tuple(dependencies["answers"]),
+                tuple(dependencies["lists"]),
+            )
+            self._referenced[placeholder_id] = placeholder
+
+        return self._dependencies[placeholder_id]
+
+    def reference(self, obj) -> int:
+        self._referenced[id(obj)] = obj
+        return id(obj)
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        if key in self._values:
+            self.hits += 1
+            return True, self._values[key]
+
+        self.misses += 1
+        return False, None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._values[key] = value
+
+
+def get_placeholder_value_cache() -> Optional[PlaceholderValueCache]:
+    # Sets up a single PlaceholderValueCache per request, or None outside of an app context
+    if not has_app_context():
+        return None
+
+    cache = g.get("_placeholder_value_cache")
+    if cache is None:
+        cache = g._placeholder_value_cache = PlaceholderValueCache()
+
+    return cache
@@ -1,13 +1,25 @@
-from collections import abc, defaultdict
+from collections import abc, defaultdict, namedtuple
 from copy import deepcopy
 from functools import cached_property
-from typing import List, Mapping, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from flask_babel import force_locale
 from werkzeug.datastructures import ImmutableDict
 
 from app.data_models.answer import Answer
 from app.forms import error_messages
+from app.questionnaire.rules import CompiledWhenRules
 from app.questionnaire.schema_utils import get_values_for_key
 
 DEFAULT_LANGUAGE_CODE = "en"
@@ -21,18 +33,72 @@ LIST_COLLECTOR_CHILDREN = [
 
 RELATIONSHIP_CHILDREN = ["UnrelatedQuestion"]
 
+NESTED_BLOCK_KEYS = (
+    "add_block",
+    "edit_block",
+    "remove_block",
+    "add_or_edit_block",
+    "unrelated_block",
+)
+
+
+class DependencyType:
+    WHEN_RULES = "when_rules"
+    VARIANTS = "variants"
+    PLACEHOLDERS = "placeholders"
+    CALCULATIONS = "calculations"
+    VALUE_SOURCES = "value_sources"
+    FOR_LIST = "for_list"
+
+
+Dependent = namedtuple("Dependent", ["section_id", "block_id", "dependency_type"])
+
+RoutingDependencies = namedtuple(
+    "RoutingDependencies", ["answer_ids", "list_names", "metadata_keys"]
+)
+
 
 class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
     def __init__(self, questionnaire_json, language_code=DEFAULT_LANGUAGE_CODE):
         self._parent_id_map = {}
-        self._list_name_to_section_map = {}
         self._language_code = language_code
         self._questionnaire_json = questionnaire_json
         self._sections_by_id = self._get_sections_by_id()
         self._groups_by_id = self._get_groups_by_id()
         self._blocks_by_id = self._get_blocks_by_id()
+        self._block_positions_by_section_id = self._get_block_positions_by_section_id()
         self._questions_by_id = self._get_questions_by_id()
         self._answers_by_id = self._get_answers_by_id()
+        self._compiled_when_rules_by_id = self._get_compiled_when_rules_by_id()
+        self._routing_dependencies_by_section_id = (
+            self._get_routing_dependencies_by_section_id()
+        )
+        self._dependents = self._get_dependents()
+        self._placeholder_paths_by_id = self._get_placeholder_paths_by_id()
+
+    def __getstate__(self):
+        # Compiled when rules and placeholder paths are keyed by object identity,
+        # which does not survive pickling
+        state = self.__dict__.copy()
+        state["_compiled_when_rules_by_id"] = tuple(
+            self._compiled_when_rules_by_id.values()
+        )
+        state["_placeholder_paths_by_id"] = tuple(
+            (node, self._placeholder_paths_by_id[id(node)])
+            for node in self._get_placeholder_render_roots()
+        )
+        return state
+
+    def __setstate__(self, state):
+        compiled_when_rules = state.pop("_compiled_when_rules_by_id")
+        placeholder_paths = state.pop("_placeholder_paths_by_id")
+        self.__dict__.update(state)
+        self._compiled_when_rules_by_id = {
+            id(compiled.when_rules): compiled for compiled in compiled_when_rules
+        }
+        self._placeholder_paths_by_id = {
+            id(node): paths for node, paths in placeholder_paths
+        }
 
     @cached_property
     def language_code(self):
@@ -109,13 +175,7 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
                     "PrimaryPersonListCollector",
                     "RelationshipCollector",
                 ):
-                    for nested_block_name in [
-                        "add_block",
-                        "edit_block",
-                        "remove_block",
-                        "add_or_edit_block",
-                        "unrelated_block",
-                    ]:
+                    for nested_block_name in NESTED_BLOCK_KEYS:
                         if block.get(nested_block_name):
                             nested_block = block[nested_block_name]
                             nested_block_id = nested_block["id"]
@@ -124,6 +184,21 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
 
         return blocks
 
+    def _get_block_positions_by_section_id(self):
+        return {
+            section_id: {
+                block["id"]: position
+                for position, block in enumerate(self.get_blocks_for_section(section))
+            }
+            for section_id, section in self._sections_by_id.items()
+        }
+
+    def get_block_positions_for_section(self, section_id: str) -> Mapping[str, int]:
+        """
+        The position of each top level block of a section within all the blocks of the section.
+        """
+        return self._block_positions_by_section_id[section_id]
+
     def _get_questions_by_id(self):
         questions_by_id = defaultdict(list)
 
@@ -156,6 +231,351 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
 
         return answers_by_id
 
+    def _get_compiled_when_rules_by_id(self):
+        """
+        Compile every `when` list in the schema once, keyed by the identity of the
+        frozen when list so lookups do not need to hash the rules themselves.
+        """
+        return {
+            id(when_rules): CompiledWhenRules(when_rules)
+            for when_rules in get_values_for_key(self.json, "when")
+        }
+
+    def get_compiled_when_rules(self, when_rules) -> CompiledWhenRules:
+        """
+        Return the precompiled form of a `when` list from this schema.
+        When rules that are not part of the frozen schema are compiled on demand.
+        """
+        try:
+            return self._compiled_when_rules_by_id[id(when_rules)]
+        except KeyError:
+            return CompiledWhenRules(when_rules)
+
+    @staticmethod
+    def _get_routing_when_rules_for_section(section):
+        for group in section["groups"]:
+            for skip_condition in group.get("skip_conditions", []):
+                yield skip_condition["when"]
+            for block in group["blocks"]:
+                for skip_condition in block.get("skip_conditions", []):
+                    yield skip_condition["when"]
+                for routing_rule in block.get("routing_rules", []):
+                    if "when" in routing_rule.get("goto", {}):
+                        yield routing_rule["goto"]["when"]
+
+    def _get_routing_dependencies_by_section_id(self):
+        routing_dependencies_by_section_id = {}
+
+        for section_id, section in self._sections_by_id.items():
+            dependencies = {field: set() for field in RoutingDependencies._fields}
+
+            for when_rules in self._get_routing_when_rules_for_section(section):
+                compiled_when_rules = self.get_compiled_when_rules(when_rules)
+                for field, values in dependencies.items():
+                    values.update(getattr(compiled_when_rules, field))
+
+            routing_dependencies_by_section_id[section_id] = RoutingDependencies(
+                **{
+                    field: tuple(sorted(values))
+                    for field, values in dependencies.items()
+                }
+            )
+
+        return routing_dependencies_by_section_id
+
+    def get_routing_dependencies_for_section(
+        self, section_id: str
+    ) -> RoutingDependencies:
+        """
+        The answer ids, list names and metadata keys that the skip conditions and
+        routing rules of a section read when building its routing path.
+        """
+        return self._routing_dependencies_by_section_id[section_id]
+
+    @staticmethod
+    def _get_value_source_dependencies(value_source, dependency_type):
+        source = value_source.get("source")
+
+        if source == "answers" and "identifier" in value_source:
+            identifiers = value_source["identifier"]
+            if isinstance(identifiers, str):
+                identifiers = [identifiers]
+            for answer_id in identifiers:
+                yield "answers", answer_id, dependency_type
+        elif source == "metadata" and "identifier" in value_source:
+            identifiers = value_source["identifier"]
+            if isinstance(identifiers, str):
+                identifiers = [identifiers]
+            for metadata_key in identifiers:
+                yield "metadata", metadata_key, dependency_type
+        elif source == "list":
+            list_name = value_source.get("identifier") or value_source.get("id")
+            if list_name:
+                yield "lists", list_name, dependency_type
+
+    def _get_when_rules_dependencies(self, when_rules, dependency_type):
+        compiled_when_rules = self.get_compiled_when_rules(when_rules)
+        for answer_id in compiled_when_rules.answer_ids:
+            yield "answers", answer_id, dependency_type
+        for list_name in compiled_when_rules.list_names:
+            yield "lists", list_name, dependency_type
+        for metadata_key in compiled_when_rules.metadata_keys:
+            yield "metadata", metadata_key, dependency_type
+
+    def _find_dependencies(
+        self,
+        data,
+        dependency_type=DependencyType.VALUE_SOURCES,
+        ignore_keys: Iterable[str] = NESTED_BLOCK_KEYS,
+    ):
+        """
+        Recursively finds the answer ids, list names and metadata keys a schema object
+        depends on, yielding tuples of (<dependency kind>, <identifier>, <dependency type>).
+        Nested list collector blocks are ignored as they are walked as blocks in their own right.
+        """
+        if isinstance(data, (list, tuple)):
+            for item in data:
+                yield from self._find_dependencies(item, dependency_type)
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        if "source" in data:
+            yield from self._get_value_source_dependencies(data, dependency_type)
+
+        for key, value in data.items():
+            if key not in ignore_keys:
+                yield from self._find_key_dependencies(key, value, dependency_type)
+
+    def _find_key_dependencies(self, key, value, dependency_type):
+        if key == "when" and isinstance(value, (list, tuple)):
+            # When rules choosing a variant only change what is displayed, not routing
+            if dependency_type != DependencyType.VARIANTS:
+                dependency_type = DependencyType.WHEN_RULES
+            yield from self._get_when_rules_dependencies(value, dependency_type)
+        elif key in ("question_variants", "content_variants"):
+            yield from self._find_dependencies(value, DependencyType.VARIANTS)
+        elif key == "for_list":
+            yield "lists", value, DependencyType.FOR_LIST
+        elif key == "answers_to_calculate":
+            for answer_id in value:
+                yield "answers", answer_id, DependencyType.CALCULATIONS
+        elif key == "placeholders":
+            yield from self._find_dependencies(value, DependencyType.PLACEHOLDERS)
+        else:
+            yield from self._find_dependencies(value, dependency_type)
+
+    def get_dependencies(self, data) -> Mapping[str, FrozenSet[str]]:
+        """
+        The answer ids, list names and metadata keys a schema object such as a placeholder
+        depends on, keyed by 'answers', 'lists' and 'metadata'.
+        """
+        dependencies: Dict[str, Set[str]] = {
+            "answers": set(),
+            "lists": set(),
+            "metadata": set(),
+        }
+        for kind, identifier, _ in self._find_dependencies(data):
+            dependencies[kind].add(identifier)
+
+        return {
+            kind: frozenset(identifiers) for kind, identifiers in dependencies.items()
+        }
+
+    def _get_dependents(self):
+        """
+        Builds the dependency graph of the schema, mapping each answer id, list name and
+        metadata key to the sections and blocks that depend on it, and how they depend on it.
+
+        Example structure:
+        {
+            'answers': {
+                'first-name': {
+                    Dependent(section_id='household', block_id='confirm-person', dependency_type='placeholders'),
+                }
+            },
+            'lists': {...},
+            'metadata': {...},
+        }
+        """
+        dependents = {
+            "answers": defaultdict(set),
+            "lists": defaultdict(set),
+            "metadata": defaultdict(set),
+        }
+
+        def add_dependents(dependencies, section_id, block_ids):
+            for kind, identifier, dependency_type in dependencies:
+                for block_id in block_ids:
+                    dependents[kind][identifier].add(
+                        Dependent(section_id, block_id, dependency_type)
+                    )
+
+        for section_id, section in self._sections_by_id.items():
+            add_dependents(
+                self._find_dependencies(section, ignore_keys={"groups"}),
+                section_id,
+                [None],
+            )
+
+            for group in section["groups"]:
+                block_ids = []
+                for block in group["blocks"]:
+                    block_ids.append(block["id"])
+                    add_dependents(
+                        self._find_dependencies(block), section_id, [block["id"]]
+                    )
+                    for nested_block_name in NESTED_BLOCK_KEYS:
+                        if nested_block := block.get(nested_block_name):
+                            add_dependents(
+                                self._find_dependencies(nested_block),
+                                section_id,
+                                [nested_block["id"]],
+                            )
+
+                add_dependents(
+                    self._find_dependencies(group, ignore_keys={"blocks"}),
+                    section_id,
+                    block_ids,
+                )
+
+        return {
+            kind: {
+                identifier: frozenset(identifier_dependents)
+                for identifier, identifier_dependents in kind_dependents.items()
+            }
+            for kind, kind_dependents in dependents.items()
+        }
+
+    @staticmethod
+    def _filter_dependents(dependents, dependency_types):
+        if dependency_types is None:
+            return dependents
+
+        return frozenset(
+            dependent
+            for dependent in dependents
+            if dependent.dependency_type in dependency_types
+        )
+
+    def get_dependents_for_answer_id(
+        self, answer_id: str, dependency_types: Optional[Iterable[str]] = None
+    ) -> FrozenSet[Dependent]:
+        """
+        The sections and blocks that depend on an answer id. A `block_id` of None means
+        the section itself depends on it, e.g. through its `enabled` rules or title.
+        """
+        return self._filter_dependents(
+            self._dependents["answers"].get(answer_id, frozenset()), dependency_types
+        )
+
+    def get_dependents_for_list(
+        self, list_name: str, dependency_types: Optional[Iterable[str]] = None
+    ) -> FrozenSet[Dependent]:
+        return self._filter_dependents(
+            self._dependents["lists"].get(list_name, frozenset()), dependency_types
+        )
+
+    def get_dependents_for_metadata_key(
+        self, metadata_key: str, dependency_types: Optional[Iterable[str]] = None
+    ) -> FrozenSet[Dependent]:
+        return self._filter_dependents(
+            self._dependents["metadata"].get(metadata_key, frozenset()),
+            dependency_types,
+        )
+
+    def get_block_ids_dependent_on_answer_id(
+        self, answer_id: str, dependency_types: Optional[Iterable[str]] = None
+    ) -> FrozenSet[str]:
+        return frozenset(
+            dependent.block_id
+            for dependent in self.get_dependents_for_answer_id(
+                answer_id, dependency_types
+            )
+            if dependent.block_id
+        )
+
+    def get_section_ids_dependent_on_answer_id(
+        self, answer_id: str, dependency_types: Optional[Iterable[str]] = None
+    ) -> FrozenSet[str]:
+        return frozenset(
+            dependent.section_id
+            for dependent in self.get_dependents_for_answer_id(
+                answer_id, dependency_types
+            )
+        )
+
+    def get_calculated_summary_block_ids_for_answer_id(
+        self, answer_id: str
+    ) -> FrozenSet[str]:
+        return frozenset(
+            block_id
+            for block_id in self.get_block_ids_dependent_on_answer_id(
+                answer_id, dependency_types={DependencyType.CALCULATIONS}
+            )
+            if self.get_block(block_id)["type"] == "CalculatedSummary"
+        )
+
+    def _get_placeholder_render_roots(self):
+        """
+        The schema objects that are passed to the placeholder renderer.
+        """
+        for section in self._sections_by_id.values():
+            yield from section.get("summary", {}).get("items", [])
+
+        for block in self._blocks_by_id.values():
+            yield block
+            for key in ("question", "content", "summary"):
+                if key in block:
+                    yield block[key]
+            for variant in block.get("question_variants", []):
+                yield variant["question"]
+            for variant in block.get("content_variants", []):
+                yield variant["content"]
+
+    def _get_placeholder_paths_by_id(self):
+        """
+        Find the paths to the placeholders within each object passed to the placeholder renderer
+        once, keyed by the identity of the frozen object, so rendering doesn't need to search them.
+        """
+        placeholder_paths_by_id = {}
+        for node in self._get_placeholder_render_roots():
+            placeholder_paths_by_id[id(node)] = self.find_placeholder_paths(
+                node, placeholder_paths_by_id
+            )
+        return placeholder_paths_by_id
+
+    @classmethod
+    def find_placeholder_paths(
+        cls, data, known_paths: Optional[Mapping] = None
+    ) -> Tuple[Tuple, ...]:
+        """
+        Paths, as tuples of keys and indexes, to each dict containing placeholders within `data`.
+        :param known_paths: already known paths for objects, keyed by identity
+        """
+        if known_paths and id(data) in known_paths:
+            return known_paths[id(data)]
+
+        items: Iterable[Tuple[Union[str, int], Any]]
+        if isinstance(data, dict):
+            if "placeholders" in data:
+                return ((),)
+            items = data.items()
+        elif isinstance(data, (list, tuple)):
+            items = enumerate(data)
+        else:
+            return ()
+
+        return tuple(
+            (key, *path)
+            for key, value in items
+            for path in cls.find_placeholder_paths(value, known_paths)
+        )
+
+    def get_placeholder_paths(self, data) -> Tuple[Tuple, ...]:
+        return self.find_placeholder_paths(data, self._placeholder_paths_by_id)
+
     def get_hub(self):
         return self.json.get("hub", {})
 
@@ -175,32 +595,24 @@ class QuestionnaireSchema:  # pylint: disable=too-many-public-methods
         return self._sections_by_id.get(section_id)
 
     def get_section_ids_dependent_on_list(self, list_name: str) -> List:
-        try:
-            return self._list_name_to_section_map[list_name]
-        except KeyError:
-            section_ids = self._section_ids_associated_to_list_name(list_name)
-            self._list_name_to_section_map[list_name] = section_ids
-            return section_ids
+        """
+        Ids of the sections with when rules that depend on the named list, in schema order.
+        """
+        section_ids = {
+            dependent.section_id
+            for dependent in self.get_dependents_for_list(
+                list_name, dependency_types={DependencyType.WHEN_RULES}
+            )
+        }
+        return [
+            section_id
+            for section_id in self._sections_by_id
+            if section_id in section_ids
+        ]
 
     def get_submission(self):
         return self.json.get("submission", {})
 
-    def _section_ids_associated_to_list_name(self, list_name: str) -> List:
-        section_ids: List = []
-
-        for section in self.get_sections():
-            ignore_keys = {"question_variants", "content_variants"}
-            when_rules = get_values_for_key(section, "when", ignore_keys)
-
-            if any(
-                rule.get("list") == list_name
-                for when_rule in when_rules
-                for rule in when_rule
-            ):
-                section_ids.append(section["id"])
-
-        return section_ids
-
     @staticmethod
     def get_blocks_for_section(section):
         return (block for group in section["groups"] for block in group["blocks"])
@@ -21,17 +21,10 @@ class QuestionnaireStoreUpdater:
         self._progress_store = self._questionnaire_store.progress_store
 
     def save(self):
-        if self.is_dirty():
-            self._questionnaire_store.save()
+        self._questionnaire_store.save()
 
     def is_dirty(self):
-        if (
-            self._answer_store.is_dirty
-            or self._list_store.is_dirty
-            or self._progress_store.is_dirty
-        ):
-            return True
-        return False
+        return self._questionnaire_store.is_dirty
 
     def update_relationships_answer(
         self,
@@ -2,11 +2,18 @@ from flask import url_for
 
 from app.questionnaire.location import Location
 from app.questionnaire.path_finder import PathFinder
-from app.questionnaire.rules import evaluate_when_rules
 
 
 class Router:
-    def __init__(self, schema, answer_store, list_store, progress_store, metadata):
+    def __init__(
+        self,
+        schema,
+        answer_store,
+        list_store,
+        progress_store,
+        metadata,
+        routing_path_cache=None,
+    ):
         self._schema = schema
         self._answer_store = answer_store
         self._list_store = list_store
@@ -19,6 +26,7 @@ class Router:
             self._list_store,
             self._progress_store,
             self._metadata,
+            routing_path_cache,
         )
 
     @property
@@ -204,12 +212,10 @@ class Router:
         return full_routing_path
 
     def _is_block_complete(self, block_id, section_id, list_item_id):
-        completed_block_ids = self._progress_store.get_completed_block_ids(
-            section_id, list_item_id
+        return self._progress_store.is_block_complete(
+            block_id, section_id, list_item_id
         )
 
-        return block_id in completed_block_ids
-
     def _get_first_incomplete_location_in_section(self, routing_path):
         for block_id in routing_path:
             block = self._schema.get_block(block_id)
@@ -285,8 +291,7 @@ class Router:
             return True
 
         for condition in section["enabled"]:
-            if evaluate_when_rules(
-                condition["when"],
+            if self._schema.get_compiled_when_rules(condition["when"]).evaluate(
                 self._schema,
                 self._metadata,
                 self._answer_store,
@@ -6,6 +6,10 @@ class RoutingPath:
         self.section_id = section_id
         self.list_item_id = list_item_id
         self.list_name = list_name
+        # The position of the first occurrence of each block_id, for constant time lookups
+        self._block_index_by_id = {}
+        for index, block_id in enumerate(self.block_ids):
+            self._block_index_by_id.setdefault(block_id, index)
 
     def __len__(self):
         return len(self.block_ids)
@@ -16,6 +20,9 @@ class RoutingPath:
     def __iter__(self):
         return iter(self.block_ids)
 
+    def __contains__(self, block_id):
+        return block_id in self._block_index_by_id
+
     def __reversed__(self):
         return reversed(self.block_ids)
 
@@ -33,5 +40,11 @@ class RoutingPath:
 
         return self.block_ids == other
 
-    def index(self, *args):
-        return self.block_ids.index(*args)
+    def index(self, block_id, *args):
+        if args:
+            return self.block_ids.index(block_id, *args)
+
+        try:
+            return self._block_index_by_id[block_id]
+        except KeyError:
+            raise ValueError(f"{block_id} is not in routing path") from None
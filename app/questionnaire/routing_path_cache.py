@@ -0,0 +1,55 @@
+from typing import Dict, Optional, Tuple
+
+from app.questionnaire.routing_path import RoutingPath
+
+SectionKey = Tuple[str, Optional[str]]
+
+
+class RoutingPathCache:
+    """
+    Holds the routing paths built for each section of a questionnaire along with the
+    versions of the answers, lists and metadata values the path was built from.
+
+    A cached routing path is only returned while those dependencies are unchanged, so
+    only sections whose dependencies have changed are recomputed. The cache belongs to a
+    single loaded QuestionnaireStore and is not persisted, so paths are only reused within
+    the request that built them.
+
+    Stores in the form:
+
+    {
+        (<section_id>, <list_item_id>): (<dependency_key>, RoutingPath)
+    }
+    """
+
+    def __init__(self) -> None:
+        self._routing_paths: Dict[SectionKey, Tuple[Tuple, RoutingPath]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._routing_paths)
+
+    def get(
+        self, section_id: str, list_item_id: Optional[str], dependency_key: Tuple
+    ) -> Optional[RoutingPath]:
+        cached = self._routing_paths.get((section_id, list_item_id))
+
+        if cached and cached[0] == dependency_key:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        section_id: str,
+        list_item_id: Optional[str],
+        dependency_key: Tuple,
+        routing_path: RoutingPath,
+    ) -> None:
+        self._routing_paths[(section_id, list_item_id)] = (dependency_key, routing_path)
+
+    def clear(self) -> None:
+        self._routing_paths.clear()
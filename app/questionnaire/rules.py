@@ -6,6 +6,9 @@ from dateutil.relativedelta import relativedelta
 
 MAX_REPEATS = 25
 
+FULL_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+YEAR_PATTERN = re.compile(r"\d{4}$")
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +55,57 @@ def evaluate_date_rule(when, answer_store, schema, metadata, answer_value):
     return evaluate_condition(condition, answer_value, match_value)
 
 
+def _answer_and_match(answer_value, match_value):
+    return answer_value is not None and match_value is not None
+
+
+COMPARISON_OPERATORS = {
+    "equals": lambda answer_value, match_value: answer_value == match_value,
+    "not equals": lambda answer_value, match_value: answer_value != match_value,
+    "equals any": lambda answer_value, match_values: answer_value in match_values,
+    "not equals any": lambda answer_value, match_values: answer_value
+    not in match_values,
+    "contains": lambda answer_values, match_value: _answer_and_match(
+        answer_values, match_value
+    )
+    and match_value in answer_values,
+    "not contains": lambda answer_values, match_value: _answer_and_match(
+        answer_values, match_value
+    )
+    and match_value not in answer_values,
+    "contains any": lambda answer_values, match_values: _answer_and_match(
+        answer_values, match_values
+    )
+    and any(match_value in answer_values for match_value in match_values),
+    "contains all": lambda answer_values, match_values: _answer_and_match(
+        answer_values, match_values
+    )
+    and all(match_value in answer_values for match_value in match_values),
+    "set": lambda answer_value, _: answer_value not in (None, []),
+    "not set": lambda answer_value, _: answer_value in (None, []),
+    "greater than": lambda answer_value, match_value: _answer_and_match(
+        answer_value, match_value
+    )
+    and answer_value > match_value,
+    "greater than or equal to": lambda answer_value, match_value: _answer_and_match(
+        answer_value, match_value
+    )
+    and answer_value >= match_value,
+    "less than": lambda answer_value, match_value: _answer_and_match(
+        answer_value, match_value
+    )
+    and answer_value < match_value,
+    "less than or equal to": lambda answer_value, match_value: _answer_and_match(
+        answer_value, match_value
+    )
+    and answer_value <= match_value,
+}
+
+CASEFOLD_CONDITIONS = frozenset(
+    {"equals", "not equals", "equals any", "not equals any"}
+)
+
+
 def evaluate_condition(condition, answer_value, match_value):
     """
     :param condition: string representation of comparison operator
@@ -59,44 +113,11 @@ def evaluate_condition(condition, answer_value, match_value):
     :param match_value: the right hand side operand in the comparison
     :return: boolean value of comparing lhs and rhs using the specified operator
     """
-    answer_and_match = answer_value is not None and match_value is not None
-
-    if condition in {"equals", "not equals", "equals any", "not equals any"}:
-
+    if condition in CASEFOLD_CONDITIONS:
         answer_value = casefold(answer_value)
+        match_value = casefold_match_value(match_value)
 
-        if isinstance(match_value, (list, tuple)):
-            match_value = list(map(casefold, match_value))
-        else:
-            match_value = casefold(match_value)
-
-    comparison_operators = {
-        "equals": lambda answer_value, match_value: answer_value == match_value,
-        "not equals": lambda answer_value, match_value: answer_value != match_value,
-        "equals any": lambda answer_value, match_values: answer_value in match_values,
-        "not equals any": lambda answer_value, match_values: answer_value
-        not in match_values,
-        "contains": lambda answer_values, match_value: answer_and_match
-        and match_value in answer_values,
-        "not contains": lambda answer_values, match_value: answer_and_match
-        and match_value not in answer_values,
-        "contains any": lambda answer_values, match_values: answer_and_match
-        and any(match_value in answer_values for match_value in match_values),
-        "contains all": lambda answer_values, match_values: answer_and_match
-        and all(match_value in answer_values for match_value in match_values),
-        "set": lambda answer_value, _: answer_value not in (None, []),
-        "not set": lambda answer_value, _: answer_value in (None, []),
-        "greater than": lambda answer_value, match_value: answer_and_match
-        and answer_value > match_value,
-        "greater than or equal to": lambda answer_value, match_value: answer_and_match
-        and answer_value >= match_value,
-        "less than": lambda answer_value, match_value: answer_and_match
-        and answer_value < match_value,
-        "less than or equal to": lambda answer_value, match_value: answer_and_match
-        and answer_value <= match_value,
-    }
-
-    match_function = comparison_operators[condition]
+    match_function = COMPARISON_OPERATORS[condition]
 
     return match_function(answer_value, match_value)
 
@@ -108,6 +129,12 @@ def casefold(value):
         return value
 
 
+def casefold_match_value(match_value):
+    if isinstance(match_value, (list, tuple)):
+        return list(map(casefold, match_value))
+    return casefold(match_value)
+
+
 def get_date_match_value(date_comparison, answer_store, schema, metadata):
     match_value = None
 
@@ -121,8 +148,10 @@ def get_date_match_value(date_comparison, answer_store, schema, metadata):
     elif "meta" in date_comparison:
         match_value = get_metadata_value(metadata, date_comparison["meta"])
 
-    match_value = convert_to_datetime(match_value)
+    return offset_date_match_value(date_comparison, convert_to_datetime(match_value))
+
 
+def offset_date_match_value(date_comparison, match_value):
     if "offset_by" in date_comparison and match_value:
         offset = date_comparison["offset_by"]
         match_value = match_value + relativedelta(
@@ -136,9 +165,9 @@ def get_date_match_value(date_comparison, answer_store, schema, metadata):
 
 def convert_to_datetime(value):
     date_format = "%Y-%m"
-    if value and re.match(r"\d{4}-\d{2}-\d{2}", value):
+    if value and FULL_DATE_PATTERN.match(value):
         date_format = "%Y-%m-%d"
-    if value and re.match(r"\d{4}$", value):
+    if value and YEAR_PATTERN.match(value):
         date_format = "%Y"
 
     return datetime.strptime(value, date_format) if value else None
@@ -246,40 +275,6 @@ def evaluate_skip_conditions(
     return False
 
 
-def _get_when_rule_value(
-    when_rule,
-    answer_store,
-    list_store,
-    schema,
-    metadata,
-    list_item_id=None,
-    routing_path_block_ids=None,
-):
-    """
-    Get the value from a when rule.
-    :raises: Exception if none of `id` or `meta` are provided.
-    :return: The value to use in a when rule
-    """
-    if "id" in when_rule:
-        value = get_answer_value(
-            when_rule["id"],
-            answer_store,
-            schema,
-            list_item_id=list_item_id,
-            routing_path_block_ids=routing_path_block_ids,
-        )
-    elif "meta" in when_rule:
-        value = get_metadata_value(metadata, when_rule["meta"])
-    elif "id_selector" in when_rule:
-        value = getattr(list_store.get(when_rule["list"]), when_rule["id_selector"])
-    elif "list" in when_rule:
-        value = get_list_count(list_store, when_rule["list"])
-    else:
-        raise Exception("The when rule is invalid")
-
-    return value
-
-
 def evaluate_when_rules(
     when_rules,
     schema,
@@ -300,38 +295,14 @@ def evaluate_when_rules(
     :param routing_path_block_ids: The routing path block ids to use when evaluating when rules
     :return: True if the when condition has been met otherwise False
     """
-    for when_rule in when_rules:
-
-        list_item_id = current_location.list_item_id if current_location else None
-
-        value = _get_when_rule_value(
-            when_rule,
-            answer_store,
-            list_store,
-            schema,
-            metadata,
-            list_item_id=list_item_id,
-            routing_path_block_ids=routing_path_block_ids,
-        )
-
-        if "date_comparison" in when_rule:
-            if not evaluate_date_rule(when_rule, answer_store, schema, metadata, value):
-                return False
-        elif "comparison" in when_rule:
-            comparison_id_value = _get_comparison_id_value(
-                when_rule,
-                answer_store,
-                schema,
-                current_location,
-                routing_path_block_ids,
-            )
-            if not evaluate_comparison_rule(when_rule, value, comparison_id_value):
-                return False
-        else:
-            if not evaluate_rule(when_rule, value):
-                return False
-
-    return True
+    return CompiledWhenRules(when_rules).evaluate(
+        schema,
+        metadata,
+        answer_store,
+        list_store,
+        current_location=current_location,
+        routing_path_block_ids=routing_path_block_ids,
+    )
 
 
 def get_answer_for_answer_id(answer_id, answer_store, schema, list_item_id):
@@ -371,3 +342,209 @@ def is_goto_rule(rule):
     return any(
         key in rule.get("goto", {}) for key in ("when", "block", "group", "section")
     )
+
+
+class CompiledWhenRule:
+    """
+    A single when rule with its operator resolved, equality match values
+    casefolded and literal comparison dates parsed, so that evaluating it
+    only needs to look up the answer, metadata or list values.
+    """
+
+    __slots__ = (
+        "rule",
+        "source",
+        "condition",
+        "match_function",
+        "match_value",
+        "date_comparison",
+        "date_match_value",
+    )
+
+    def __init__(self, when_rule):
+        self.rule = when_rule
+        self.source = next(
+            (
+                source
+                for source in ("id", "meta", "id_selector", "list")
+                if source in when_rule
+            ),
+            None,
+        )
+        self.condition = when_rule.get("condition")
+        self.match_function = COMPARISON_OPERATORS.get(self.condition)
+        self.match_value = when_rule.get("value", when_rule.get("values"))
+        if self.condition in CASEFOLD_CONDITIONS:
+            self.match_value = casefold_match_value(self.match_value)
+
+        self.date_comparison = when_rule.get("date_comparison") or {}
+        self.date_match_value = None
+        if self.date_comparison.get("value") not in (
+            None,
+            "now",
+        ):
+            self.date_match_value = offset_date_match_value(
+                self.date_comparison,
+                convert_to_datetime(self.date_comparison["value"]),
+            )
+
+    def __getstate__(self):
+        # The operator functions are looked up again on unpickling as lambdas can't be pickled
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot != "match_function"
+        }
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self.match_function = COMPARISON_OPERATORS.get(self.condition)
+
+    @property
+    def answer_ids(self):
+        answer_ids = {self.rule.get("id"), self.date_comparison.get("id")}
+        comparison = self.rule.get("comparison", {})
+        if comparison.get("source") != "location":
+            answer_ids.add(comparison.get("id"))
+        return frozenset(answer_ids - {None})
+
+    @property
+    def list_names(self):
+        return frozenset({self.rule.get("list")} - {None})
+
+    @property
+    def metadata_keys(self):
+        return frozenset(
+            {self.rule.get("meta"), self.date_comparison.get("meta")} - {None}
+        )
+
+    def get_value(
+        self,
+        schema,
+        metadata,
+        answer_store,
+        list_store,
+        list_item_id=None,
+        routing_path_block_ids=None,
+    ):
+        if self.source == "id":
+            return get_answer_value(
+                self.rule["id"],
+                answer_store,
+                schema,
+                list_item_id=list_item_id,
+                routing_path_block_ids=routing_path_block_ids,
+            )
+        if self.source == "meta":
+            return get_metadata_value(metadata, self.rule["meta"])
+        if self.source == "id_selector":
+            return getattr(list_store.get(self.rule["list"]), self.rule["id_selector"])
+        if self.source == "list":
+            return get_list_count(list_store, self.rule["list"])
+
+        raise Exception("The when rule is invalid")
+
+    def evaluate(
+        self,
+        schema,
+        metadata,
+        answer_store,
+        list_store,
+        current_location=None,
+        routing_path_block_ids=None,
+    ):
+        list_item_id = current_location.list_item_id if current_location else None
+        value = self.get_value(
+            schema,
+            metadata,
+            answer_store,
+            list_store,
+            list_item_id=list_item_id,
+            routing_path_block_ids=routing_path_block_ids,
+        )
+
+        if self.date_comparison:
+            answer_value = convert_to_datetime(value)
+            match_value = self.date_match_value or get_date_match_value(
+                self.date_comparison, answer_store, schema, metadata
+            )
+            if not answer_value or not match_value or not self.match_function:
+                return False
+
+            return self.match_function(answer_value, match_value)
+
+        if "comparison" in self.rule:
+            comparison_id_value = _get_comparison_id_value(
+                self.rule,
+                answer_store,
+                schema,
+                current_location,
+                routing_path_block_ids,
+            )
+            return evaluate_condition(self.condition, value, comparison_id_value)
+
+        if self.condition in CASEFOLD_CONDITIONS:
+            value = casefold(value)
+
+        return self.match_function(value, self.match_value)
+
+
+class CompiledWhenRules:
+    """
+    A precompiled `when` list. All rules must be satisfied for it to evaluate to True.
+    """
+
+    __slots__ = (
+        "when_rules",
+        "compiled_rules",
+        "answer_ids",
+        "list_names",
+        "metadata_keys",
+    )
+
+    def __init__(self, when_rules):
+        self.when_rules = when_rules
+        self.compiled_rules = tuple(
+            CompiledWhenRule(when_rule) for when_rule in when_rules
+        )
+        self.answer_ids = frozenset().union(
+            *(compiled_rule.answer_ids for compiled_rule in self.compiled_rules)
+        )
+        self.list_names = frozenset().union(
+            *(compiled_rule.list_names for compiled_rule in self.compiled_rules)
+        )
+        self.metadata_keys = frozenset().union(
+            *(compiled_rule.metadata_keys for compiled_rule in self.compiled_rules)
+        )
+
+    def evaluate(
+        self,
+        schema,
+        metadata,
+        answer_store,
+        list_store,
+        current_location=None,
+        routing_path_block_ids=None,
+    ):
+        """
+        Whether all of the compiled when rules are satisfied.
+        :param schema: survey schema
+        :param metadata: metadata for evaluating rules with metadata conditions
+        :param answer_store: store of answers to evaluate
+        :param list_store: store of lists to evaluate
+        :param current_location: The location to use when evaluating when rules
+        :param routing_path_block_ids: The routing path block ids to use when evaluating when rules
+        :return: True if the when condition has been met otherwise False
+        """
+        return all(
+            compiled_rule.evaluate(
+                schema,
+                metadata,
+                answer_store,
+                list_store,
+                current_location,
+                routing_path_block_ids,
+            )
+            for compiled_rule in self.compiled_rules
+        )
@@ -1,7 +1,5 @@
 from werkzeug.datastructures import ImmutableDict
 
-from app.questionnaire.rules import evaluate_when_rules
-
 
 def find_pointers_containing(input_data, search_key, pointer=None):
     """
@@ -44,8 +42,7 @@ def _choose_variant(
 
     for variant in block.get(variants_key, []):
         when_rules = variant.get("when", [])
-        if evaluate_when_rules(
-            when_rules,
+        if schema.get_compiled_when_rules(when_rules).evaluate(
             schema,
             metadata,
             answer_store,
@@ -32,7 +32,7 @@ def dump_debug():
     questionnaire_store = get_questionnaire_store(
         current_user.user_id, current_user.user_ik
     )
-    return questionnaire_store.serialize()
+    return questionnaire_store.serialize(version=1)
 
 
 @dump_blueprint.route("/dump/routing-path", methods=["GET"])
@@ -47,6 +47,7 @@ def dump_routing(schema, questionnaire_store):
         questionnaire_store.list_store,
         questionnaire_store.progress_store,
         questionnaire_store.metadata,
+        questionnaire_store.routing_path_cache,
     )
 
     response = [
@@ -73,6 +74,7 @@ def dump_submission(schema, questionnaire_store):
         questionnaire_store.list_store,
         questionnaire_store.progress_store,
         questionnaire_store.metadata,
+        questionnaire_store.routing_path_cache,
     )
 
     routing_path = router.full_routing_path()
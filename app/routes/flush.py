@@ -1,12 +1,12 @@
 import simplejson as json
-from flask import Blueprint, Response, current_app, request, session
-from sdc.crypto.decrypter import decrypt
+from flask import Blueprint, Response, current_app, session
 from sdc.crypto.encrypter import encrypt
 from structlog import get_logger
 
+from app.authentication.roles import get_token_with_role
 from app.authentication.user import User
 from app.globals import get_answer_store, get_metadata, get_questionnaire_store
-from app.keys import KEY_PURPOSE_AUTHENTICATION, KEY_PURPOSE_SUBMISSION
+from app.keys import KEY_PURPOSE_SUBMISSION
 from app.questionnaire.router import Router
 from app.submitter.converter import convert_answers
 from app.submitter.submission_failed import SubmissionFailedException
@@ -22,29 +22,18 @@ def flush_data():
     if session:
         session.clear()
 
-    encrypted_token = request.args.get("token")
+    decrypted_token = get_token_with_role("flusher")
 
-    if not encrypted_token or encrypted_token is None:
+    if not decrypted_token:
         return Response(status=403)
 
-    decrypted_token = decrypt(
-        token=encrypted_token,
-        key_store=current_app.eq["key_store"],
-        key_purpose=KEY_PURPOSE_AUTHENTICATION,
-        leeway=current_app.config["EQ_JWT_LEEWAY_IN_SECONDS"],
-    )
-
-    roles = decrypted_token.get("roles")
-
-    if roles and "flusher" in roles:
-        user = _get_user(decrypted_token["response_id"])
-        metadata = get_metadata(user)
-        if "tx_id" in metadata:
-            logger.bind(tx_id=metadata["tx_id"])
-        if _submit_data(user):
-            return Response(status=200)
-        return Response(status=404)
-    return Response(status=403)
+    user = _get_user(decrypted_token["response_id"])
+    metadata = get_metadata(user)
+    if "tx_id" in metadata:
+        logger.bind(tx_id=metadata["tx_id"])
+    if _submit_data(user):
+        return Response(status=200)
+    return Response(status=404)
 
 
 def _submit_data(user):
@@ -59,7 +48,14 @@ def _submit_data(user):
 
         schema = load_schema_from_metadata(metadata)
 
-        router = Router(schema, answer_store, list_store, progress_store, metadata)
+        router = Router(
+            schema,
+            answer_store,
+            list_store,
+            progress_store,
+            metadata,
+            questionnaire_store.routing_path_cache,
+        )
         full_routing_path = router.full_routing_path()
 
         message = json.dumps(
@@ -93,6 +89,5 @@ def _submit_data(user):
 
 def _get_user(response_id):
     id_generator = current_app.eq["id_generator"]
-    user_id = id_generator.generate_id(response_id)
-    user_ik = id_generator.generate_ik(response_id)
+    user_id, user_ik = id_generator.generate_ids_and_iks([response_id])[response_id]
     return User(user_id, user_ik)
@@ -101,6 +101,7 @@ def get_questionnaire(schema, questionnaire_store):
         questionnaire_store.list_store,
         questionnaire_store.progress_store,
         questionnaire_store.metadata,
+        questionnaire_store.routing_path_cache,
     )
 
     if not router.can_access_hub():
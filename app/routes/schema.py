@@ -1,6 +1,12 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify, request
 
-from app.utilities.schema import get_schema_list, load_schema_from_name
+from app.authentication.roles import get_token_with_role
+from app.utilities.schema import (
+    get_schema_list,
+    get_schema_path_map,
+    load_schema_from_name,
+    warm_questionnaire_schemas,
+)
 
 schema_blueprint = Blueprint("schema", __name__)
 
@@ -17,3 +23,34 @@ def get_schema_json_from_name(schema_name):
 @schema_blueprint.route("/schemas", methods=["GET"])
 def list_schemas():
     return jsonify(get_schema_list())
+
+
+@schema_blueprint.route("/schemas/warm", methods=["POST"])
+def warm_schemas():
+    """
+    Load the schemas named in the request body into this worker's cache in the background.
+    Expects a JSON body of the form {"schemas": ["census_household_gb_eng", ...]} and, as
+    with /flush, a token with the flusher role. Test schemas cannot be warmed.
+    """
+    if not get_token_with_role("flusher"):
+        return Response(status=403)
+
+    schema_names = (request.get_json(silent=True) or {}).get("schemas")
+    if (
+        not isinstance(schema_names, list)
+        or not schema_names
+        or not all(isinstance(schema_name, str) for schema_name in schema_names)
+    ):
+        return "A list of schema names is required", 400
+
+    allowed_schema_names = {
+        schema_name
+        for schemas in get_schema_path_map().values()
+        for schema_name in schemas
+    }
+    unknown_schema_names = set(schema_names) - allowed_schema_names
+    if unknown_schema_names:
+        return jsonify(unknown_schemas=sorted(unknown_schema_names)), 404
+
+    warm_questionnaire_schemas(schema_names)
+    return jsonify(schemas=schema_names), 202
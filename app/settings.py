@@ -17,6 +17,15 @@ def parse_mode(string):
     return string.upper() != "FALSE"
 
 
+def parse_optional_list(string):
+    """
+    Parse a comma separated list, where `*` means no restriction and is returned as None.
+    """
+    if string.strip() == "*":
+        return None
+    return frozenset(item.strip() for item in string.split(",") if item.strip())
+
+
 def read_file(file_name):
     if file_name and os.path.isfile(file_name):
         logger.debug("reading from file", filename=file_name)
@@ -97,19 +106,81 @@ EQ_APPLICATION_VERSION = read_file(EQ_APPLICATION_VERSION_PATH)
 EQ_SERVER_SIDE_STORAGE_USER_ID_ITERATIONS = ensure_min(
     int(os.getenv("EQ_SERVER_SIDE_STORAGE_USER_ID_ITERATIONS", "10000")), 1000
 )
+EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_MAX_SIZE = int(
+    os.getenv("EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_MAX_SIZE", "0")
+)
+EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_TTL_SECONDS = int(
+    os.getenv("EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_TTL_SECONDS", "900")
+)
+
+EQ_SCHEMA_WARMUP_NAMES = parse_optional_list(os.getenv("EQ_SCHEMA_WARMUP_NAMES", "*"))
+
+EQ_SCHEMA_URL_CACHE_MAX_SIZE = int(os.getenv("EQ_SCHEMA_URL_CACHE_MAX_SIZE", "50"))
+EQ_SCHEMA_URL_CACHE_TTL_SECONDS = int(
+    os.getenv("EQ_SCHEMA_URL_CACHE_TTL_SECONDS", "300")
+)
+EQ_SCHEMA_URL_CACHE_STALE_SECONDS = int(
+    os.getenv("EQ_SCHEMA_URL_CACHE_STALE_SECONDS", "3600")
+)
+EQ_SCHEMA_URL_POOL_SIZE = int(os.getenv("EQ_SCHEMA_URL_POOL_SIZE", "10"))
+EQ_SCHEMA_URL_TIMEOUT_SECONDS = float(os.getenv("EQ_SCHEMA_URL_TIMEOUT_SECONDS", "5"))
+
+EQ_STORAGE_AES_GCM_ENVELOPE_ENABLED = parse_mode(
+    os.getenv("EQ_STORAGE_AES_GCM_ENVELOPE_ENABLED", "False")
+)
+EQ_STORAGE_KEY_CACHE_MAX_SIZE = int(os.getenv("EQ_STORAGE_KEY_CACHE_MAX_SIZE", "1000"))
+EQ_STORAGE_KEY_CACHE_TTL_SECONDS = int(
+    os.getenv("EQ_STORAGE_KEY_CACHE_TTL_SECONDS", "900")
+)
+
+EQ_FORM_CLASS_CACHE_MAX_SIZE = int(os.getenv("EQ_FORM_CLASS_CACHE_MAX_SIZE", "1000"))
 
 EQ_STORAGE_BACKEND = os.getenv("EQ_STORAGE_BACKEND", "datastore")
+EQ_STORAGE_PREFETCH_ENABLED = parse_mode(
+    os.getenv("EQ_STORAGE_PREFETCH_ENABLED", "False")
+)
+EQ_STORAGE_PREFETCH_CACHE_MAX_SIZE = int(
+    os.getenv("EQ_STORAGE_PREFETCH_CACHE_MAX_SIZE", "10000")
+)
 EQ_DYNAMODB_ENDPOINT = os.getenv("EQ_DYNAMODB_ENDPOINT")
 EQ_DYNAMODB_MAX_RETRIES = int(os.getenv("EQ_DYNAMODB_MAX_RETRIES", "5"))
 EQ_DYNAMODB_MAX_POOL_CONNECTIONS = int(
     os.getenv("EQ_DYNAMODB_MAX_POOL_CONNECTIONS", "30")
 )
 EQ_QUESTIONNAIRE_STATE_TABLE_NAME = get_env_or_fail("EQ_QUESTIONNAIRE_STATE_TABLE_NAME")
+EQ_QUESTIONNAIRE_STATE_DELTA_TABLE_NAME = os.getenv(
+    "EQ_QUESTIONNAIRE_STATE_DELTA_TABLE_NAME",
+    f"{EQ_QUESTIONNAIRE_STATE_TABLE_NAME}-delta",
+)
+EQ_QUESTIONNAIRE_STATE_COMPACT_ENCODING_ENABLED = parse_mode(
+    os.getenv("EQ_QUESTIONNAIRE_STATE_COMPACT_ENCODING_ENABLED", "False")
+)
+EQ_QUESTIONNAIRE_STATE_DELTAS_ENABLED = parse_mode(
+    os.getenv("EQ_QUESTIONNAIRE_STATE_DELTAS_ENABLED", "False")
+)
+EQ_QUESTIONNAIRE_STATE_DELTA_COMPACTION_THRESHOLD = ensure_min(
+    int(os.getenv("EQ_QUESTIONNAIRE_STATE_DELTA_COMPACTION_THRESHOLD", "20")), 1
+)
 EQ_SESSION_TABLE_NAME = get_env_or_fail("EQ_SESSION_TABLE_NAME")
 EQ_USED_JTI_CLAIM_TABLE_NAME = get_env_or_fail("EQ_USED_JTI_CLAIM_TABLE_NAME")
 
 EQ_REDIS_HOST = get_env_or_fail("EQ_REDIS_HOST")
 EQ_REDIS_PORT = get_env_or_fail("EQ_REDIS_PORT")
+EQ_REDIS_MAX_CONNECTIONS = int(os.getenv("EQ_REDIS_MAX_CONNECTIONS", "50"))
+EQ_REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("EQ_REDIS_POOL_TIMEOUT_SECONDS", "5"))
+EQ_REDIS_SOCKET_TIMEOUT_SECONDS = float(
+    os.getenv("EQ_REDIS_SOCKET_TIMEOUT_SECONDS", "5")
+)
+EQ_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = float(
+    os.getenv("EQ_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS", "5")
+)
+EQ_REDIS_HEALTH_CHECK_INTERVAL_SECONDS = int(
+    os.getenv("EQ_REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "30")
+)
+EQ_REDIS_MAX_RETRIES = int(os.getenv("EQ_REDIS_MAX_RETRIES", "1"))
+EQ_REDIS_RETRY_BACKOFF_SECONDS = float(
+    os.getenv("EQ_REDIS_RETRY_BACKOFF_SECONDS", "0.05")
+)
 
 EQ_ENABLE_SECURE_SESSION_COOKIE = parse_mode(
     os.getenv("EQ_ENABLE_SECURE_SESSION_COOKIE", "True")
@@ -118,6 +189,17 @@ EQ_ENABLE_SECURE_SESSION_COOKIE = parse_mode(
 EQ_ENABLE_HTML_MINIFY = parse_mode(os.getenv("EQ_ENABLE_HTML_MINIFY", "True"))
 
 EQ_JWT_LEEWAY_IN_SECONDS = 120
+
+EQ_JTI_CLAIM_FILTER_ENABLED = parse_mode(
+    os.getenv("EQ_JTI_CLAIM_FILTER_ENABLED", "False")
+)
+EQ_JTI_CLAIM_FILTER_CAPACITY = int(os.getenv("EQ_JTI_CLAIM_FILTER_CAPACITY", "100000"))
+EQ_JTI_CLAIM_FILTER_ERROR_RATE = float(
+    os.getenv("EQ_JTI_CLAIM_FILTER_ERROR_RATE", "0.000000001")
+)
+EQ_JTI_CLAIM_FILTER_BUCKET_SECONDS = int(
+    os.getenv("EQ_JTI_CLAIM_FILTER_BUCKET_SECONDS", "300")
+)
 DEFAULT_LOCALE = "en_GB"
 
 USER_IK = "user_ik"
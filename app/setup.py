@@ -30,6 +30,7 @@ from app.keys import KEY_PURPOSE_SUBMISSION
 from app.publisher import LogPublisher, PubSubPublisher
 from app.secrets import SecretStore, validate_required_secrets
 from app.storage import Datastore, Dynamodb, Redis
+from app.storage.redis import InstrumentedBlockingConnectionPool
 from app.submitter import (
     GCSFeedbackSubmitter,
     GCSSubmitter,
@@ -156,6 +157,12 @@ def create_app(  # noqa: C901  pylint: disable=too-complex, too-many-statements
         application.eq["secret_store"].get_secret_by_name(
             "EQ_SERVER_SIDE_STORAGE_USER_IK_SALT"
         ),
+        cache_max_size=application.config[
+            "EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_MAX_SIZE"
+        ],
+        cache_ttl_seconds=application.config[
+            "EQ_SERVER_SIDE_STORAGE_USER_ID_CACHE_TTL_SECONDS"
+        ],
     )
 
     cache_questionnaire_schemas()
@@ -220,6 +227,7 @@ def create_app(  # noqa: C901  pylint: disable=too-complex, too-many-statements
             "response",
             status_code=response.status_code,
             session_modified=cookie_session.modified,
+            redis_pool=application.eq["ephemeral_storage"].pool_usage(),
         )
         return response
 
@@ -302,13 +310,27 @@ def setup_datastore(application):
 
 
 def setup_redis(application):
-    redis_client = redis.Redis(
+    connection_pool = InstrumentedBlockingConnectionPool(
         host=application.config["EQ_REDIS_HOST"],
         port=application.config["EQ_REDIS_PORT"],
+        max_connections=application.config["EQ_REDIS_MAX_CONNECTIONS"],
+        timeout=application.config["EQ_REDIS_POOL_TIMEOUT_SECONDS"],
+        socket_timeout=application.config["EQ_REDIS_SOCKET_TIMEOUT_SECONDS"],
+        socket_connect_timeout=application.config[
+            "EQ_REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS"
+        ],
+        health_check_interval=application.config[
+            "EQ_REDIS_HEALTH_CHECK_INTERVAL_SECONDS"
+        ],
         retry_on_timeout=True,
     )
+    redis_client = redis.Redis(connection_pool=connection_pool)
 
-    application.eq["ephemeral_storage"] = Redis(redis_client)
+    application.eq["ephemeral_storage"] = Redis(
+        redis_client,
+        max_retries=application.config["EQ_REDIS_MAX_RETRIES"],
+        retry_backoff_seconds=application.config["EQ_REDIS_RETRY_BACKOFF_SECONDS"],
+    )
 
 
 def setup_submitter(application):
@@ -427,8 +449,9 @@ def add_blueprints(application):
 
     application.register_blueprint(filter_blueprint)
 
-    from app.routes.schema import schema_blueprint
+    from app.routes.schema import schema_blueprint, warm_schemas
 
+    csrf.exempt(warm_schemas)
     application.register_blueprint(schema_blueprint)
     schema_blueprint.config = application.config.copy()
 
@@ -6,6 +6,9 @@ from .storage import StorageHandler, StorageModel
 
 logger = get_logger()
 
+# The most entities a single commit can write or delete
+BATCH_MAX_ENTITIES = 500
+
 
 class Datastore(StorageHandler):
     @Retry()
@@ -13,6 +16,18 @@ class Datastore(StorageHandler):
         if not overwrite:
             raise NotImplementedError("Unique key checking not supported")
 
+        self.client.put(self._get_entity(model))
+
+    @Retry()
+    def put_many(self, models, overwrite=True):
+        if not overwrite:
+            raise NotImplementedError("Unique key checking not supported")
+
+        entities = [self._get_entity(model) for model in models]
+        for index in range(0, len(entities), BATCH_MAX_ENTITIES):
+            self.client.put_multi(entities[index : index + BATCH_MAX_ENTITIES])
+
+    def _get_entity(self, model):
         storage_model = StorageModel(model_type=type(model))
         serialized_item = storage_model.serialize(model)
         key_value = getattr(model, storage_model.key_field)
@@ -26,7 +41,7 @@ class Datastore(StorageHandler):
         entity = Entity(key=key, exclude_from_indexes=exclude_from_indexes)
         entity.update(serialized_item)
 
-        self.client.put(entity)
+        return entity
 
     @Retry()
     def get(self, model_type, key_value):
@@ -37,10 +52,37 @@ class Datastore(StorageHandler):
         if serialized_item:
             return storage_model.deserialize(serialized_item)
 
+    @Retry()
+    def get_many(self, keys):
+        storage_models = [StorageModel(model_type=model_type) for model_type, _ in keys]
+        datastore_keys = [
+            self.client.key(storage_model.table_name, key_value)
+            for storage_model, (_, key_value) in zip(storage_models, keys)
+        ]
+
+        # get_multi doesn't return entities in the order of the keys
+        entities_by_key = {
+            entity.key: entity for entity in self.client.get_multi(datastore_keys)
+        }
+
+        return [
+            storage_model.deserialize(entities_by_key[key])
+            if key in entities_by_key
+            else None
+            for storage_model, key in zip(storage_models, datastore_keys)
+        ]
+
     @Retry()
     def delete(self, model):
+        return self.client.delete(self._get_key(model))
+
+    @Retry()
+    def delete_many(self, models):
+        keys = [self._get_key(model) for model in models]
+        for index in range(0, len(keys), BATCH_MAX_ENTITIES):
+            self.client.delete_multi(keys[index : index + BATCH_MAX_ENTITIES])
+
+    def _get_key(self, model):
         storage_model = StorageModel(model_type=type(model))
         key_value = getattr(model, storage_model.key_field)
-        key = self.client.key(storage_model.table_name, key_value)
-
-        return self.client.delete(key)
+        return self.client.key(storage_model.table_name, key_value)
@@ -1,9 +1,14 @@
+from contextlib import ExitStack, contextmanager
+
 from botocore.exceptions import ClientError
 
 from app.storage.errors import ItemAlreadyExistsError
 
 from .storage import StorageHandler, StorageModel
 
+# The most keys a single BatchGetItem request can read
+BATCH_GET_MAX_KEYS = 100
+
 
 class Dynamodb(StorageHandler):
     def put(self, model, overwrite=True):
@@ -27,6 +32,19 @@ class Dynamodb(StorageHandler):
 
             raise  # pragma: no cover
 
+    def put_many(self, models, overwrite=True):
+        if not overwrite:
+            # Batch writes can't be conditional
+            super().put_many(models, overwrite)
+            return
+
+        with self._batch_writers() as get_batch_writer:
+            for model in models:
+                storage_model = StorageModel(model_type=type(model))
+                get_batch_writer(storage_model).put_item(
+                    Item=storage_model.serialize(model)
+                )
+
     def get(self, model_type, key_value):
         storage_model = StorageModel(model_type=model_type)
         table = self.client.Table(storage_model.table_name)
@@ -38,6 +56,61 @@ class Dynamodb(StorageHandler):
         if serialized_item:
             return storage_model.deserialize(serialized_item)
 
+    def get_many(self, keys):
+        storage_models = [StorageModel(model_type=model_type) for model_type, _ in keys]
+        key_fields = {
+            storage_model.table_name: storage_model.key_field
+            for storage_model in storage_models
+        }
+        table_keys = list(
+            dict.fromkeys(
+                (storage_model.table_name, key_value)
+                for storage_model, (_, key_value) in zip(storage_models, keys)
+            )
+        )
+
+        serialized_items = {}
+        for index in range(0, len(table_keys), BATCH_GET_MAX_KEYS):
+            serialized_items.update(
+                self._batch_get_items(
+                    table_keys[index : index + BATCH_GET_MAX_KEYS], key_fields
+                )
+            )
+
+        models = []
+        for storage_model, (_, key_value) in zip(storage_models, keys):
+            serialized_item = serialized_items.get(
+                (storage_model.table_name, key_value)
+            )
+            models.append(
+                storage_model.deserialize(serialized_item) if serialized_item else None
+            )
+        return models
+
+    def _batch_get_items(self, table_keys, key_fields):
+        """
+        Reads up to BATCH_GET_MAX_KEYS items, retrying any keys left unprocessed.
+
+        :param table_keys: (<table name>, <key value>) pairs
+        :param key_fields: {<table name>: <key field>}
+        :return: {(<table name>, <key value>): <serialized item>} for the items found
+        """
+        request_items = {}
+        for table_name, key_value in table_keys:
+            request_items.setdefault(table_name, {"Keys": [], "ConsistentRead": True})[
+                "Keys"
+            ].append({key_fields[table_name]: key_value})
+
+        serialized_items = {}
+        while request_items:
+            response = self.client.batch_get_item(RequestItems=request_items)
+            for table_name, items in response["Responses"].items():
+                for item in items:
+                    serialized_items[table_name, item[key_fields[table_name]]] = item
+            request_items = response.get("UnprocessedKeys")
+
+        return serialized_items
+
     def delete(self, model):
         storage_model = StorageModel(model_type=type(model))
         table = self.client.Table(storage_model.table_name)
@@ -47,3 +120,35 @@ class Dynamodb(StorageHandler):
         response = table.delete_item(Key=key)
         item = response.get("Item")
         return item
+
+    def delete_many(self, models):
+        with self._batch_writers() as get_batch_writer:
+            for model in models:
+                storage_model = StorageModel(model_type=type(model))
+                key_value = getattr(model, storage_model.key_field)
+                get_batch_writer(storage_model).delete_item(
+                    Key={storage_model.key_field: key_value}
+                )
+
+    @contextmanager
+    def _batch_writers(self):
+        """
+        Yields a function returning the batch writer for a storage model's table, which
+        buffers writes into BatchWriteItem requests and retries unprocessed items.
+        All writers are flushed on exit.
+        """
+        with ExitStack() as stack:
+            batch_writers = {}
+
+            def get_batch_writer(storage_model):
+                table_name = storage_model.table_name
+                if table_name not in batch_writers:
+                    # A batch can't write the same key twice, so only the last write is kept
+                    batch_writers[table_name] = stack.enter_context(
+                        self.client.Table(table_name).batch_writer(
+                            overwrite_by_pkeys=[storage_model.key_field]
+                        )
+                    )
+                return batch_writers[table_name]
+
+            yield get_batch_writer
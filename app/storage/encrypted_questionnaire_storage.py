@@ -1,27 +1,69 @@
+from hashlib import sha256
+from uuid import uuid4
+
+import simplejson as json
 import snappy
 from flask import current_app
 from structlog import get_logger
 
-from app.data_models import QuestionnaireStore
-from app.data_models.app_models import QuestionnaireState
+from app.data_models import QuestionnaireStore, questionnaire_store_codec
+from app.data_models.app_models import QuestionnaireState, QuestionnaireStateDelta
 from app.storage.storage_encryption import StorageEncryption
 
 logger = get_logger()
 
 
 class EncryptedQuestionnaireStorage:
-    def __init__(self, user_id, user_ik, pepper):
+    """
+    Stores questionnaire data encrypted and compressed, either as a single snapshot which is
+    rewritten on every save, or when deltas are enabled, as a snapshot followed by delta records
+    of the changes made since the snapshot was written.
+
+    Delta records are keyed by `<user_id>:<delta_key>:<sequence>`. The snapshot holds the
+    `delta_key` and the sequence of the last delta it includes, so deltas are read by sequence
+    from the one after that until one is missing. Once there are
+    `EQ_QUESTIONNAIRE_STATE_DELTA_COMPACTION_THRESHOLD` deltas they are compacted into a new snapshot.
+    """
+
+    def __init__(
+        self, user_id, user_ik, pepper, deltas_enabled=None, questionnaire_state=None
+    ):
         self._user_id = user_id
+        # The questionnaire state if it has already been read, used by the first read only
+        self._prefetched_questionnaire_state = questionnaire_state
         self.encrypter = StorageEncryption(user_id, user_ik, pepper)
+        # Hash of the data last read from or written to storage, used to skip writing unchanged data
+        self._data_hash = None
 
-    def save(self, data):
-        compressed_data = snappy.compress(data)
-        encrypted_data = self.encrypter.encrypt_data(compressed_data)
-        questionnaire_state = QuestionnaireState(
-            self._user_id, encrypted_data, QuestionnaireStore.LATEST_VERSION
-        )
+        if deltas_enabled is None:
+            deltas_enabled = current_app.config["EQ_QUESTIONNAIRE_STATE_DELTAS_ENABLED"]
+        self._deltas_enabled = deltas_enabled
+        # The decoded data last read from or written to storage, which deltas are taken against
+        self._data = None
+        self._delta_key = None
+        self._snapshot_sequence = 0
+        self._delta_sequence = 0
 
-        current_app.eq["storage"].put(questionnaire_state)
+    def save(self, data, version=QuestionnaireStore.VERBOSE_VERSION):
+        data_hash = self._get_data_hash(data)
+        if data_hash == self._data_hash:
+            logger.debug("questionnaire data unchanged, skipping save")
+            return
+
+        if self._deltas_enabled:
+            self._save_with_deltas(data, version)
+        else:
+            self._put_snapshot(data, version)
+            if self._delta_key:
+                # Deltas written while they were enabled are now included in the snapshot
+                self._delete_deltas(
+                    self._delta_key, self._snapshot_sequence, self._delta_sequence
+                )
+                self._data = None
+                self._delta_key = None
+                self._snapshot_sequence = self._delta_sequence = 0
+
+        self._data_hash = data_hash
 
     def get_user_data(self):
         questionnaire_state = self._find_questionnaire_state()
@@ -30,20 +72,177 @@ class EncryptedQuestionnaireStorage:
             decrypted_data = self._get_snappy_compressed_data(
                 questionnaire_state.state_data
             )
+            # Deltas are always read, so none are lost when writing them is turned off
+            if self._deltas_enabled or questionnaire_state.delta_key:
+                return self._get_user_data_with_deltas(
+                    questionnaire_state, decrypted_data
+                )
+
+            self._data_hash = self._get_data_hash(decrypted_data)
             return decrypted_data, version
 
         return None, None
 
     def delete(self):
         logger.debug("deleting users data", user_id=self._user_id)
-        questionnaire_state = self._find_questionnaire_state()
-        if questionnaire_state:
-            current_app.eq["storage"].delete(questionnaire_state)
+        # Deleted by key, so the state isn't read again. Deltas are known once it has been read
+        models = [QuestionnaireState(self._user_id, None, None)]
+        if self._delta_key:
+            models.extend(
+                self._get_delta_models(
+                    self._delta_key, self._snapshot_sequence, self._delta_sequence
+                )
+            )
+        current_app.eq["storage"].delete_many(models)
+
+        self._data_hash = None
+        self._data = None
+        self._delta_key = None
+        self._snapshot_sequence = self._delta_sequence = 0
+
+    def _put_snapshot(self, data, version, delta_key=None, delta_sequence=0):
+        compressed_data = snappy.compress(data)
+        encrypted_data = self.encrypter.encrypt_data(compressed_data)
+        questionnaire_state = QuestionnaireState(
+            self._user_id,
+            encrypted_data,
+            version,
+            delta_key=delta_key,
+            delta_sequence=delta_sequence,
+        )
+
+        current_app.eq["storage"].put(questionnaire_state)
+
+    def _save_with_deltas(self, data, version):
+        decoded_data = self._decode(data, version)
+
+        if self._data is None:
+            # Nothing to take a delta against yet
+            self._delta_key = self._delta_key or uuid4().hex
+            self._put_snapshot(data, version, self._delta_key, self._delta_sequence)
+            self._snapshot_sequence = self._delta_sequence
+            self._data = decoded_data
+            return
+
+        delta = questionnaire_store_codec.get_delta(self._data, decoded_data)
+        if not delta:
+            return
+
+        delta_count = self._delta_sequence - self._snapshot_sequence
+        if (
+            delta_count
+            >= current_app.config["EQ_QUESTIONNAIRE_STATE_DELTA_COMPACTION_THRESHOLD"]
+        ):
+            self._compact(data, version)
+        else:
+            sequence = self._delta_sequence + 1
+            compressed_delta = snappy.compress(json.dumps(delta, for_json=True))
+            current_app.eq["storage"].put(
+                QuestionnaireStateDelta(
+                    self._get_delta_id(self._delta_key, sequence),
+                    self.encrypter.encrypt_data(compressed_delta),
+                )
+            )
+            self._delta_sequence = sequence
+
+        self._data = decoded_data
+
+    def _compact(self, data, version):
+        logger.debug(
+            "compacting questionnaire data",
+            user_id=self._user_id,
+            delta_count=self._delta_sequence - self._snapshot_sequence,
+        )
+        self._put_snapshot(data, version, self._delta_key, self._delta_sequence)
+
+        # Deltas included in the snapshot are never read again, so failing to delete them is not fatal
+        self._delete_deltas(
+            self._delta_key, self._snapshot_sequence, self._delta_sequence
+        )
+        self._snapshot_sequence = self._delta_sequence
+
+    def _get_user_data_with_deltas(self, questionnaire_state, decrypted_data):
+        version = questionnaire_state.version
+        self._delta_key = questionnaire_state.delta_key
+        self._snapshot_sequence = self._delta_sequence = (
+            questionnaire_state.delta_sequence or 0
+        )
+
+        if not self._delta_key:
+            # Written before deltas were enabled, so the next save writes a snapshot
+            return decrypted_data, version
+
+        data = self._decode(decrypted_data, version)
+        has_deltas = False
+        while delta := self._get_delta(self._delta_sequence + 1):
+            data = questionnaire_store_codec.apply_delta(data, delta)
+            self._delta_sequence += 1
+            has_deltas = True
+
+        self._data = data
+
+        if not has_deltas:
+            self._data_hash = self._get_data_hash(decrypted_data)
+            return decrypted_data, version
+
+        # Merged data is returned in the verbose version 1 format
+        return json.dumps(data, for_json=True), QuestionnaireStore.VERBOSE_VERSION
+
+    def _get_delta(self, sequence):
+        questionnaire_state_delta = current_app.eq["storage"].get(
+            QuestionnaireStateDelta, self._get_delta_id(self._delta_key, sequence)
+        )
+        if questionnaire_state_delta and questionnaire_state_delta.state_data:
+            return json.loads(
+                self._get_snappy_compressed_data(questionnaire_state_delta.state_data),
+                use_decimal=True,
+            )
+
+    def _delete_deltas(self, delta_key, from_sequence, to_sequence):
+        try:
+            current_app.eq["storage"].delete_many(
+                self._get_delta_models(delta_key, from_sequence, to_sequence)
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "failed to delete questionnaire data deltas",
+                user_id=self._user_id,
+                from_sequence=from_sequence,
+                to_sequence=to_sequence,
+            )
+
+    def _get_delta_models(self, delta_key, from_sequence, to_sequence):
+        return [
+            QuestionnaireStateDelta(self._get_delta_id(delta_key, sequence), None)
+            for sequence in range(from_sequence + 1, to_sequence + 1)
+        ]
+
+    def _get_delta_id(self, delta_key, sequence):
+        return f"{self._user_id}:{delta_key}:{sequence}"
 
     def _find_questionnaire_state(self):
+        if self._prefetched_questionnaire_state:
+            questionnaire_state = self._prefetched_questionnaire_state
+            self._prefetched_questionnaire_state = None
+            return questionnaire_state
+
         logger.debug("getting questionnaire data", user_id=self._user_id)
         return current_app.eq["storage"].get(QuestionnaireState, self._user_id)
 
+    @staticmethod
+    def _decode(data, version):
+        # Deltas are taken against data in the verbose version 1 format
+        decoded_data = json.loads(data, use_decimal=True)
+        if version and version >= 2:
+            return questionnaire_store_codec.decode(decoded_data)
+        return decoded_data
+
+    @staticmethod
+    def _get_data_hash(data):
+        if isinstance(data, str):
+            data = data.encode()
+        return sha256(data).digest()
+
     def _get_snappy_compressed_data(self, data):
         decrypted_data = self.encrypter.decrypt_data(data)
         return snappy.uncompress(decrypted_data).decode()
@@ -1,7 +1,12 @@
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from queue import Empty
 
 import simplejson as json
 from dateutil.tz import tzutc
+from redis import BlockingConnectionPool
 from redis.exceptions import ConnectionError as RedisConnectionError
 from structlog import get_logger
 
@@ -12,12 +17,162 @@ from .storage import StorageHandler, StorageModel
 logger = get_logger()
 
 
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """
+    A connection pool which waits up to `timeout` seconds for a connection when all
+    `max_connections` are in use, rather than failing straight away, and counts its usage.
+    Its usage is logged whenever no connection becomes available within the timeout.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Connections handed out and not yet released
+        self._in_use_connections = set()
+        self.peak_in_use_connections = 0
+        self.exhausted_count = 0
+        super().__init__(*args, **kwargs)
+
+    def reset(self):
+        super().reset()
+        self._in_use_connections = set()
+        self.peak_in_use_connections = 0
+        self.exhausted_count = 0
+
+    def get_connection(self, command_name, *keys, **options):
+        try:
+            connection = super().get_connection(command_name, *keys, **options)
+        except RedisConnectionError as error:
+            # Only a timeout waiting on the pool means it is exhausted, rather than a failure
+            # to connect to Redis
+            if isinstance(error.__context__, Empty):
+                self.exhausted_count += 1
+                logger.warning("redis connection pool exhausted", **self.usage())
+            raise
+
+        self._in_use_connections.add(connection)
+        self.peak_in_use_connections = max(
+            self.peak_in_use_connections, len(self._in_use_connections)
+        )
+        return connection
+
+    def release(self, connection):
+        # Connections which failed to connect are released without having been handed out
+        self._in_use_connections.discard(connection)
+        super().release(connection)
+
+    def usage(self):
+        return {
+            "max_connections": self.max_connections,
+            "in_use_connections": len(self._in_use_connections),
+            "peak_in_use_connections": self.peak_in_use_connections,
+            "exhausted_count": self.exhausted_count,
+        }
+
+
 class Redis(StorageHandler):
+    def __init__(self, client, max_retries=1, retry_backoff_seconds=0):
+        super().__init__(client)
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        # Puts buffered by `pipelined`, per thread, or per greenlet once gevent has patched
+        # threading
+        self._local = threading.local()
+
     @staticmethod
     def log_retry(command):
         logger.info("retrying redis command", command=command)
 
+    def _execute(self, command, execute):
+        """
+        Run a command, retrying on connection errors up to `max_retries` times,
+        waiting `retry_backoff_seconds` before the first retry and doubling each time.
+        """
+        for attempt in range(self._max_retries + 1):
+            try:
+                return execute()
+            except RedisConnectionError:
+                if attempt == self._max_retries:
+                    raise
+                self.log_retry(command)
+                if self._retry_backoff_seconds:
+                    time.sleep(self._retry_backoff_seconds * 2 ** attempt)
+
+    def pool_usage(self):
+        """
+        Usage of the client's connection pool, where it is instrumented.
+        """
+        connection_pool = self.client.connection_pool
+        if isinstance(connection_pool, InstrumentedBlockingConnectionPool):
+            return connection_pool.usage()
+        return {}
+
+    @contextmanager
+    def pipelined(self):
+        """
+        Buffer the puts made within the block and write them in a single pipeline on exit.
+        ItemAlreadyExistsError is raised on exit if a put without overwrite fails.
+        """
+        if getattr(self._local, "pending_puts", None) is not None:
+            # Already pipelined, the outermost block writes the puts
+            yield
+            return
+
+        self._local.pending_puts = []
+        try:
+            yield
+            pending_puts = self._local.pending_puts
+        finally:
+            self._local.pending_puts = None
+
+        self._set_many(pending_puts)
+
     def put(self, model, overwrite=True):
+        item = (*self._get_item(model), overwrite)
+
+        pending_puts = getattr(self._local, "pending_puts", None)
+        if pending_puts is not None:
+            pending_puts.append(item)
+            return
+
+        key_value, value, expires_in, _ = item
+        record_created = self._execute(
+            "set",
+            lambda: self.client.set(
+                name=key_value, value=value, ex=expires_in, nx=not overwrite
+            ),
+        )
+
+        if not record_created:
+            raise ItemAlreadyExistsError()
+
+    def put_many(self, models, overwrite=True):
+        items = [(*self._get_item(model), overwrite) for model in models]
+
+        pending_puts = getattr(self._local, "pending_puts", None)
+        if pending_puts is not None:
+            pending_puts.extend(items)
+            return
+
+        self._set_many(items)
+
+    def _set_many(self, items):
+        if not items:
+            return
+
+        def execute():
+            pipeline = self.client.pipeline(transaction=False)
+            for key_value, value, expires_in, overwrite in items:
+                pipeline.set(
+                    name=key_value, value=value, ex=expires_in, nx=not overwrite
+                )
+            return pipeline.execute()
+
+        records_created = self._execute("set", execute)
+
+        if not all(records_created):
+            raise ItemAlreadyExistsError()
+
+    @staticmethod
+    def _get_item(model):
         storage_model = StorageModel(model_type=type(model))
         serialized_item = storage_model.serialize(model)
         serialized_item.pop(storage_model.key_field)
@@ -35,27 +190,28 @@ class Redis(StorageHandler):
             expiry_at = getattr(model, storage_model.expiry_field)
             expires_in = expiry_at - datetime.now(tz=tzutc())
 
-        try:
-            record_created = self.client.set(
-                name=key_value, value=value, ex=expires_in, nx=not overwrite
-            )
-        except RedisConnectionError:
-            self.log_retry("set")
-            record_created = self.client.set(
-                name=key_value, value=value, ex=expires_in, nx=not overwrite
-            )
-
-        if not record_created:
-            raise ItemAlreadyExistsError()
+        return key_value, value, expires_in
 
     def get(self, model_type, key_value):
         storage_model = StorageModel(model_type=model_type)
-        try:
-            item = self.client.get(key_value)
-        except RedisConnectionError:
-            self.log_retry("get")
-            item = self.client.get(key_value)
+        item = self._execute("get", lambda: self.client.get(key_value))
+
+        return self._deserialize_item(storage_model, key_value, item)
+
+    def get_many(self, keys):
+        if not keys:
+            return []
+
+        key_values = [key_value for _, key_value in keys]
+        items = self._execute("mget", lambda: self.client.mget(key_values))
 
+        return [
+            self._deserialize_item(StorageModel(model_type=model_type), key_value, item)
+            for (model_type, key_value), item in zip(keys, items)
+        ]
+
+    @staticmethod
+    def _deserialize_item(storage_model, key_value, item):
         if item:
             item_dict = json.loads(item.decode("utf-8"))
             item_dict[storage_model.key_field] = key_value
@@ -66,8 +222,14 @@ class Redis(StorageHandler):
         storage_model = StorageModel(model_type=type(model))
         key_value = getattr(model, storage_model.key_field)
 
-        try:
-            return self.client.delete(key_value)
-        except RedisConnectionError:
-            self.log_retry("delete")
-            return self.client.delete(key_value)
+        return self._execute("delete", lambda: self.client.delete(key_value))
+
+    def delete_many(self, models):
+        key_values = [
+            getattr(model, StorageModel(model_type=type(model)).key_field)
+            for model in models
+        ]
+        if not key_values:
+            return 0
+
+        return self._execute("delete", lambda: self.client.delete(*key_values))
@@ -13,6 +13,11 @@ class StorageModel:
             "table_name_key": "EQ_QUESTIONNAIRE_STATE_TABLE_NAME",
             "schema": app_models.QuestionnaireStateSchema,
         },
+        app_models.QuestionnaireStateDelta: {
+            "key_field": "delta_id",
+            "table_name_key": "EQ_QUESTIONNAIRE_STATE_DELTA_TABLE_NAME",
+            "schema": app_models.QuestionnaireStateDeltaSchema,
+        },
         app_models.EQSession: {
             "key_field": "eq_session_id",
             "expiry_field": "expires_at",
@@ -75,3 +80,29 @@ class StorageHandler(ABC):
     @abstractmethod
     def delete(self, model):
         pass  # pragma: no cover
+
+    def get_many(self, keys):
+        """
+        Get several items, which can be of different model types, in as few round trips as
+        the backend supports. Backends override this with their native multi-get.
+
+        :param keys: (<model_type>, <key_value>) pairs
+        :return: the items in the order of `keys`, with None for any not found
+        """
+        return [self.get(model_type, key_value) for model_type, key_value in keys]
+
+    def put_many(self, models, overwrite=True):
+        """
+        Put several models, which can be of different model types, in as few round trips as
+        the backend supports. Backends override this with their native batch write.
+        """
+        for model in models:
+            self.put(model, overwrite)
+
+    def delete_many(self, models):
+        """
+        Delete several models, which can be of different model types, in as few round trips
+        as the backend supports. Backends override this with their native batch delete.
+        """
+        for model in models:
+            self.delete(model)
@@ -1,17 +1,64 @@
 import hashlib
+import os
+from base64 import b64decode, b64encode
+from collections import namedtuple
 
 import simplejson as json
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from jwcrypto import jwe, jwk
 from jwcrypto.common import base64url_encode
 from structlog import get_logger
 
+from app.settings import (
+    EQ_STORAGE_AES_GCM_ENVELOPE_ENABLED,
+    EQ_STORAGE_KEY_CACHE_MAX_SIZE,
+    EQ_STORAGE_KEY_CACHE_TTL_SECONDS,
+)
 from app.utilities.strings import to_bytes, to_str
+from app.utilities.ttl_cache import TTLCache
 
 logger = get_logger()
 
+StorageKeys = namedtuple("StorageKeys", ["jwk", "aes_gcm"])
+
+AES_GCM_ENVELOPE_VERSION = b"\x01"
+AES_GCM_NONCE_LENGTH = 12
+
+
+# Storage keys are cached so a key is derived once rather than every time session or
+# questionnaire data is read or written
+storage_key_cache = TTLCache(
+    max_size=EQ_STORAGE_KEY_CACHE_MAX_SIZE,
+    ttl_seconds=EQ_STORAGE_KEY_CACHE_TTL_SECONDS,
+)
+
+
+def _get_storage_key_cache_key(user_id, user_ik, pepper) -> bytes:
+    """
+    A hash of the user_id, user_ik and pepper, which is separate from the key derivation,
+    so the user_ik is never held by the cache.
+    """
+    return hashlib.sha256(
+        b"\0".join(
+            to_str(value).encode("utf-8") for value in (user_id, user_ik, pepper)
+        )
+    ).digest()
+
 
 class StorageEncryption:
-    def __init__(self, user_id, user_ik, pepper):
+    """
+    Encrypts data for storage with a key derived from the user_id, user_ik and pepper.
+
+    Data is written either as a compact JWE, or when `use_aes_gcm_envelope` is set, as a
+    lighter envelope of base64 encoded bytes:
+
+        <version byte 0x01><12 byte nonce><AES-256-GCM ciphertext and tag>
+
+    which avoids building JWE objects and encoding and parsing JSON headers. Both formats are
+    always decrypted, as a compact JWE contains `.` which base64 never does.
+    """
+
+    def __init__(self, user_id, user_ik, pepper, use_aes_gcm_envelope=None):
         if not user_id:
             raise ValueError("user_id not provided")
         if not user_ik:
@@ -19,26 +66,49 @@ class StorageEncryption:
         if not pepper:
             raise ValueError("pepper not provided")
 
-        self.key = self._generate_key(user_id, user_ik, pepper)
+        if use_aes_gcm_envelope is None:
+            use_aes_gcm_envelope = EQ_STORAGE_AES_GCM_ENVELOPE_ENABLED
+        self._use_aes_gcm_envelope = use_aes_gcm_envelope
+
+        keys = storage_key_cache.get_or_set(
+            _get_storage_key_cache_key(user_id, user_ik, pepper),
+            lambda: self._generate_keys(user_id, user_ik, pepper),
+        )
+        self.key = keys.jwk
+        self._aes_gcm = keys.aes_gcm
 
     @staticmethod
-    def _generate_key(user_id, user_ik, pepper):
+    def _generate_cek(user_id, user_ik, pepper):
         sha256 = hashlib.sha256()
         sha256.update(to_str(user_id).encode("utf-8"))
         sha256.update(to_str(user_ik).encode("utf-8"))
         sha256.update(to_str(pepper).encode("utf-8"))
 
         # we only need the first 32 characters for the CEK
-        cek = to_bytes(sha256.hexdigest()[:32])
+        return to_bytes(sha256.hexdigest()[:32])
+
+    @classmethod
+    def _generate_key(cls, user_id, user_ik, pepper):
+        cek = cls._generate_cek(user_id, user_ik, pepper)
 
         password = {"kty": "oct", "k": base64url_encode(cek)}
 
         return jwk.JWK(**password)
 
+    @classmethod
+    def _generate_keys(cls, user_id, user_ik, pepper):
+        return StorageKeys(
+            jwk=cls._generate_key(user_id, user_ik, pepper),
+            aes_gcm=AESGCM(cls._generate_cek(user_id, user_ik, pepper)),
+        )
+
     def encrypt_data(self, data):
         if isinstance(data, dict):
             data = json.dumps(data, for_json=True)
 
+        if self._use_aes_gcm_envelope:
+            return self._encrypt_aes_gcm_envelope(to_bytes(data))
+
         protected_header = {"alg": "dir", "enc": "A256GCM", "kid": "1,1"}
 
         jwe_token = jwe.JWE(
@@ -48,7 +118,27 @@ class StorageEncryption:
         return jwe_token.serialize(compact=True)
 
     def decrypt_data(self, encrypted_token):
+        if "." not in encrypted_token:
+            return self._decrypt_aes_gcm_envelope(encrypted_token)
+
         jwe_token = jwe.JWE(algs=["dir", "A256GCM"])
         jwe_token.deserialize(encrypted_token, self.key)
 
         return jwe_token.payload
+
+    def _encrypt_aes_gcm_envelope(self, data: bytes) -> str:
+        nonce = os.urandom(AES_GCM_NONCE_LENGTH)
+        ciphertext = self._aes_gcm.encrypt(nonce, data, AES_GCM_ENVELOPE_VERSION)
+
+        return b64encode(AES_GCM_ENVELOPE_VERSION + nonce + ciphertext).decode()
+
+    def _decrypt_aes_gcm_envelope(self, encrypted_token: str) -> bytes:
+        envelope = b64decode(encrypted_token)
+        version = envelope[:1]
+        if version != AES_GCM_ENVELOPE_VERSION:
+            raise ValueError(f"Unsupported storage envelope version {version!r}")
+
+        nonce = envelope[1 : 1 + AES_GCM_NONCE_LENGTH]
+        ciphertext = envelope[1 + AES_GCM_NONCE_LENGTH :]
+
+        return self._aes_gcm.decrypt(nonce, ciphertext, version)
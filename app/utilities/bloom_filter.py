@@ -0,0 +1,49 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    A set which only answers whether a value might have been added. `might_contain` is never
+    wrong when it returns False, and returns True for a value which was not added with a
+    probability of about `error_rate` while no more than `capacity` values have been added,
+    after which `is_full` is True and the error rate grows with every value added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.count = 0
+        self.bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(round(self.bit_count / capacity * math.log(2)), 1)
+        self._bits = bytearray(math.ceil(self.bit_count / 8))
+
+    def _get_positions(self, value: str):
+        # Double hashing, deriving every position from two halves of a single digest
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "big")
+        second_hash = int.from_bytes(digest[8:], "big") | 1
+
+        return (
+            (first_hash + index * second_hash) % self.bit_count
+            for index in range(self.hash_count)
+        )
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def add(self, value: str) -> None:
+        self.count += 1
+        for position in self._get_positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(value)
+        )
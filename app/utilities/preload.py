@@ -0,0 +1,73 @@
+import gc
+import os
+from typing import Mapping
+
+from structlog import get_logger
+
+from app.settings import parse_mode
+from app.utilities.schema import cache_questionnaire_schemas
+
+logger = get_logger()
+
+PROC_STATM_PATH = "/proc/self/statm"
+
+
+def get_memory_usage() -> Mapping:
+    """
+    Resident and shared memory of the current process in KiB.
+    Returns an empty mapping on platforms without /proc.
+    """
+    try:
+        with open(PROC_STATM_PATH, encoding="utf8") as statm_file:
+            _, resident, shared, *_ = statm_file.read().split()
+    except (OSError, ValueError):
+        return {}
+
+    page_size_kb = os.sysconf("SC_PAGE_SIZE") // 1024
+    return {
+        "resident_kb": int(resident) * page_size_kb,
+        "shared_kb": int(shared) * page_size_kb,
+    }
+
+
+def freeze_preloaded_objects():
+    """
+    Move every object allocated so far into the permanent generation so the garbage collector
+    of forked workers never touches them, keeping the pages shared copy-on-write with the master.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def preload_questionnaire_schemas():
+    """
+    Load and freeze every questionnaire schema in the web server master before workers are forked.
+    The lru_cache of schemas is inherited by each worker, so they skip loading schemas themselves.
+    """
+    cache_questionnaire_schemas()
+    freeze_preloaded_objects()
+
+    logger.info(
+        "preloaded questionnaire schemas",
+        frozen_objects=gc.get_freeze_count(),
+        **get_memory_usage(),
+    )
+
+
+def log_worker_memory_usage():
+    logger.info("worker started", pid=os.getpid(), **get_memory_usage())
+
+
+def setup_uwsgi_preload():
+    """
+    uWSGI loads the application in its master process, so the schemas cached by `create_app`
+    are already inherited by workers; freeze them and log memory usage after each fork.
+    """
+    try:
+        import uwsgi  # pylint: disable=import-outside-toplevel,import-error
+    except ImportError:
+        return
+
+    if parse_mode(os.getenv("WEB_SERVER_PRELOAD_SCHEMAS", "False")):
+        freeze_preloaded_objects()
+        uwsgi.post_fork_hook = log_worker_memory_usage
@@ -1,10 +1,17 @@
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import threading
 from functools import lru_cache
 from glob import glob
 from pathlib import Path
-from typing import List, Mapping, Optional
+from typing import Iterable, List, Mapping, Optional
 
 import requests
 import simplejson as json
+from requests.adapters import HTTPAdapter
 from structlog import get_logger
 from werkzeug.exceptions import NotFound
 
@@ -12,11 +19,27 @@ from app.questionnaire.questionnaire_schema import (
     DEFAULT_LANGUAGE_CODE,
     QuestionnaireSchema,
 )
+from app.questionnaire.rules import CompiledWhenRule, CompiledWhenRules
+from app.settings import (
+    EQ_SCHEMA_URL_CACHE_MAX_SIZE,
+    EQ_SCHEMA_URL_CACHE_STALE_SECONDS,
+    EQ_SCHEMA_URL_CACHE_TTL_SECONDS,
+    EQ_SCHEMA_URL_POOL_SIZE,
+    EQ_SCHEMA_URL_TIMEOUT_SECONDS,
+    EQ_SCHEMA_WARMUP_NAMES,
+)
+from app.utilities.schema_cache import SchemaCache
 
 logger = get_logger()
 
 SCHEMA_DIR = "schemas"
 TEST_SCHEMA_DIR = "test_schemas"
+SCHEMA_ARTIFACT_DIR = "schema_artifacts"
+# Bump whenever the artifact header or file format changes. Changes to the classes that are
+# pickled are picked up by get_schema_artifact_layout
+SCHEMA_ARTIFACT_VERSION = 3
+# Every class of ours held in a pickled QuestionnaireSchema
+SCHEMA_ARTIFACT_CLASSES = (QuestionnaireSchema, CompiledWhenRules, CompiledWhenRule)
 LANGUAGE_CODES = ("en", "cy", "ga", "eo")
 
 LANGUAGES_MAP = {
@@ -87,6 +110,10 @@ def load_schema_from_name(schema_name, language_code=DEFAULT_LANGUAGE_CODE):
 
 @lru_cache(maxsize=None)
 def _load_schema_from_name(schema_name, language_code):
+    schema = _load_schema_artifact(schema_name, language_code)
+    if schema is not None:
+        return schema
+
     schema_json = _load_schema_file(schema_name, language_code)
 
     return QuestionnaireSchema(schema_json, language_code)
@@ -166,16 +193,31 @@ def _load_schema_file(schema_name, language_code):
         return json.load(json_file, use_decimal=True)
 
 
-@lru_cache(maxsize=None)
+def _get_schema_url_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=EQ_SCHEMA_URL_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+schema_url_session = _get_schema_url_session()
+
+
 def load_schema_from_url(survey_url, language_code):
-    language_code = language_code or DEFAULT_LANGUAGE_CODE
+    return schema_url_cache.get((survey_url, language_code or DEFAULT_LANGUAGE_CODE))
+
+
+def _load_schema_from_url(survey_url, language_code):
     logger.info(
         "loading schema from URL", survey_url=survey_url, language_code=language_code
     )
 
     constructed_survey_url = "{}?language={}".format(survey_url, language_code)
 
-    req = requests.get(constructed_survey_url)
+    req = schema_url_session.get(
+        constructed_survey_url, timeout=EQ_SCHEMA_URL_TIMEOUT_SECONDS
+    )
     schema_response = req.content.decode()
 
     if req.status_code == 404:
@@ -185,7 +227,161 @@ def load_schema_from_url(survey_url, language_code):
     return QuestionnaireSchema(json.loads(schema_response), language_code)
 
 
-def cache_questionnaire_schemas():
-    for language_code, schemas in get_schema_path_map().items():
+schema_url_cache = SchemaCache(
+    _load_schema_from_url,
+    max_size=EQ_SCHEMA_URL_CACHE_MAX_SIZE,
+    ttl_seconds=EQ_SCHEMA_URL_CACHE_TTL_SECONDS,
+    stale_seconds=EQ_SCHEMA_URL_CACHE_STALE_SECONDS,
+)
+
+
+def get_schema_checksum(schema_source: bytes) -> str:
+    return hashlib.sha256(schema_source).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_schema_artifact_layout() -> str:
+    """
+    A checksum of the source of the modules defining SCHEMA_ARTIFACT_CLASSES, which determines
+    both the attributes that are pickled and the indexes and compiled rules they hold, so
+    artifacts are rebuilt whenever any of them change. Whole modules are hashed so the
+    namedtuples and helpers defined alongside the classes are covered too.
+    """
+    modules = dict.fromkeys(
+        sys.modules[artifact_class.__module__]
+        for artifact_class in SCHEMA_ARTIFACT_CLASSES
+    )
+    layout = hashlib.sha256()
+    for module in modules:
+        layout.update(inspect.getsource(module).encode("utf-8"))
+    return layout.hexdigest()
+
+
+def get_schema_artifact_path(schema_path: str) -> Path:
+    return Path(SCHEMA_ARTIFACT_DIR) / Path(schema_path).with_suffix(".pickle")
+
+
+def build_schema_artifact(schema_path: str, language_code: str) -> Path:
+    """
+    Build a pre-indexed, pre-frozen QuestionnaireSchema from a schema file and
+    pickle it alongside the checksum of the source JSON.
+    :param schema_path: The path to the schema JSON e.g. schemas/en/census_household_gb_eng.json
+    :param language_code: ISO 2-character code for the language of the schema e.g. 'en', 'cy'
+    """
+    with open(schema_path, "rb") as schema_file:
+        schema_source = schema_file.read()
+
+    schema = QuestionnaireSchema(
+        json.loads(schema_source, use_decimal=True), language_code
+    )
+    header = {
+        "version": SCHEMA_ARTIFACT_VERSION,
+        "layout": get_schema_artifact_layout(),
+        "checksum": get_schema_checksum(schema_source),
+    }
+
+    artifact_path = get_schema_artifact_path(schema_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temporary_path = artifact_path.with_suffix(".tmp")
+    with open(temporary_path, "wb") as artifact_file:
+        pickle.dump(header, artifact_file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(schema, artifact_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, artifact_path)
+
+    return artifact_path
+
+
+def build_schema_artifacts(include_test_schemas: Optional[bool] = False) -> List:
+    return [
+        build_schema_artifact(schema_path, language_code)
+        for language_code, schemas in get_schema_path_map(
+            include_test_schemas=include_test_schemas
+        ).items()
+        for schema_path in schemas.values()
+    ]
+
+
+def _load_schema_artifact(schema_name, language_code):
+    """
+    Load a prebuilt schema artifact if one exists and was built from the current schema file.
+    Returns None when the schema should instead be loaded from its JSON.
+    """
+    if not _schema_exists(language_code, schema_name):
+        return None
+
+    schema_path = get_schema_path_map(include_test_schemas=True)[language_code][
+        schema_name
+    ]
+    artifact_path = get_schema_artifact_path(schema_path)
+    if not artifact_path.is_file():
+        return None
+
+    with open(schema_path, "rb") as schema_file:
+        checksum = get_schema_checksum(schema_file.read())
+
+    try:
+        with open(artifact_path, "rb") as artifact_file:
+            header = pickle.load(artifact_file)
+            if (
+                header.get("version") != SCHEMA_ARTIFACT_VERSION
+                or header.get("layout") != get_schema_artifact_layout()
+                or header.get("checksum") != checksum
+            ):
+                logger.warning(
+                    "schema artifact is stale, loading schema file",
+                    schema_name=schema_name,
+                    language_code=language_code,
+                    artifact_path=str(artifact_path),
+                )
+                return None
+
+            schema = pickle.load(artifact_file)
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        logger.exception(
+            "unable to load schema artifact, loading schema file",
+            schema_name=schema_name,
+            language_code=language_code,
+            artifact_path=str(artifact_path),
+        )
+        return None
+
+    logger.info(
+        "loading schema artifact",
+        schema_name=schema_name,
+        language_code=language_code,
+        artifact_path=str(artifact_path),
+    )
+    return schema
+
+
+def cache_questionnaire_schemas(schema_names: Optional[Iterable[str]] = None):
+    """
+    Load schemas ahead of their first request, in every language they exist in.
+    Any other schema is loaded lazily when it is first requested.
+    :param schema_names: The names of the schemas to load. Defaults to the EQ_SCHEMA_WARMUP_NAMES
+                         allow-list, or every schema in the schemas directory when that is `*`
+    """
+    if schema_names is None:
+        schema_names = EQ_SCHEMA_WARMUP_NAMES
+
+    if schema_names is None:
+        schema_path_map = get_schema_path_map()
+    else:
+        schema_path_map = get_schema_path_map(include_test_schemas=True)
+
+    for language_code, schemas in schema_path_map.items():
         for schema in schemas:
-            load_schema_from_name(schema, language_code)
+            if schema_names is None or schema in schema_names:
+                load_schema_from_name(schema, language_code)
+
+
+def warm_questionnaire_schemas(schema_names: Iterable[str]) -> threading.Thread:
+    """
+    Load the named schemas into this process's cache in a background thread.
+    """
+    thread = threading.Thread(
+        target=cache_questionnaire_schemas, args=(frozenset(schema_names),), daemon=True
+    )
+    thread.start()
+    return thread
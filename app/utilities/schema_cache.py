@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Optional
+
+from structlog import get_logger
+
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.utilities.lru_cache import LRUCache
+
+logger = get_logger()
+
+SchemaCacheInfo = namedtuple(
+    "SchemaCacheInfo", ["hits", "misses", "refreshes", "maxsize", "currsize"]
+)
+
+
+class SchemaCache(LRUCache):
+    """
+    A bounded, thread-safe cache of schemas keyed by the tuple of arguments used to load them.
+
+    - Entries younger than `ttl_seconds` are returned as is.
+    - Entries older than that but within a further `stale_seconds` are returned straight away
+      while they are reloaded in a background thread (stale-while-revalidate).
+    - After a background reload fails, the stale entry isn't reloaded again for
+      `refresh_backoff_seconds`, which defaults to `ttl_seconds`.
+    - Anything older is treated as a miss and reloaded before returning.
+    - Concurrent misses for the same key share a single load.
+    - The least recently used entry is evicted once `max_size` entries are held.
+    """
+
+    def __init__(
+        self,
+        load_schema: Callable[..., QuestionnaireSchema],
+        max_size: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0,
+        refresh_backoff_seconds: Optional[float] = None,
+    ):
+        super().__init__(max_size)
+        self._load_schema = load_schema
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._refresh_backoff_seconds = (
+            ttl_seconds if refresh_backoff_seconds is None else refresh_backoff_seconds
+        )
+
+        self._in_flight: Dict[Hashable, Future] = {}
+        # {<key>: <monotonic time of the last failed refresh>}
+        self._refresh_failures: Dict[Hashable, float] = {}
+
+        self.refreshes = 0
+
+    def _is_fresh(self, set_at: float) -> bool:
+        return time.monotonic() - set_at < self._ttl_seconds + self._stale_seconds
+
+    def get(self, key: Hashable) -> QuestionnaireSchema:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._is_fresh(entry[1]):
+                schema, loaded_at = entry
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+                if self._should_refresh(key, loaded_at):
+                    self.refreshes += 1
+                    refresh = self._in_flight[key] = Future()
+                    threading.Thread(
+                        target=self._refresh, args=(key, refresh), daemon=True
+                    ).start()
+
+                return schema
+
+            self.misses += 1
+            future = self._in_flight.get(key)
+            is_loader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+
+        if is_loader:
+            self._load(key, future)
+
+        return future.result()
+
+    def _should_refresh(self, key: Hashable, loaded_at: float) -> bool:
+        """Whether a stale entry should be reloaded. The lock must be held by the caller."""
+        now = time.monotonic()
+        if now - loaded_at < self._ttl_seconds or key in self._in_flight:
+            return False
+
+        failed_at = self._refresh_failures.get(key)
+        return failed_at is None or now - failed_at >= self._refresh_backoff_seconds
+
+    def cache_info(self) -> SchemaCacheInfo:
+        return SchemaCacheInfo(
+            self.hits, self.misses, self.refreshes, self._max_size, len(self._entries)
+        )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+            self._refresh_failures.clear()
+            self.hits = self.misses = self.refreshes = 0
+
+    def _load(self, key: Hashable, future: Future, is_refresh: bool = False) -> None:
+        try:
+            schema = self._load_schema(*key)  # type: ignore
+        except Exception as e:  # pylint: disable=broad-except
+            with self._lock:
+                self._pop_in_flight(key, future)
+                if is_refresh and key in self._entries:
+                    self._refresh_failures[key] = time.monotonic()
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._set(key, schema)
+            self._pop_in_flight(key, future)
+            self._refresh_failures.pop(key, None)
+
+        future.set_result(schema)
+
+    def _pop_in_flight(self, key: Hashable, future: Future) -> None:
+        """
+        Stop sharing `future` for `key`, unless the cache has been cleared and another load
+        started since. The lock must be held by the caller.
+        """
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+    def _refresh(self, key: Hashable, future: Future) -> None:
+        self._load(key, future, is_refresh=True)
+
+        if exception := future.exception():
+            logger.error(
+                "failed to refresh cached schema, serving stale schema",
+                key=key,
+                error=repr(exception),
+            )
@@ -1,3 +1,6 @@
+from sys import intern
+
+
 def to_bytes(bytes_or_str):
     """
     Converts supplied data into bytes if the data is of type str.
@@ -18,3 +21,14 @@ def to_str(bytes_or_str):
     if isinstance(bytes_or_str, bytes):
         return bytes_or_str.decode()
     return bytes_or_str
+
+
+def intern_str(value):
+    """
+    Interns the supplied data if it is of type str, so repeated ids share one string.
+    :param value: Data to be interned.
+    :return: The interned string if the data was of type str. Otherwise it returns the supplied data as is.
+    """
+    if isinstance(value, str):
+        return intern(value)
+    return value
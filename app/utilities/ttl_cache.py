@@ -0,0 +1,19 @@
+import time
+
+from app.utilities.lru_cache import LRUCache
+
+
+class TTLCache(LRUCache):
+    """
+    A bounded, thread-safe cache of values which expire `ttl_seconds` after they were set.
+    The least recently used entry is evicted once `max_size` entries are held.
+
+    `None` can't be cached, as `get` returns it for a miss.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        super().__init__(max_size)
+        self._ttl_seconds = ttl_seconds
+
+    def _is_fresh(self, set_at: float) -> bool:
+        return time.monotonic() - set_at < self._ttl_seconds
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Mapping
+from typing import Mapping, Optional
 
 from app.data_models.answer_store import AnswerStore
 from app.data_models.list_store import ListStore
@@ -7,6 +7,7 @@ from app.data_models.progress_store import ProgressStore
 from app.questionnaire.placeholder_renderer import PlaceholderRenderer
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.router import Router
+from app.questionnaire.routing_path_cache import RoutingPathCache
 
 
 class Context(ABC):
@@ -18,6 +19,7 @@ class Context(ABC):
         list_store: ListStore,
         progress_store: ProgressStore,
         metadata: Mapping,
+        routing_path_cache: Optional[RoutingPathCache] = None,
     ):
         self._language = language
         self._schema = schema
@@ -32,6 +34,7 @@ class Context(ABC):
             self._list_store,
             self._progress_store,
             self._metadata,
+            routing_path_cache,
         )
 
         self._placeholder_renderer = PlaceholderRenderer(
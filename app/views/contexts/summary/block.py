@@ -1,6 +1,5 @@
 from flask import url_for
 
-from app.questionnaire.rules import evaluate_when_rules
 from app.views.contexts.summary.question import Question
 
 
@@ -40,8 +39,9 @@ class Block:
         """ Taking question variants into account, return the question which was displayed to the user """
         list_item_id = location.list_item_id
         for variant in block_schema.get("question_variants", []):
-            display_variant = evaluate_when_rules(
-                variant.get("when"),
+            display_variant = schema.get_compiled_when_rules(
+                variant.get("when")
+            ).evaluate(
                 schema,
                 metadata,
                 answer_store,
@@ -76,6 +76,7 @@ class BlockHandler:
             list_store=self._questionnaire_store.list_store,
             progress_store=self._questionnaire_store.progress_store,
             metadata=self._questionnaire_store.metadata,
+            routing_path_cache=self._questionnaire_store.routing_path_cache,
         )
 
     def is_location_valid(self):
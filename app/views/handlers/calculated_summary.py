@@ -11,6 +11,7 @@ class CalculatedSummary(Content):
             self._questionnaire_store.list_store,
             self._questionnaire_store.progress_store,
             self._questionnaire_store.metadata,
+            self._questionnaire_store.routing_path_cache,
         )
         return calculated_summary_context.build_view_context_for_calculated_summary(
             self._current_location
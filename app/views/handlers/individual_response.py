@@ -176,6 +176,7 @@ class IndividualResponseHandler:
             list_store=self._questionnaire_store.list_store,
             progress_store=self._questionnaire_store.progress_store,
             metadata=self._questionnaire_store.metadata,
+            routing_path_cache=self._questionnaire_store.routing_path_cache,
         )
 
     @cached_property
@@ -554,8 +555,7 @@ class IndividualResponseChangeHandler(IndividualResponseHandler):
                 else CompletionStatus.IN_PROGRESS
             )
         self._update_section_status(status)
-        if self._questionnaire_store.progress_store.is_dirty:
-            self._questionnaire_store.save()
+        self._questionnaire_store.save()
 
 
 class IndividualResponsePostAddressConfirmHandler(IndividualResponseHandler):
@@ -18,6 +18,7 @@ class SectionHandler:
             questionnaire_store.list_store,
             questionnaire_store.progress_store,
             questionnaire_store.metadata,
+            questionnaire_store.routing_path_cache,
         )
         if not self._is_valid_location():
             raise InvalidLocationException(f"location {self._section_id} is not valid")
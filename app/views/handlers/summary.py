@@ -11,6 +11,7 @@ class Summary(Content):
             self._questionnaire_store.list_store,
             self._questionnaire_store.progress_store,
             self._questionnaire_store.metadata,
+            self._questionnaire_store.routing_path_cache,
         )
         block = self._schema.get_block(self._current_location.block_id)
         collapsible = block.get("collapsible", False)
@@ -72,8 +72,12 @@ configure_logging()
 from app.setup import (  # NOQA isort:skip # pylint: disable=wrong-import-position
     create_app,
 )
+from app.utilities.preload import (  # NOQA isort:skip # pylint: disable=wrong-import-position
+    setup_uwsgi_preload,
+)
 
 application = create_app()
+setup_uwsgi_preload()
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
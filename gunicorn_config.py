@@ -7,3 +7,30 @@ threads = os.getenv("WEB_SERVER_THREADS")
 keepalive = os.getenv("HTTP_KEEP_ALIVE")
 bind = "0.0.0.0:5000"
 gunicorn.SERVER_SOFTWARE = "None"
+
+preload_schemas = os.getenv("WEB_SERVER_PRELOAD_SCHEMAS", "False").lower() == "true"
+
+
+def on_starting(server):
+    if not preload_schemas:
+        return
+
+    if server.cfg.worker_class_str == "gevent":
+        # Patch before the application modules are imported in the master so forked workers share them
+        from gevent import monkey  # pylint: disable=import-outside-toplevel
+
+        monkey.patch_all()
+
+    from app.utilities.preload import (  # pylint: disable=import-outside-toplevel
+        preload_questionnaire_schemas,
+    )
+
+    preload_questionnaire_schemas()
+
+
+def post_worker_init(worker):  # pylint: disable=unused-argument
+    from app.utilities.preload import (  # pylint: disable=import-outside-toplevel
+        log_worker_memory_usage,
+    )
+
+    log_worker_memory_usage()
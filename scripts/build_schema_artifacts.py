@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+import argparse
+import logging
+
+import coloredlogs
+
+from app.utilities.schema import build_schema_artifacts
+
+logger = logging.getLogger(__name__)
+
+coloredlogs.install(level="DEBUG", logger=logger, fmt="%(message)s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build precompiled schema artifacts for fast worker startup"
+    )
+    parser.add_argument(
+        "--exclude-test-schemas",
+        help="Only build artifacts for the schemas in the schemas directory",
+        action="store_true",
+    )
+
+    args = parser.parse_args()
+
+    artifact_paths = build_schema_artifacts(
+        include_test_schemas=not args.exclude_test_schemas
+    )
+
+    for artifact_path in artifact_paths:
+        logger.debug("%s - BUILT", artifact_path)
+
+    logger.info("Built %s schema artifacts", len(artifact_paths))
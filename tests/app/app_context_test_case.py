@@ -6,6 +6,15 @@ from google.cloud.datastore import Key
 from mock import patch
 
 from app.setup import create_app
+from app.storage.redis import InstrumentedBlockingConnectionPool
+
+
+def fake_redis_connection_pool(**kwargs):
+    return InstrumentedBlockingConnectionPool(
+        connection_class=fakeredis.FakeConnection,
+        server=fakeredis.FakeServer(),
+        **kwargs,
+    )
 
 
 class MockDatastore:
@@ -25,10 +34,22 @@ class MockDatastore:
     def get(self, key):
         return self.storage.get(key)
 
+    def get_multi(self, keys):
+        return [self.storage[key] for key in keys if key in self.storage]
+
+    def put_multi(self, entities):
+        for entity in entities:
+            self.put(entity)
+
     def delete(self, key):
         self.delete_call_count += 1
         del self.storage[key]
 
+    def delete_multi(self, keys):
+        for key in keys:
+            self.storage.pop(key, None)
+        self.delete_call_count += 1
+
     # pylint: disable=no-self-use
     def key(self, *path_args, **kwargs):
         return Key(*path_args, project="local", **kwargs)
@@ -53,6 +74,10 @@ class AppContextTestCase(unittest.TestCase):
 
         self._redis = patch("app.setup.redis.Redis", fakeredis.FakeStrictRedis)
         self._redis.start()
+        self._redis_pool = patch(
+            "app.setup.InstrumentedBlockingConnectionPool", fake_redis_connection_pool
+        )
+        self._redis_pool.start()
 
         setting_overrides = {"LOGIN_DISABLED": self.LOGIN_DISABLED}
         setting_overrides.update(self.setting_overrides)
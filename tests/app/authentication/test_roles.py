@@ -4,6 +4,8 @@ from unittest import TestCase
 from mock import patch
 from werkzeug.exceptions import Forbidden
 
+from tests.app.app_context_test_case import AppContextTestCase
+
 
 class TestRoleRequired(TestCase):
     def setUp(self):
@@ -239,3 +241,39 @@ class TestRoleRequired(TestCase):
         # Then a Forbidden exception is raised
         with self.assertRaises(Forbidden):
             wrapped_func("p", arg2=9)
+
+
+class TestGetTokenWithRole(AppContextTestCase):
+    def get_token_with_role(self, role, decrypted_token, query_string="?token=token"):
+        # Imported here as TestRoleRequired replaces the module between tests
+        from app.authentication.roles import (  # pylint: disable=import-outside-toplevel
+            get_token_with_role,
+        )
+
+        with self.app_request_context(f"/flush{query_string}"):
+            with patch(
+                "app.authentication.roles.decrypt_token", return_value=decrypted_token
+            ) as mock_decrypt_token:
+                return get_token_with_role(role), mock_decrypt_token
+
+    def test_token_with_role_is_returned(self):
+        decrypted_token = {"roles": ["flusher"]}
+
+        token, mock_decrypt_token = self.get_token_with_role("flusher", decrypted_token)
+
+        self.assertEqual(token, decrypted_token)
+        mock_decrypt_token.assert_called_once_with("token")
+
+    def test_token_without_role_is_not_returned(self):
+        for roles in (None, [], ["dumper"]):
+            token, _ = self.get_token_with_role("flusher", {"roles": roles})
+
+            self.assertIsNone(token)
+
+    def test_missing_token_is_not_decrypted(self):
+        token, mock_decrypt_token = self.get_token_with_role(
+            "flusher", {"roles": ["flusher"]}, query_string=""
+        )
+
+        self.assertIsNone(token)
+        mock_decrypt_token.assert_not_called()
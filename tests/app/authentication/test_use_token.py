@@ -4,7 +4,12 @@ from uuid import uuid4
 from dateutil.tz import tzutc
 from mock import patch
 
-from app.authentication.jti_claim_storage import JtiTokenUsed, use_jti_claim
+from app.authentication.jti_claim_storage import (
+    JtiTokenUsed,
+    RecentJtiClaims,
+    recent_jti_claims,
+    use_jti_claim,
+)
 from app.storage.errors import ItemAlreadyExistsError
 from tests.app.app_context_test_case import AppContextTestCase
 
@@ -55,3 +60,117 @@ class TestJtiClaimStorage(AppContextTestCase):
 
         with self.assertRaises(TypeError):
             use_jti_claim(jti_token, expires_at)
+
+
+class TestJtiClaimStorageWithFilter(AppContextTestCase):
+    setting_overrides = {"EQ_JTI_CLAIM_FILTER_ENABLED": True}
+
+    def setUp(self):
+        super().setUp()
+        recent_jti_claims.clear()
+
+    def test_replay_is_rejected_locally(self):
+        # Given
+        jti_token = str(uuid4())
+        expires_at = datetime.now(tz=tzutc()) + timedelta(seconds=60)
+        use_jti_claim(jti_token, expires_at)
+
+        # When
+        with patch("app.storage.redis.Redis.put") as add:
+            with self.assertRaises(JtiTokenUsed):
+                use_jti_claim(jti_token, expires_at)
+
+            # Then
+            add.assert_not_called()
+
+        self.assertEqual(
+            (recent_jti_claims.local_rejections, recent_jti_claims.remote_rejections),
+            (1, 0),
+        )
+
+    def test_replay_from_another_process_is_rejected_remotely(self):
+        # Given
+        jti_token = str(uuid4())
+        expires_at = datetime.now(tz=tzutc()) + timedelta(seconds=60)
+
+        # When
+        with patch(
+            "app.storage.redis.Redis.put", side_effect=[ItemAlreadyExistsError()]
+        ):
+            with self.assertRaises(JtiTokenUsed):
+                use_jti_claim(jti_token, expires_at)
+
+        # Then
+        self.assertEqual(
+            (recent_jti_claims.local_rejections, recent_jti_claims.remote_rejections),
+            (0, 1),
+        )
+        with self.assertRaises(JtiTokenUsed):
+            use_jti_claim(jti_token, expires_at)
+        self.assertEqual(recent_jti_claims.local_rejections, 1)
+
+    def test_rejections_are_logged(self):
+        # Given
+        jti_token = str(uuid4())
+        expires_at = datetime.now(tz=tzutc()) + timedelta(seconds=60)
+        use_jti_claim(jti_token, expires_at)
+
+        # When
+        with patch("app.authentication.jti_claim_storage.logger") as logger:
+            with self.assertRaises(JtiTokenUsed):
+                use_jti_claim(jti_token, expires_at)
+
+        # Then
+        logger.error.assert_called_once_with(
+            "jti claim has already been used",
+            jti_claim=jti_token,
+            rejected_locally=True,
+            local_rejections=1,
+            remote_rejections=0,
+        )
+
+    def test_claim_not_recorded_when_storage_fails(self):
+        # Given
+        jti_token = str(uuid4())
+        expires_at = datetime.now(tz=tzutc()) + timedelta(seconds=60)
+
+        with patch("app.storage.redis.Redis.put", side_effect=[ConnectionError()]):
+            with self.assertRaises(ConnectionError):
+                use_jti_claim(jti_token, expires_at)
+
+        # When
+        use_jti_claim(jti_token, expires_at)
+
+        # Then
+        self.assertEqual(recent_jti_claims.local_rejections, 0)
+
+
+class TestRecentJtiClaims(AppContextTestCase):
+    def test_expired_buckets_are_dropped(self):
+        claims = RecentJtiClaims(capacity=10, error_rate=0.001, bucket_seconds=60)
+        now = datetime.now(tz=tzutc())
+
+        claims.add("expired", now - timedelta(minutes=5))
+        claims.add("current", now + timedelta(minutes=5))
+
+        self.assertEqual(len(claims), 1)
+        self.assertFalse(claims.might_contain("expired", now - timedelta(minutes=5)))
+        self.assertTrue(claims.might_contain("current", now + timedelta(minutes=5)))
+
+    def test_claims_are_only_checked_in_their_expiry_bucket(self):
+        claims = RecentJtiClaims(capacity=10, error_rate=0.001, bucket_seconds=60)
+        expires_at = datetime.now(tz=tzutc()) + timedelta(minutes=5)
+
+        claims.add("jti", expires_at)
+
+        self.assertFalse(claims.might_contain("jti", expires_at + timedelta(hours=1)))
+
+    def test_full_bucket_is_not_added_to(self):
+        claims = RecentJtiClaims(capacity=2, error_rate=0.001, bucket_seconds=60)
+        expires_at = datetime.now(tz=tzutc()) + timedelta(minutes=5)
+
+        for jti_claim in ("first", "second", "third"):
+            claims.add(jti_claim, expires_at)
+
+        self.assertTrue(claims.might_contain("second", expires_at))
+        self.assertFalse(claims.might_contain("third", expires_at))
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from app import settings
 from app.authentication.user_id_generator import UserIDGenerator
@@ -53,6 +54,90 @@ class TestUserIDGenerator(unittest.TestCase):
         with self.assertRaises(ValueError):
             UserIDGenerator(self._iterations, "", None)
 
+    def test_cache_disabled_by_default(self):
+        id_generator = UserIDGenerator(self._iterations, "", "")
+
+        self.assertIsNone(id_generator.cache)
+
+    def test_cached_ids_and_iks_match_derived(self):
+        id_generator = UserIDGenerator(self._iterations, "", "")
+        cached_id_generator = UserIDGenerator(
+            self._iterations, "", "", cache_max_size=10, cache_ttl_seconds=60
+        )
+
+        for _ in range(2):
+            self.assertEqual(
+                cached_id_generator.generate_id("1234567890123456"),
+                id_generator.generate_id("1234567890123456"),
+            )
+            self.assertEqual(
+                cached_id_generator.generate_ik("1234567890123456"),
+                id_generator.generate_ik("1234567890123456"),
+            )
+
+        cache = cached_id_generator.cache
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_cache_does_not_hold_response_id(self):
+        id_generator = UserIDGenerator(
+            self._iterations, "", "", cache_max_size=10, cache_ttl_seconds=60
+        )
+        id_generator.generate_id("1234567890123456")
+
+        entries = id_generator.cache._entries  # pylint: disable=protected-access
+        for purpose, cache_key in entries:
+            self.assertEqual(purpose, "user_id")
+            self.assertNotIn(b"1234567890123456", cache_key)
+
+    def test_cache_is_bounded(self):
+        id_generator = UserIDGenerator(
+            self._iterations, "", "", cache_max_size=2, cache_ttl_seconds=60
+        )
+        for response_id in ("1", "2", "3"):
+            id_generator.generate_id(response_id)
+
+        self.assertEqual(len(id_generator.cache), 2)
+
+    def test_cache_expires_entries(self):
+        id_generator = UserIDGenerator(
+            self._iterations, "", "", cache_max_size=10, cache_ttl_seconds=60
+        )
+        with patch("app.utilities.ttl_cache.time.monotonic", return_value=0):
+            id_generator.generate_id("1234567890123456")
+
+        with patch("app.utilities.ttl_cache.time.monotonic", return_value=61):
+            id_generator.generate_id("1234567890123456")
+
+        self.assertEqual(id_generator.cache.misses, 2)
+
+    def test_generate_ids_and_iks(self):
+        id_generator = UserIDGenerator(self._iterations, "", "random")
+        response_ids = ["1234567890123456", "0000000000000000", "1234567890123456"]
+
+        ids_and_iks = id_generator.generate_ids_and_iks(response_ids)
+
+        self.assertEqual(
+            ids_and_iks,
+            {
+                response_id: (
+                    id_generator.generate_id(response_id),
+                    id_generator.generate_ik(response_id),
+                )
+                for response_id in response_ids
+            },
+        )
+
+    def test_generate_ids_and_iks_uses_cache(self):
+        id_generator = UserIDGenerator(
+            self._iterations, "", "random", cache_max_size=10, cache_ttl_seconds=60
+        )
+        user_id = id_generator.generate_id("1234567890123456")
+
+        ids_and_iks = id_generator.generate_ids_and_iks(["1234567890123456"])
+
+        self.assertEqual(ids_and_iks["1234567890123456"][0], user_id)
+        self.assertEqual((id_generator.cache.hits, id_generator.cache.misses), (1, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
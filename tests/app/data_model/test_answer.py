@@ -7,3 +7,11 @@ def test_from_dict():
     expected_answer = Answer(answer_id="test1", value="avalue", list_item_id="123321")
 
     assert Answer.from_dict(test_answer) == expected_answer
+
+
+def test_for_json():
+    value = {"day": "01", "month": "01"}
+    answer = Answer(answer_id="test1", value=value)
+
+    assert answer.for_json() == {"answer_id": "test1", "value": value}
+    assert answer.for_json()["value"] is value
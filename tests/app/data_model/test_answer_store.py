@@ -226,3 +226,75 @@ def test_escaped_answer_value_method(basic_answer_store):
         "item1": "&lt;p&gt;abc123&lt;/p&gt;",
         "item2": 1,
     }
+
+
+def test_answer_version_changes_when_answer_updated(empty_answer_store):
+    assert empty_answer_store.get_answer_version("answer1") == 0
+
+    empty_answer_store.add_or_update(Answer(answer_id="answer1", value=10))
+    version = empty_answer_store.get_answer_version("answer1")
+    assert version != 0
+
+    empty_answer_store.add_or_update(Answer(answer_id="answer1", value=10))
+    assert empty_answer_store.get_answer_version("answer1") == version
+
+    empty_answer_store.add_or_update(Answer(answer_id="answer1", value=11))
+    assert empty_answer_store.get_answer_version("answer1") != version
+
+
+def test_answer_version_changes_when_answer_removed(basic_answer_store):
+    versions = {
+        answer_id: basic_answer_store.get_answer_version(answer_id)
+        for answer_id in ("answer1", "answer2", "answer3")
+    }
+
+    basic_answer_store.remove_answer("answer3")
+    basic_answer_store.remove_all_answers_for_list_item_id("abc123")
+
+    assert basic_answer_store.get_answer_version("answer1") != versions["answer1"]
+    assert basic_answer_store.get_answer_version("answer2") == versions["answer2"]
+    assert basic_answer_store.get_answer_version("answer3") != versions["answer3"]
+
+
+def test_answer_version_changes_when_cleared(basic_answer_store):
+    version = basic_answer_store.get_answer_version("answer1")
+
+    basic_answer_store.clear()
+
+    assert basic_answer_store.get_answer_version("answer1") != version
+
+
+def test_get_answers_for_list_item_id(basic_answer_store):
+    assert basic_answer_store.get_answers_for_list_item_id("xyz987") == [
+        Answer(answer_id="answer2", value=20, list_item_id="xyz987"),
+        Answer(answer_id="another-answer2", value=25, list_item_id="xyz987"),
+    ]
+    assert basic_answer_store.get_answers_for_list_item_id("not-an-id") == []
+
+
+def test_get_list_item_ids_for_answer_id(basic_answer_store):
+    basic_answer_store.add_or_update(
+        Answer(answer_id="answer1", value=15, list_item_id="xyz987")
+    )
+
+    assert basic_answer_store.get_list_item_ids_for_answer_id("answer1") == [
+        "abc123",
+        "xyz987",
+    ]
+    assert basic_answer_store.get_list_item_ids_for_answer_id("answer3") == []
+
+
+def test_list_item_indexes_updated_when_answers_removed(basic_answer_store):
+    basic_answer_store.remove_answer("answer2", list_item_id="xyz987")
+    basic_answer_store.remove_all_answers_for_list_item_id("abc123")
+
+    assert basic_answer_store.get_answers_for_list_item_id("xyz987") == [
+        Answer(answer_id="another-answer2", value=25, list_item_id="xyz987")
+    ]
+    assert basic_answer_store.get_answers_for_list_item_id("abc123") == []
+    assert basic_answer_store.get_list_item_ids_for_answer_id("answer1") == []
+    assert basic_answer_store.get_list_item_ids_for_answer_id("answer2") == []
+
+    basic_answer_store.clear()
+
+    assert basic_answer_store.get_answers_for_list_item_id("xyz987") == []
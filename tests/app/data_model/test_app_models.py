@@ -2,7 +2,12 @@ import datetime
 
 from dateutil.tz import tzutc
 
-from app.data_models.app_models import EQSession, QuestionnaireState, UsedJtiClaim
+from app.data_models.app_models import (
+    EQSession,
+    QuestionnaireState,
+    QuestionnaireStateDelta,
+    UsedJtiClaim,
+)
 from app.storage.storage import StorageModel
 from tests.app.app_context_test_case import AppContextTestCase
 
@@ -16,6 +21,21 @@ class TestAppModels(AppContextTestCase):
         self.assertGreaterEqual(new_model.created_at, NOW)
         self.assertGreaterEqual(new_model.updated_at, NOW)
 
+    def test_questionnaire_state_with_deltas(self):
+        self._test_model(
+            QuestionnaireState(
+                "someuser", "somedata", 2, delta_key="somekey", delta_sequence=3
+            )
+        )
+
+    def test_questionnaire_state_delta(self):
+        new_model = self._test_model(
+            QuestionnaireStateDelta("someuser:somekey:1", "somedata")
+        )
+
+        self.assertGreaterEqual(new_model.created_at, NOW)
+        self.assertGreaterEqual(new_model.updated_at, NOW)
+
     def test_eq_session(self):
         new_model = self._test_model(
             EQSession(
@@ -153,3 +153,16 @@ def test_first_raises_index_error_when_list_is_empty():
     assert "unable to access first item in list, list 'people' is empty" in str(
         error.value
     )
+
+
+def test_list_version_changes_when_list_modified():
+    store = ListStore()
+    assert store.get_list_version("people") == 0
+
+    list_item_id = store.add_list_item("people")
+    added_version = store.get_list_version("people")
+    assert added_version != 0
+    assert store.get_list_version("pets") == 0
+
+    store.delete_list_item("people", list_item_id)
+    assert store.get_list_version("people") != added_version
@@ -576,3 +576,61 @@ def test_section_keys():
     assert sorted(section_keys) == sorted(
         [("s1", None), ("s2", None), ("s3", "abc123")]
     )
+
+
+def test_section_keys_are_in_progress_order():
+    store = ProgressStore(
+        [
+            {
+                "section_id": section_id,
+                "list_item_id": None,
+                "status": CompletionStatus.IN_PROGRESS,
+                "block_ids": ["one"],
+            }
+            for section_id in ("s1", "s2", "s3")
+        ]
+    )
+    store.update_section_status(CompletionStatus.COMPLETED, "s1")
+
+    assert store.section_keys() == [("s1", None), ("s2", None), ("s3", None)]
+    assert store.section_keys(
+        statuses=[CompletionStatus.COMPLETED, CompletionStatus.IN_PROGRESS]
+    ) == [("s1", None), ("s2", None), ("s3", None)]
+
+
+def test_is_block_complete():
+    store = ProgressStore()
+    location = Location(section_id="s1", block_id="one", list_item_id="abc123")
+
+    store.add_completed_location(location)
+    assert store.is_block_complete("one", "s1", "abc123")
+    assert not store.is_block_complete("one", "s1")
+    assert not store.is_block_complete("two", "s1", "abc123")
+
+    store.remove_completed_location(location)
+    assert not store.is_block_complete("one", "s1", "abc123")
+
+
+def test_is_section_complete_follows_status_changes():
+    store = ProgressStore(
+        [
+            {
+                "section_id": "s1",
+                "block_ids": ["one"],
+                "status": CompletionStatus.COMPLETED,
+            }
+        ]
+    )
+    assert store.is_section_complete("s1")
+
+    store.update_section_status(CompletionStatus.IN_PROGRESS, "s1")
+    assert not store.is_section_complete("s1")
+    assert store.section_keys(statuses={CompletionStatus.IN_PROGRESS}) == [("s1", None)]
+
+    store.update_section_status(
+        CompletionStatus.INDIVIDUAL_RESPONSE_REQUESTED, "s2", "abc123"
+    )
+    assert store.is_section_complete("s2", "abc123")
+
+    store.remove_progress_for_list_item_id("abc123")
+    assert not store.is_section_complete("s2", "abc123")
@@ -1,9 +1,9 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import simplejson as json
 
-from app.data_models import QuestionnaireStore
+from app.data_models import QuestionnaireStore, questionnaire_store_codec
 from app.data_models.answer_store import AnswerStore
 from app.data_models.progress_store import CompletionStatus, ProgressStore
 
@@ -45,10 +45,11 @@ class TestQuestionnaireStore(TestCase):
     def setUp(self):
         def get_user_data():
             """Fake get_user_data implementation for storage"""
-            return self.input_data, 1
+            return self.input_data, self.input_version
 
-        def set_output_data(data):
+        def set_output_data(data, version):
             self.output_data = data
+            self.output_version = version
 
         # Storage class mocking
         self.storage = MagicMock()
@@ -56,6 +57,7 @@ class TestQuestionnaireStore(TestCase):
         self.storage.save = MagicMock(side_effect=set_output_data)
 
         self.input_data = "{}"
+        self.input_version = 1
         self.output_data = ""
         self.output_version = None
 
@@ -137,6 +139,78 @@ class TestQuestionnaireStore(TestCase):
 
         # Then
         self.assertEqual(expected, json.loads(self.output_data))
+        self.assertEqual(self.output_version, QuestionnaireStore.VERBOSE_VERSION)
+
+    def test_questionnaire_store_updates_storage_with_compact_encoding(self):
+        expected = get_basic_input()
+        store = QuestionnaireStore(self.storage, compact_encoding_enabled=True)
+        store.set_metadata(expected["METADATA"])
+        store.answer_store = AnswerStore(expected["ANSWERS"])
+        store.response_metadata = expected["RESPONSE_METADATA"]
+        store.progress_store = ProgressStore(expected["PROGRESS"])
+
+        store.save()
+
+        self.assertEqual(
+            expected,
+            questionnaire_store_codec.decode(json.loads(self.output_data)),
+        )
+        self.assertEqual(self.output_version, QuestionnaireStore.LATEST_VERSION)
+
+    def test_questionnaire_store_serializes_version_1(self):
+        expected = get_basic_input()
+        self.input_data = json.dumps(expected)
+        store = QuestionnaireStore(self.storage)
+
+        self.assertEqual(expected, json.loads(store.serialize(version=1)))
+
+    def test_questionnaire_store_serializes_ids_once(self):
+        expected = get_basic_input()
+        expected["ANSWERS"] = [
+            {"answer_id": "first-name", "value": "Joe", "list_item_id": "abc123"},
+            {"answer_id": "last-name", "value": "Bloggs", "list_item_id": "abc123"},
+            {"answer_id": "first-name", "value": "Jane", "list_item_id": "def456"},
+        ]
+        self.input_data = json.dumps(expected)
+        store = QuestionnaireStore(self.storage)
+
+        serialized = json.loads(store.serialize(QuestionnaireStore.LATEST_VERSION))
+
+        self.assertEqual(
+            serialized["IDS"],
+            [
+                "first-name",
+                "abc123",
+                "last-name",
+                "def456",
+                "a-test-section",
+                CompletionStatus.COMPLETED,
+                "a-test-block",
+            ],
+        )
+        self.assertEqual(
+            serialized["ANSWERS"],
+            [[0, 2, 0], [1, 1, 3], ["Joe", "Bloggs", "Jane"]],
+        )
+        self.assertEqual(serialized["PROGRESS"], [[4, 1, 5, [6]]])
+
+    def test_questionnaire_store_loads_latest_version(self):
+        expected = get_basic_input()
+        self.input_data = json.dumps(expected)
+        version_1_store = QuestionnaireStore(self.storage)
+
+        self.input_data = version_1_store.serialize(QuestionnaireStore.LATEST_VERSION)
+        self.input_version = QuestionnaireStore.LATEST_VERSION
+        store = QuestionnaireStore(self.storage)
+
+        self.assertEqual(store.version, QuestionnaireStore.LATEST_VERSION)
+        self.assertEqual(store.metadata.copy(), expected["METADATA"])
+        self.assertEqual(store.response_metadata, expected["RESPONSE_METADATA"])
+        self.assertEqual(store.answer_store, AnswerStore(expected["ANSWERS"]))
+        self.assertEqual(
+            store.progress_store.get_completed_block_ids("a-test-section", "abc123"),
+            ["a-test-block"],
+        )
 
     def test_questionnaire_store_errors_on_invalid_object(self):
         # Given
@@ -178,3 +252,39 @@ class TestQuestionnaireStore(TestCase):
 
         with self.assertRaises(TypeError):
             store.metadata["no"] = "writing"
+
+    def test_questionnaire_store_does_not_save_when_unchanged(self):
+        self.input_data = json.dumps(get_basic_input())
+        store = QuestionnaireStore(self.storage)
+
+        store.save()
+
+        self.assertFalse(store.is_dirty)
+        self.storage.save.assert_not_called()
+
+    def test_questionnaire_store_saves_changed_response_metadata(self):
+        self.input_data = json.dumps(get_basic_input())
+        store = QuestionnaireStore(self.storage)
+
+        store.response_metadata["started_at"] = "2021-01-01T00:00:00"
+
+        self.assertTrue(store.is_dirty)
+        store.save()
+        self.assertEqual(
+            json.loads(self.output_data)["RESPONSE_METADATA"]["started_at"],
+            "2021-01-01T00:00:00",
+        )
+        self.assertFalse(store.is_dirty)
+
+    def test_questionnaire_store_builds_stores_on_first_use(self):
+        expected = get_basic_input()
+        self.input_data = json.dumps(expected)
+        store = QuestionnaireStore(self.storage)
+
+        with patch("app.data_models.questionnaire_store.AnswerStore") as answer_store:
+            self.assertEqual(store.metadata.copy(), expected["METADATA"])
+            self.assertFalse(store.is_dirty)
+            answer_store.assert_not_called()
+
+        self.assertEqual(store.answer_store, AnswerStore(expected["ANSWERS"]))
+        self.assertIs(store.answer_store, store.answer_store)
@@ -0,0 +1,76 @@
+from app.data_models import questionnaire_store_codec
+from app.data_models.answer import Answer
+from app.data_models.progress import Progress
+from app.data_models.progress_store import CompletionStatus
+
+
+def get_data():
+    return {
+        "METADATA": {"test": True},
+        "ANSWERS": [
+            {"answer_id": "first-name", "value": "Joe", "list_item_id": "abc123"},
+            {"answer_id": "confirm", "value": "Yes"},
+        ],
+        "LISTS": [{"name": "people", "items": ["abc123"]}],
+        "PROGRESS": [
+            {
+                "section_id": "section",
+                "list_item_id": None,
+                "status": CompletionStatus.IN_PROGRESS,
+                "block_ids": ["block"],
+            }
+        ],
+        "RESPONSE_METADATA": {},
+    }
+
+
+def test_encode_and_decode():
+    data = get_data()
+
+    encoded = questionnaire_store_codec.encode(
+        metadata=data["METADATA"],
+        answers=[Answer.from_dict(answer) for answer in data["ANSWERS"]],
+        lists=data["LISTS"],
+        progress=[Progress.from_dict(progress) for progress in data["PROGRESS"]],
+        response_metadata=data["RESPONSE_METADATA"],
+    )
+
+    assert encoded["ANSWERS"] == [[0, 2], [1, -1], ["Joe", "Yes"]]
+    assert questionnaire_store_codec.decode(encoded) == data
+
+
+def test_delta_of_unchanged_data_is_empty():
+    assert questionnaire_store_codec.get_delta(get_data(), get_data()) == {}
+
+
+def test_delta_contains_only_changes():
+    previous = get_data()
+    current = get_data()
+    current["ANSWERS"] = [
+        {"answer_id": "first-name", "value": "Jane", "list_item_id": "abc123"},
+        {"answer_id": "last-name", "value": "Bloggs", "list_item_id": "abc123"},
+    ]
+    current["RESPONSE_METADATA"] = {"started_at": "2021-01-01T00:00:00"}
+
+    delta = questionnaire_store_codec.get_delta(previous, current)
+
+    assert delta == {
+        "ANSWERS": {
+            "updated": current["ANSWERS"],
+            "removed": [["confirm", None]],
+        },
+        "RESPONSE_METADATA": {"started_at": "2021-01-01T00:00:00"},
+    }
+
+
+def test_apply_delta():
+    previous = get_data()
+    current = get_data()
+    current["ANSWERS"].pop()
+    current["PROGRESS"][0]["status"] = CompletionStatus.COMPLETED
+    current["PROGRESS"][0]["block_ids"].append("another-block")
+    current["LISTS"] = []
+
+    delta = questionnaire_store_codec.get_delta(previous, current)
+
+    assert questionnaire_store_codec.apply_delta(previous, delta) == current
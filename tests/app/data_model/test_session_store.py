@@ -1,5 +1,6 @@
 import json
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from flask import current_app
 from jwcrypto import jwe
@@ -253,6 +254,19 @@ class TestSessionStoreEncoding(AppContextTestCase):
         session_store = SessionStore(self.user_ik, self.pepper, self.session_id)
         self.assertEqual(session_store.session_data.tx_id, self.session_data.tx_id)
 
+    def test_load_with_eq_session_does_not_read_storage(self):
+        self._save_session(self.session_id, self.user_id, self.session_data)
+        eq_session = current_app.eq["storage"].get(EQSession, self.session_id)
+
+        with patch.object(current_app.eq["storage"], "get") as get:
+            session_store = SessionStore(
+                self.user_ik, self.pepper, self.session_id, eq_session=eq_session
+            )
+            get.assert_not_called()
+
+        self.assertEqual(session_store.user_id, self.user_id)
+        self.assertEqual(session_store.session_data.tx_id, self.session_data.tx_id)
+
     def _save_session(self, session_id, user_id, data, legacy=False):
         raw_data = json.dumps(vars(data))
         protected_header = {"alg": "dir", "enc": "A256GCM", "kid": "1,1"}
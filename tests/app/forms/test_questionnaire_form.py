@@ -6,7 +6,7 @@ from werkzeug.datastructures import MultiDict
 
 from app.data_models.answer_store import Answer, AnswerStore
 from app.forms import error_messages
-from app.forms.questionnaire_form import generate_form
+from app.forms.questionnaire_form import form_class_cache, generate_form
 from app.forms.validators import (
     DateRequired,
     ResponseRequired,
@@ -1076,7 +1076,8 @@ class TestQuestionnaireForm(
             expected_form_data = {"csrf_token": "", "feeling-answer": "good"}
 
             with patch(
-                "app.questionnaire.path_finder.evaluate_goto", return_value=False
+                "app.questionnaire.path_finder.PathFinder._evaluate_goto",
+                return_value=False,
             ):
                 form = generate_form(
                     schema, question_schema, store, metadata={}, form_data=form_data
@@ -1406,3 +1407,97 @@ class TestQuestionnaireForm(
 
             other_text_field = getattr(form, "other-answer-mandatory")
             self.assertEqual(other_text_field.data, "Other text field value")
+
+    def test_form_class_is_reused_for_frozen_question(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_textfield")
+            question_schema = schema.get_block("name-block").get("question")
+            form_class_cache.cache_clear()
+
+            first_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+            second_form = generate_form(
+                schema,
+                question_schema,
+                AnswerStore(),
+                metadata=None,
+                form_data=MultiDict({"name-answer": "Joe"}),
+            )
+
+            self.assertIs(type(first_form), type(second_form))
+            self.assertEqual(getattr(second_form, "name-answer").data, "Joe")
+            self.assertEqual((form_class_cache.hits, form_class_cache.misses), (1, 1))
+
+    def test_form_class_is_not_cached_for_rendered_question(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_textfield")
+            question_schema = QuestionnaireSchema.get_mutable_deepcopy(
+                schema.get_block("name-block").get("question")
+            )
+            form_class_cache.cache_clear()
+
+            first_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+            second_form = generate_form(
+                schema, question_schema, AnswerStore(), metadata=None
+            )
+
+            self.assertIsNot(type(first_form), type(second_form))
+            self.assertEqual(len(form_class_cache), 0)
+
+    def test_form_class_depends_on_selected_detail_answer(self):
+        with self.app_request_context(), patch.dict(
+            self._app.config, {"WTF_CSRF_ENABLED": False}
+        ):
+            schema = load_schema_from_name(
+                "test_radio_mandatory_with_detail_answer_mandatory"
+            )
+            question_schema = schema.get_block("radio-mandatory").get("question")
+            form_class_cache.cache_clear()
+
+            form = generate_form(
+                schema,
+                question_schema,
+                AnswerStore(),
+                metadata=None,
+                form_data=MultiDict({"radio-mandatory-answer": "Other"}),
+            )
+            form_without_detail_answer = generate_form(
+                schema,
+                question_schema,
+                AnswerStore(),
+                metadata=None,
+                form_data=MultiDict({"radio-mandatory-answer": "Toast"}),
+            )
+
+            self.assertIsNot(type(form), type(form_without_detail_answer))
+            self.assertFalse(form.validate())
+            self.assertTrue(form_without_detail_answer.validate())
+
+    def test_form_class_depends_on_answers_used_for_minimum_and_maximum(self):
+        with self.app_request_context():
+            schema = load_schema_from_name("test_numbers")
+            question_schema = schema.get_block("test-min-max-block").get("question")
+            form_class_cache.cache_clear()
+
+            def get_test_range_validator(maximum):
+                answer_store = AnswerStore(
+                    [
+                        {"answer_id": "set-minimum", "value": 10},
+                        {"answer_id": "set-maximum", "value": maximum},
+                    ]
+                )
+                form = generate_form(
+                    schema,
+                    question_schema,
+                    answer_store,
+                    metadata={"schema_name": "test_numbers"},
+                )
+                return getattr(form, "test-range").validators[2]
+
+            self.assertEqual(get_test_range_validator(20).maximum, 20)
+            self.assertEqual(get_test_range_validator(20).maximum, 20)
+            self.assertEqual(get_test_range_validator(30).maximum, 30)
+            self.assertEqual((form_class_cache.hits, form_class_cache.misses), (1, 2))
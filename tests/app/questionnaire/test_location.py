@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 from app.questionnaire.location import Location
 from tests.app.app_context_test_case import AppContextTestCase
 
@@ -37,8 +39,18 @@ class TestLocation(AppContextTestCase):
 
     def test_location_hash(self):
         location = Location(section_id="some-section", block_id="some-block")
+        same_location = Location(section_id="some-section", block_id="some-block")
+
+        self.assertEqual(hash(location), hash(same_location))
+        self.assertNotEqual(
+            hash(location), hash(Location(section_id="some-section", block_id="other"))
+        )
+
+    def test_location_is_immutable(self):
+        location = Location(section_id="some-section", block_id="some-block")
 
-        self.assertEqual(hash(location), hash(frozenset(location.__dict__.values())))
+        with self.assertRaises(FrozenInstanceError):
+            location.block_id = "another-block"
 
     def test_load_location_from_dict(self):
         location_dict = {
@@ -7,6 +7,7 @@ from app.data_models.list_store import ListStore
 from app.data_models.progress_store import CompletionStatus, ProgressStore
 from app.questionnaire.path_finder import PathFinder
 from app.questionnaire.routing_path import RoutingPath
+from app.questionnaire.routing_path_cache import RoutingPathCache
 from app.utilities.schema import load_schema_from_name
 from tests.app.app_context_test_case import AppContextTestCase
 
@@ -313,7 +314,8 @@ class TestPathFinder(AppContextTestCase):
         )
 
         with patch(
-            "app.questionnaire.path_finder.evaluate_skip_conditions", return_value=True
+            "app.questionnaire.path_finder.PathFinder._evaluate_skip_conditions",
+            return_value=True,
         ):
             self.assertEqual(routing_path, expected_routing_path)
 
@@ -350,7 +352,8 @@ class TestPathFinder(AppContextTestCase):
         )
 
         with patch(
-            "app.questionnaire.path_finder.evaluate_skip_conditions", return_value=True
+            "app.questionnaire.path_finder.PathFinder._evaluate_skip_conditions",
+            return_value=True,
         ):
             self.assertEqual(routing_path, expected_routing_path)
 
@@ -387,7 +390,8 @@ class TestPathFinder(AppContextTestCase):
         )
 
         with patch(
-            "app.questionnaire.path_finder.evaluate_skip_conditions", return_value=False
+            "app.questionnaire.path_finder.PathFinder._evaluate_skip_conditions",
+            return_value=False,
         ):
             self.assertEqual(routing_path, expected_routing_path)
 
@@ -504,3 +508,32 @@ class TestPathFinder(AppContextTestCase):
             [progress_store.get_completed_block_ids(section_id="default-section")[0]],
         )
         self.assertEqual(len(path_finder.answer_store), 1)
+
+    def test_routing_path_is_cached_until_dependent_answer_changes(self):
+        schema = load_schema_from_name("test_routing_number_equals")
+        section_id = schema.get_section_id_for_block_id("number-question")
+        answer_store = AnswerStore()
+        answer_store.add_or_update(Answer(answer_id="answer", value=123))
+        routing_path_cache = RoutingPathCache()
+
+        path_finder = PathFinder(
+            schema,
+            answer_store,
+            self.list_store,
+            self.progress_store,
+            self.metadata,
+            routing_path_cache,
+        )
+
+        routing_path = path_finder.routing_path(section_id=section_id)
+        self.assertEqual(routing_path, ["number-question", "correct-answer", "summary"])
+        self.assertIs(path_finder.routing_path(section_id=section_id), routing_path)
+        self.assertEqual(routing_path_cache.hits, 1)
+
+        answer_store.add_or_update(Answer(answer_id="answer", value=321))
+
+        self.assertEqual(
+            path_finder.routing_path(section_id=section_id),
+            ["number-question", "incorrect-answer", "summary"],
+        )
+        self.assertEqual(routing_path_cache.misses, 2)
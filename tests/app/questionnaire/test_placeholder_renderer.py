@@ -2,11 +2,9 @@ from unittest.mock import Mock, patch
 
 from app.data_models.answer_store import AnswerStore
 from app.data_models.list_store import ListStore
-from app.questionnaire.placeholder_renderer import (
-    PlaceholderRenderer,
-    find_pointers_containing,
-)
+from app.questionnaire.placeholder_renderer import PlaceholderRenderer
 from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.questionnaire.schema_utils import find_pointers_containing
 from tests.app.app_context_test_case import AppContextTestCase
 
 
@@ -158,6 +156,56 @@ class TestPlaceholderRenderer(AppContextTestCase):
 
         assert rendered_label == "Alfred Aho’s age is 33 years. Is this correct?"
 
+    def test_render_only_copies_containers_with_placeholders(self):
+        schema = QuestionnaireSchema(
+            {
+                "sections": [
+                    {
+                        "id": "section",
+                        "groups": [
+                            {
+                                "id": "group",
+                                "blocks": [
+                                    {
+                                        "id": "block",
+                                        "type": "Question",
+                                        "question": self.question_json,
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+        question = schema.get_block("block")["question"]
+
+        renderer = PlaceholderRenderer(
+            language="en",
+            schema=schema,
+            answer_store=AnswerStore(
+                [
+                    {"answer_id": "first-name", "value": "Alfred"},
+                    {"answer_id": "last-name", "value": "Aho"},
+                    {"answer_id": "date-of-birth-answer", "value": "1986-01-01"},
+                ]
+            ),
+        )
+
+        with patch.object(
+            QuestionnaireSchema,
+            "find_placeholder_paths",
+            wraps=QuestionnaireSchema.find_placeholder_paths,
+        ) as find_placeholder_paths:
+            rendered_question = renderer.render(question, list_item_id=None)
+
+        find_placeholder_paths.assert_called_once()
+        rendered_options = rendered_question["answers"][0]["options"]
+
+        assert rendered_options[0]["label"].startswith("Alfred Aho’s age is")
+        assert rendered_options[1] is question["answers"][0]["options"][1]
+        assert isinstance(question["answers"][0]["options"][0]["label"], dict)
+
     def test_renders_json_uses_language(self):
         mock_transform = {
             "transform": "calculate_date_difference",
@@ -0,0 +1,83 @@
+from app.data_models.answer import Answer
+from app.data_models.answer_store import AnswerStore
+from app.data_models.list_store import ListStore
+from app.questionnaire.placeholder_parser import PlaceholderParser
+from app.questionnaire.placeholder_value_cache import (
+    PlaceholderValueCache,
+    get_placeholder_value_cache,
+)
+from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+
+PLACEHOLDERS = [
+    {
+        "placeholder": "first_name",
+        "value": {"source": "answers", "identifier": "first-name"},
+    }
+]
+
+LIST_STORE = ListStore()
+
+
+def parse_placeholders(answer_store, list_store=LIST_STORE):
+    parser = PlaceholderParser(
+        language="en",
+        schema=QuestionnaireSchema({}),
+        answer_store=answer_store,
+        list_store=list_store,
+    )
+    return parser(PLACEHOLDERS)
+
+
+def test_get_and_set():
+    cache = PlaceholderValueCache()
+
+    assert cache.get("key") == (False, None)
+
+    cache.set("key", "value")
+
+    assert cache.get("key") == (True, "value")
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_get_placeholder_value_cache_outside_app_context():
+    assert get_placeholder_value_cache() is None
+
+
+def test_get_placeholder_value_cache_is_scoped_to_app_context(app):
+    with app.app_context():
+        cache = get_placeholder_value_cache()
+        assert cache is get_placeholder_value_cache()
+
+    with app.app_context():
+        assert get_placeholder_value_cache() is not cache
+
+
+def test_parser_reuses_cached_value(app):
+    answer_store = AnswerStore([{"answer_id": "first-name", "value": "Joe"}])
+
+    with app.app_context():
+        assert parse_placeholders(answer_store) == {"first_name": "Joe"}
+        assert parse_placeholders(answer_store) == {"first_name": "Joe"}
+
+        cache = get_placeholder_value_cache()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parser_resolves_value_again_when_answer_changes(app):
+    answer_store = AnswerStore([{"answer_id": "first-name", "value": "Joe"}])
+
+    with app.app_context():
+        parse_placeholders(answer_store)
+        answer_store.add_or_update(Answer(answer_id="first-name", value="Jane"))
+
+        assert parse_placeholders(answer_store) == {"first_name": "Jane"}
+        assert get_placeholder_value_cache().misses == 2
+
+
+def test_parser_does_not_share_values_between_answer_stores(app):
+    with app.app_context():
+        parse_placeholders(AnswerStore([{"answer_id": "first-name", "value": "Joe"}]))
+
+        assert parse_placeholders(
+            AnswerStore([{"answer_id": "first-name", "value": "Jane"}])
+        ) == {"first_name": "Jane"}
@@ -3,7 +3,12 @@ from collections import abc
 import pytest
 from werkzeug.datastructures import ImmutableDict
 
-from app.questionnaire.questionnaire_schema import QuestionnaireSchema
+from app.questionnaire.questionnaire_schema import (
+    DependencyType,
+    Dependent,
+    QuestionnaireSchema,
+)
+from app.utilities.schema import load_schema_from_name
 
 
 def assert_all_dict_values_are_hashable(data):
@@ -208,6 +213,24 @@ def test_get_section_ids_by_list_name(sections_dependent_on_list_schema):
     assert "section2" in when_blocks
 
 
+def test_get_section_ids_by_list_name_ignores_variant_when_rules(
+    sections_dependent_on_list_schema,
+):
+    block = sections_dependent_on_list_schema["sections"][0]["groups"][0]["blocks"][0]
+    block["question_variants"] = [
+        {
+            "question": {"id": "question1", "title": "Question 1", "answers": []},
+            "when": [{"condition": "greater than", "list": "list", "value": 0}],
+        }
+    ]
+    schema = QuestionnaireSchema(sections_dependent_on_list_schema)
+
+    assert schema.get_section_ids_dependent_on_list("list") == ["section2"]
+    assert Dependent(
+        "section1", "list-collector", DependencyType.VARIANTS
+    ) in schema.get_dependents_for_list("list")
+
+
 def test_get_all_questions_for_block_question_variants():
     block = {
         "id": "block1",
@@ -418,3 +441,112 @@ def test_doesnt_have_address_lookup_answer():
 
     has_lookup_answer = QuestionnaireSchema.has_address_lookup_answer(question)
     assert not has_lookup_answer
+
+
+def test_get_compiled_when_rules_is_precompiled_for_schema_rules(
+    question_variant_schema,
+):
+    schema = QuestionnaireSchema(question_variant_schema)
+    when_rules = schema.get_block("block1")["question_variants"][0]["when"]
+
+    compiled_when_rules = schema.get_compiled_when_rules(when_rules)
+
+    assert compiled_when_rules is schema.get_compiled_when_rules(when_rules)
+    assert compiled_when_rules.when_rules is when_rules
+
+
+def test_get_compiled_when_rules_compiles_rules_not_in_schema():
+    schema = QuestionnaireSchema({})
+    when_rules = [{"id": "answer", "condition": "equals", "value": "Yes"}]
+
+    compiled_when_rules = schema.get_compiled_when_rules(when_rules)
+
+    assert compiled_when_rules.when_rules is when_rules
+    assert compiled_when_rules.compiled_rules[0].match_value == "yes"
+
+
+def test_get_dependents_for_list(sections_dependent_on_list_schema):
+    schema = QuestionnaireSchema(sections_dependent_on_list_schema)
+
+    assert schema.get_dependents_for_list("list") == {
+        Dependent("section1", "list-collector", DependencyType.FOR_LIST),
+        Dependent("section2", "block2", DependencyType.WHEN_RULES),
+    }
+
+
+def test_get_dependents_for_list_filtered_by_dependency_type(
+    sections_dependent_on_list_schema,
+):
+    schema = QuestionnaireSchema(sections_dependent_on_list_schema)
+
+    assert schema.get_dependents_for_list(
+        "list", dependency_types={DependencyType.FOR_LIST}
+    ) == {Dependent("section1", "list-collector", DependencyType.FOR_LIST)}
+
+
+def test_get_dependents_for_unknown_identifier(sections_dependent_on_list_schema):
+    schema = QuestionnaireSchema(sections_dependent_on_list_schema)
+
+    assert schema.get_dependents_for_list("unknown") == frozenset()
+    assert schema.get_dependents_for_answer_id("unknown") == frozenset()
+    assert schema.get_dependents_for_metadata_key("unknown") == frozenset()
+
+
+def test_get_dependents_for_metadata_key_in_placeholders():
+    schema = load_schema_from_name("test_placeholder_full")
+
+    assert schema.get_dependents_for_metadata_key("display_address") == {
+        Dependent(
+            "mutually-exclusive-checkbox-section",
+            "mutually-exclusive-checkbox",
+            DependencyType.PLACEHOLDERS,
+        )
+    }
+
+
+def test_get_calculated_summary_block_ids_for_answer_id():
+    schema = load_schema_from_name("test_calculated_summary")
+
+    assert schema.get_calculated_summary_block_ids_for_answer_id(
+        "first-number-answer"
+    ) == {
+        "currency-total-playback-skipped-fourth",
+        "currency-total-playback-with-fourth",
+    }
+
+
+def test_find_placeholder_paths():
+    data = {
+        "title": {"text": "{name}", "placeholders": []},
+        "answers": [
+            {"label": "No placeholders"},
+            {"label": {"text": "{name}", "placeholders": []}},
+        ],
+    }
+
+    assert QuestionnaireSchema.find_placeholder_paths(data) == (
+        ("title",),
+        ("answers", 1, "label"),
+    )
+
+
+def test_get_placeholder_paths_is_precomputed_for_blocks():
+    schema = load_schema_from_name("test_placeholder_full")
+    block = schema.get_block("mutually-exclusive-checkbox")
+
+    # pylint: disable=protected-access
+    assert schema._placeholder_paths_by_id[id(block)] == schema.get_placeholder_paths(
+        block
+    )
+    assert schema.get_placeholder_paths(
+        block
+    ) == QuestionnaireSchema.find_placeholder_paths(block)
+
+
+def test_get_block_positions_for_section():
+    schema = load_schema_from_name("test_textfield")
+
+    assert schema.get_block_positions_for_section("default-section") == {
+        "name-block": 0,
+        "summary": 1,
+    }
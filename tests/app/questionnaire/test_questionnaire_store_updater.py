@@ -65,7 +65,7 @@ class TestQuestionnaireStoreUpdater(unittest.TestCase):
         assert self.answer_store.add_or_update.call_count == 1
 
         created_answer = self.answer_store.add_or_update.call_args[0][0]
-        assert created_answer.__dict__ == {
+        assert created_answer.to_dict() == {
             "answer_id": answer_id,
             "list_item_id": None,
             "value": answer_value,
@@ -96,7 +96,7 @@ class TestQuestionnaireStoreUpdater(unittest.TestCase):
         assert self.answer_store.add_or_update.call_count == 1
 
         created_answer = self.answer_store.add_or_update.call_args[0][0]
-        assert created_answer.__dict__ == {
+        assert created_answer.to_dict() == {
             "answer_id": answer_id,
             "list_item_id": "abc123",
             "value": answer_value,
@@ -49,3 +49,11 @@ class TestRouter(TestCase):
         self.assertEqual(self.section_id, self.routing_path.section_id)
         self.assertEqual(self.list_item_id, self.routing_path.list_item_id)
         self.assertEqual(self.list_name, self.routing_path.list_name)
+
+    def test_index(self):
+        self.assertEqual(self.routing_path.index("block-b"), 1)
+        self.assertEqual(self.routing_path.index("block-b", 2), 3)
+
+    def test_index_not_in_path(self):
+        with self.assertRaises(ValueError):
+            self.routing_path.index("block-z")
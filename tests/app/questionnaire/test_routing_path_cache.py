@@ -0,0 +1,49 @@
+from app.questionnaire.routing_path import RoutingPath
+from app.questionnaire.routing_path_cache import RoutingPathCache
+
+
+def test_get_returns_none_when_not_cached():
+    routing_path_cache = RoutingPathCache()
+
+    assert routing_path_cache.get("section-1", None, ((), (), ())) is None
+    assert routing_path_cache.misses == 1
+
+
+def test_get_returns_cached_routing_path_for_same_dependency_key():
+    routing_path_cache = RoutingPathCache()
+    routing_path = RoutingPath(["block-1"], section_id="section-1")
+
+    routing_path_cache.set("section-1", None, ((1,), (), ()), routing_path)
+
+    assert routing_path_cache.get("section-1", None, ((1,), (), ())) is routing_path
+    assert routing_path_cache.hits == 1
+
+
+def test_get_returns_none_when_dependency_key_changes():
+    routing_path_cache = RoutingPathCache()
+    routing_path = RoutingPath(["block-1"], section_id="section-1")
+
+    routing_path_cache.set("section-1", None, ((1,), (), ()), routing_path)
+
+    assert routing_path_cache.get("section-1", None, ((2,), (), ())) is None
+
+
+def test_routing_paths_are_cached_per_list_item_id():
+    routing_path_cache = RoutingPathCache()
+    routing_path = RoutingPath(["block-1"], section_id="section-1", list_item_id="a")
+
+    routing_path_cache.set("section-1", "a", ((), (), ()), routing_path)
+
+    assert routing_path_cache.get("section-1", "a", ((), (), ())) is routing_path
+    assert routing_path_cache.get("section-1", "b", ((), (), ())) is None
+
+
+def test_clear():
+    routing_path_cache = RoutingPathCache()
+    routing_path_cache.set(
+        "section-1", None, ((), (), ()), RoutingPath([], section_id="section-1")
+    )
+
+    routing_path_cache.clear()
+
+    assert len(routing_path_cache) == 0
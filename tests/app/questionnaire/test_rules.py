@@ -1,4 +1,5 @@
 # pylint: disable=too-many-lines
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 from app.data_models.answer_store import Answer, AnswerStore
@@ -8,6 +9,8 @@ from app.questionnaire.questionnaire_schema import QuestionnaireSchema
 from app.questionnaire.relationship_location import RelationshipLocation
 from app.questionnaire.routing_path import RoutingPath
 from app.questionnaire.rules import (
+    CompiledWhenRule,
+    CompiledWhenRules,
     evaluate_goto,
     evaluate_rule,
     evaluate_skip_conditions,
@@ -1131,3 +1134,81 @@ class TestRules(AppContextTestCase):  # pylint: disable=too-many-public-methods
                 current_location=current_location,
             )
         )
+
+    def test_compiled_when_rule_casefolds_match_values_once(self):
+        compiled_rule = CompiledWhenRule(
+            {"id": "answer", "condition": "equals any", "values": ["Yes", "MAYBE"]}
+        )
+
+        self.assertEqual(compiled_rule.match_value, ["yes", "maybe"])
+
+    def test_compiled_when_rule_parses_literal_date(self):
+        compiled_rule = CompiledWhenRule(
+            {
+                "id": "date-answer",
+                "condition": "less than",
+                "date_comparison": {"value": "2019-03-31", "offset_by": {"days": 1}},
+            }
+        )
+
+        self.assertEqual(compiled_rule.date_match_value, datetime(2019, 4, 1))
+
+    def test_compiled_when_rule_does_not_parse_now(self):
+        compiled_rule = CompiledWhenRule(
+            {
+                "id": "date-answer",
+                "condition": "less than",
+                "date_comparison": {"value": "now"},
+            }
+        )
+
+        self.assertIsNone(compiled_rule.date_match_value)
+
+    def test_compiled_when_rules_evaluate(self):
+        answer_store = AnswerStore()
+        answer_store.add_or_update(Answer(answer_id="my_answer", value="Yes"))
+        answer_store.add_or_update(Answer(answer_id="date-answer", value="2019-03-30"))
+
+        compiled_when_rules = CompiledWhenRules(
+            [
+                {"id": "my_answer", "condition": "equals", "value": "YES"},
+                {
+                    "id": "date-answer",
+                    "condition": "less than",
+                    "date_comparison": {"value": "2019-03-31"},
+                },
+            ]
+        )
+
+        self.assertTrue(
+            compiled_when_rules.evaluate(
+                schema=get_schema(),
+                metadata={},
+                answer_store=answer_store,
+                list_store=ListStore(),
+            )
+        )
+
+        answer_store.add_or_update(Answer(answer_id="date-answer", value="2019-04-01"))
+
+        self.assertFalse(
+            compiled_when_rules.evaluate(
+                schema=get_schema(),
+                metadata={},
+                answer_store=answer_store,
+                list_store=ListStore(),
+            )
+        )
+
+    def test_compiled_when_rules_invalid_rule_raises(self):
+        compiled_when_rules = CompiledWhenRules([{"condition": "equals"}])
+
+        with self.assertRaises(Exception) as exception:
+            compiled_when_rules.evaluate(
+                schema=get_schema(),
+                metadata={},
+                answer_store=AnswerStore(),
+                list_store=ListStore(),
+            )
+
+        self.assertEqual(str(exception.exception), "The when rule is invalid")
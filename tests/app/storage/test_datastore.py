@@ -2,6 +2,7 @@ import contextlib
 from datetime import datetime
 
 import mock
+from flask import current_app
 from google.api_core import exceptions
 from google.cloud import datastore as google_datastore
 
@@ -41,6 +42,27 @@ class TestDatastore(AppContextTestCase):
         returned_model = self.ds.get(QuestionnaireState, "someuser")
         self.assertFalse(returned_model)
 
+    def test_get_many(self):
+        model = QuestionnaireState("someuser", "data", 1)
+        self.mock_client.key.side_effect = lambda *path_args: google_datastore.Key(
+            *path_args, project="local"
+        )
+        m_entity = google_datastore.Entity(
+            key=self.mock_client.key(
+                current_app.config["EQ_QUESTIONNAIRE_STATE_TABLE_NAME"], "someuser"
+            )
+        )
+        m_entity.update(QuestionnaireStateSchema().dump(model))
+        self.mock_client.get_multi.return_value = [m_entity]
+
+        returned_models = self.ds.get_many(
+            [(QuestionnaireState, "missing"), (QuestionnaireState, "someuser")]
+        )
+
+        self.mock_client.get_multi.assert_called_once()
+        self.assertIsNone(returned_models[0])
+        self.assertEqual(returned_models[1].user_id, model.user_id)
+
     def test_put(self):
         model = QuestionnaireState("someuser", "data", 1)
 
@@ -68,7 +90,7 @@ class TestDatastore(AppContextTestCase):
         self.ds.put(model)
         put_call_args = mock_entity.call_args.kwargs
         self.assertIn("exclude_from_indexes", put_call_args)
-        self.assertEqual(len(put_call_args["exclude_from_indexes"]), 5)
+        self.assertEqual(len(put_call_args["exclude_from_indexes"]), 7)
 
     @mock.patch("app.storage.datastore.Entity")
     def test_put_with_index(self, mock_entity):
@@ -88,6 +110,39 @@ class TestDatastore(AppContextTestCase):
 
         self.mock_client.delete.assert_called_once_with(m_key)
 
+    def test_put_many(self):
+        models = [QuestionnaireState(f"user{index}", "data", 1) for index in range(501)]
+
+        self.ds.put_many(models)
+
+        self.assertEqual(self.mock_client.put_multi.call_count, 2)
+        put_entities = [
+            entity
+            for call in self.mock_client.put_multi.call_args_list
+            for entity in call[0][0]
+        ]
+        self.assertEqual(
+            [entity["user_id"] for entity in put_entities],
+            [model.user_id for model in models],
+        )
+
+    def test_put_many_without_overwrite(self):
+        with self.assertRaises(NotImplementedError):
+            self.ds.put_many([QuestionnaireState("someuser", "data", 1)], False)
+
+    def test_delete_many(self):
+        models = [
+            QuestionnaireState("someuser", "data", 1),
+            EQSession("session-id", "someuser", datetime.now(), "session-data"),
+        ]
+        self.ds.delete_many(models)
+
+        self.assertEqual(
+            [call[0][1] for call in self.mock_client.key.call_args_list],
+            ["someuser", "session-id"],
+        )
+        self.mock_client.delete_multi.assert_called_once()
+
     def test_retry(self):
         model = QuestionnaireState("someuser", "data", 1)
 
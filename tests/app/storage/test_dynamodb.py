@@ -1,13 +1,18 @@
+from datetime import datetime, timedelta
+
 import boto3
+from dateutil.tz import tzutc
 from flask import current_app
 from moto import mock_dynamodb2
 
-from app.data_models.app_models import QuestionnaireState
+from app.data_models.app_models import EQSession, QuestionnaireState
 from app.storage.dynamodb import Dynamodb
 from app.storage.errors import ItemAlreadyExistsError
 from app.storage.storage import StorageModel
 from tests.app.app_context_test_case import AppContextTestCase
 
+EXPIRES_AT = datetime.now(tz=tzutc()).replace(microsecond=0) + timedelta(minutes=1)
+
 
 class TestDynamo(AppContextTestCase):
     def setUp(self):
@@ -60,6 +65,48 @@ class TestDynamo(AppContextTestCase):
         self.ddb.delete(model)
         self._assert_item(None)
 
+    def test_get_many(self):
+        self._put_item(1)
+        eq_session = EQSession("sessionid", "someuser", EXPIRES_AT, "somedata")
+        self.ddb.put(eq_session)
+
+        items = self.ddb.get_many(
+            [
+                (QuestionnaireState, "someuser"),
+                (EQSession, "sessionid"),
+                (QuestionnaireState, "missing"),
+                (QuestionnaireState, "someuser"),
+            ]
+        )
+
+        self.assertEqual(items[0].version, 1)
+        self.assertEqual(items[1].user_id, "someuser")
+        self.assertIsNone(items[2])
+        self.assertEqual(items[3].version, 1)
+
+    def test_put_many_and_delete_many(self):
+        eq_session = EQSession("sessionid", "someuser", EXPIRES_AT, "somedata")
+        models = [
+            QuestionnaireState("someuser", "data", 1),
+            eq_session,
+            QuestionnaireState("someuser", "data", 2),
+        ]
+
+        self.ddb.put_many(models)
+
+        self._assert_item(2)
+        self.assertEqual(self.ddb.get(EQSession, "sessionid").user_id, "someuser")
+
+        self.ddb.delete_many(models)
+
+        self._assert_item(None)
+        self.assertIsNone(self.ddb.get(EQSession, "sessionid"))
+
+    def test_put_many_without_overwrite(self):
+        self._put_item(1)
+        with self.assertRaises(ItemAlreadyExistsError):
+            self.ddb.put_many([QuestionnaireState("someuser", "data", 2)], False)
+
     def _assert_item(self, version):
         item = self.ddb.get(QuestionnaireState, "someuser")
         actual_version = item.version if item else None
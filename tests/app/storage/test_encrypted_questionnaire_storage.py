@@ -1,7 +1,10 @@
+from unittest.mock import MagicMock, patch
+
 from flask import current_app
 
 from app.data_models import QuestionnaireStore
-from app.data_models.app_models import QuestionnaireState
+from app.data_models.answer import Answer
+from app.data_models.app_models import QuestionnaireState, QuestionnaireStateDelta
 from app.storage.encrypted_questionnaire_storage import EncryptedQuestionnaireStorage
 from app.storage.storage_encryption import StorageEncryption
 from tests.app.app_context_test_case import AppContextTestCase
@@ -37,7 +40,14 @@ class TestEncryptedQuestionnaireStorage(AppContextTestCase):
         encrypted.save(data)
         # check we can decrypt the data
         self.assertEqual(
-            ("test", QuestionnaireStore.LATEST_VERSION), encrypted.get_user_data()
+            ("test", QuestionnaireStore.VERBOSE_VERSION), encrypted.get_user_data()
+        )
+
+    def test_store_and_get_version(self):
+        self.storage.save("test", version=QuestionnaireStore.LATEST_VERSION)
+
+        self.assertEqual(
+            ("test", QuestionnaireStore.LATEST_VERSION), self.storage.get_user_data()
         )
 
     def test_store(self):
@@ -51,16 +61,228 @@ class TestEncryptedQuestionnaireStorage(AppContextTestCase):
         data = "test"
         self.storage.save(data)
         self.assertEqual(
-            (data, QuestionnaireStore.LATEST_VERSION), self.storage.get_user_data()
+            (data, QuestionnaireStore.VERBOSE_VERSION), self.storage.get_user_data()
         )
 
     def test_delete(self):
         data = "test"
         self.storage.save(data)
         self.assertEqual(
-            (data, QuestionnaireStore.LATEST_VERSION), self.storage.get_user_data()
+            (data, QuestionnaireStore.VERBOSE_VERSION), self.storage.get_user_data()
         )
         self.storage.delete()
         self.assertEqual(
             (None, None), self.storage.get_user_data()
         )  # pylint: disable=protected-access
+
+    def test_delete_does_not_read_state(self):
+        self.storage.save("test")
+
+        with patch.object(
+            current_app.eq["storage"], "get", wraps=current_app.eq["storage"].get
+        ) as get, patch.object(
+            current_app.eq["storage"],
+            "delete_many",
+            wraps=current_app.eq["storage"].delete_many,
+        ) as delete_many:
+            self.storage.delete()
+
+        get.assert_not_called()
+        delete_many.assert_called_once()
+        self.assertIsNone(current_app.eq["storage"].get(QuestionnaireState, "user_id"))
+
+    def test_save_skips_unchanged_data(self):
+        self.storage.save("test")
+
+        with patch.object(current_app.eq["storage"], "put") as put:
+            self.storage.save("test")
+            put.assert_not_called()
+
+            self.storage.save("changed")
+            put.assert_called_once()
+
+    def test_save_skips_data_unchanged_since_get(self):
+        self.storage.save("test")
+        storage = EncryptedQuestionnaireStorage("user_id", "user_ik", "pepper")
+        storage.get_user_data()
+
+        with patch.object(current_app.eq["storage"], "put") as put:
+            storage.save("test")
+            put.assert_not_called()
+
+    def test_get_uses_prefetched_questionnaire_state_once(self):
+        self.storage.save("test")
+        questionnaire_state = current_app.eq["storage"].get(
+            QuestionnaireState, "user_id"
+        )
+        storage = EncryptedQuestionnaireStorage(
+            "user_id", "user_ik", "pepper", questionnaire_state=questionnaire_state
+        )
+
+        with patch.object(
+            current_app.eq["storage"], "get", wraps=current_app.eq["storage"].get
+        ) as get:
+            self.assertEqual(
+                storage.get_user_data(), ("test", QuestionnaireStore.VERBOSE_VERSION)
+            )
+            get.assert_not_called()
+
+            storage.get_user_data()
+            get.assert_called_once()
+
+
+class TestEncryptedQuestionnaireStorageWithDeltas(AppContextTestCase):
+    setting_overrides = {"EQ_QUESTIONNAIRE_STATE_DELTA_COMPACTION_THRESHOLD": 2}
+
+    def setUp(self):
+        super().setUp()
+        self.storage = self._get_storage()
+
+    @staticmethod
+    def _get_storage():
+        return EncryptedQuestionnaireStorage(
+            "user_id", "user_ik", "pepper", deltas_enabled=True
+        )
+
+    @staticmethod
+    def _serialize(answers, version=None):
+        questionnaire_store = QuestionnaireStore(
+            MagicMock(get_user_data=MagicMock(return_value=(None, None)))
+        )
+        for answer_id, value in answers.items():
+            questionnaire_store.answer_store.add_or_update(Answer(answer_id, value))
+        return questionnaire_store.serialize(version)
+
+    def _get_answers(self):
+        questionnaire_store = QuestionnaireStore(self._get_storage())
+        return {
+            answer.answer_id: answer.value
+            for answer in questionnaire_store.answer_store
+        }
+
+    def test_changes_are_written_as_deltas(self):
+        self.storage.save(self._serialize({"first": 1}))
+
+        with patch.object(
+            current_app.eq["storage"], "put", wraps=current_app.eq["storage"].put
+        ) as put:
+            self.storage.save(self._serialize({"first": 1, "second": 2}))
+
+            self.assertIsInstance(put.call_args[0][0], QuestionnaireStateDelta)
+
+        self.assertEqual(self._get_answers(), {"first": 1, "second": 2})
+
+    def test_deltas_are_applied_to_either_snapshot_version(self):
+        for version in (
+            QuestionnaireStore.VERBOSE_VERSION,
+            QuestionnaireStore.LATEST_VERSION,
+        ):
+            with self.subTest(version=version):
+                storage = self._get_storage()
+                storage.delete()
+                storage.save(self._serialize({"first": 1}, version), version)
+                storage.save(
+                    self._serialize({"first": 1, "second": 2}, version), version
+                )
+
+                self.assertEqual(
+                    current_app.eq["storage"]
+                    .get(QuestionnaireState, "user_id")
+                    .version,
+                    version,
+                )
+                self.assertEqual(self._get_answers(), {"first": 1, "second": 2})
+
+    def test_deltas_are_read_when_disabled(self):
+        self.storage.save(self._serialize({"first": 1}))
+        self.storage.save(self._serialize({"first": 1, "second": 2}))
+
+        storage = EncryptedQuestionnaireStorage(
+            "user_id", "user_ik", "pepper", deltas_enabled=False
+        )
+        questionnaire_store = QuestionnaireStore(storage)
+
+        self.assertEqual(
+            {
+                answer.answer_id: answer.value
+                for answer in questionnaire_store.answer_store
+            },
+            {"first": 1, "second": 2},
+        )
+
+    def test_save_when_disabled_writes_snapshot_and_deletes_deltas(self):
+        self.storage.save(self._serialize({"first": 1}))
+        self.storage.save(self._serialize({"first": 2}))
+        delta_key = (
+            current_app.eq["storage"].get(QuestionnaireState, "user_id").delta_key
+        )
+
+        storage = EncryptedQuestionnaireStorage(
+            "user_id", "user_ik", "pepper", deltas_enabled=False
+        )
+        storage.get_user_data()
+        storage.save(self._serialize({"first": 3}))
+
+        questionnaire_state = current_app.eq["storage"].get(
+            QuestionnaireState, "user_id"
+        )
+        self.assertIsNone(questionnaire_state.delta_key)
+        self.assertIsNone(
+            current_app.eq["storage"].get(
+                QuestionnaireStateDelta, f"user_id:{delta_key}:1"
+            )
+        )
+        self.assertEqual(self._get_answers(), {"first": 3})
+
+    def test_deltas_are_compacted(self):
+        self.storage.save(self._serialize({"first": 1}))
+        self.storage.save(self._serialize({"first": 2}))
+        self.storage.save(self._serialize({"first": 3}))
+
+        with patch.object(
+            current_app.eq["storage"], "put", wraps=current_app.eq["storage"].put
+        ) as put:
+            self.storage.save(self._serialize({"first": 4}))
+
+            questionnaire_state = put.call_args[0][0]
+            self.assertIsInstance(questionnaire_state, QuestionnaireState)
+            self.assertEqual(questionnaire_state.delta_sequence, 2)
+
+        self.assertEqual(self._get_answers(), {"first": 4})
+        self.assertIsNone(
+            current_app.eq["storage"].get(
+                QuestionnaireStateDelta,
+                f"user_id:{questionnaire_state.delta_key}:1",
+            )
+        )
+
+    def test_delete_removes_state_and_deltas_in_one_batch(self):
+        self.storage.save(self._serialize({"first": 1}))
+        self.storage.save(self._serialize({"first": 2}))
+
+        with patch.object(
+            current_app.eq["storage"],
+            "delete_many",
+            wraps=current_app.eq["storage"].delete_many,
+        ) as delete_many:
+            self.storage.delete()
+
+            models = delete_many.call_args[0][0]
+
+        delete_many.assert_called_once()
+        self.assertEqual(
+            [type(model) for model in models],
+            [QuestionnaireState, QuestionnaireStateDelta],
+        )
+        self.assertIsNone(
+            current_app.eq["storage"].get(QuestionnaireStateDelta, models[1].delta_id)
+        )
+
+    def test_deltas_are_not_read_after_delete(self):
+        self.storage.save(self._serialize({"first": 1}))
+        self.storage.save(self._serialize({"first": 2}))
+
+        self.storage.delete()
+        self.storage.save(self._serialize({"second": 1}))
+
+        self.assertEqual(self._get_answers(), {"second": 1})
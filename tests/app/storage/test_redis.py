@@ -9,7 +9,7 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.data_models.app_models import EQSession, UsedJtiClaim
 from app.storage.errors import ItemAlreadyExistsError
-from app.storage.redis import Redis
+from app.storage.redis import InstrumentedBlockingConnectionPool, Redis
 from app.storage.storage import StorageModel
 from tests.app.app_context_test_case import AppContextTestCase
 
@@ -160,6 +160,49 @@ class TestRedis(AppContextTestCase):
         expires_in = self.mock_client.ttl(eq_session.eq_session_id)
         assert expires_in == -1
 
+    def test_pipelined_puts_are_written_on_exit(self):
+        # Given
+        jti = UsedJtiClaim(str(uuid.uuid4()), EXPIRES_AT)
+        eq_session = EQSession(
+            eq_session_id="sessionid",
+            user_id="someuser",
+            session_data="somedata",
+            expires_at=EXPIRES_AT,
+        )
+
+        # When
+        with self.redis.pipelined():
+            self.redis.put(jti, overwrite=False)
+            self.redis.put(eq_session)
+
+            # Then
+            self.assertIsNone(self.redis.get(EQSession, eq_session.eq_session_id))
+
+        self.assertEqual(self.mock_client.get(jti.jti_claim), b"")
+        self.assertIsNotNone(self.redis.get(EQSession, eq_session.eq_session_id))
+
+    def test_pipelined_duplicate_put_jti_fails_on_exit(self):
+        jti = UsedJtiClaim(str(uuid.uuid4()), EXPIRES_AT)
+        self.redis.put(jti, overwrite=False)
+
+        with self.assertRaises(ItemAlreadyExistsError):
+            with self.redis.pipelined():
+                self.redis.put(jti, overwrite=False)
+
+    def test_nested_pipelined_puts_are_written_by_outermost_block(self):
+        jti = UsedJtiClaim(str(uuid.uuid4()), EXPIRES_AT)
+
+        with self.redis.pipelined():
+            with self.redis.pipelined():
+                self.redis.put(jti, overwrite=False)
+
+            self.assertIsNone(self.mock_client.get(jti.jti_claim))
+
+        self.assertEqual(self.mock_client.get(jti.jti_claim), b"")
+
+    def test_pool_usage_not_instrumented(self):
+        self.assertEqual(self.redis.pool_usage(), {})
+
 
 class TestRedisConnectionErrors(AppContextTestCase):
     def setUp(self):
@@ -197,6 +240,70 @@ class TestRedisConnectionErrors(AppContextTestCase):
         # Then
         assert self.redis.client.get.call_count == 2
 
+    def test_get_many(self):
+        # Given
+        eq_session = EQSession(
+            eq_session_id="sessionid",
+            user_id="someuser",
+            session_data="somedata",
+            expires_at=EXPIRES_AT,
+        )
+        self.redis.put(eq_session)
+
+        # When
+        stored_data = self.redis.get_many(
+            [(EQSession, "missing"), (EQSession, eq_session.eq_session_id)]
+        )
+
+        # Then
+        self.assertIsNone(stored_data[0])
+        self.assertEqual(stored_data[1].user_id, eq_session.user_id)
+
+    def test_get_many_handles_connection_error_once(self):
+        # Given
+        self.redis.client.mget = mock.Mock(side_effect=[RedisConnectionError, [None]])
+
+        # When
+        stored_data = self.redis.get_many([(EQSession, "sessionid")])
+
+        # Then
+        self.assertEqual(stored_data, [None])
+        assert self.redis.client.mget.call_count == 2
+
+    def test_put_many_and_delete_many(self):
+        # Given
+        jti = UsedJtiClaim(str(uuid.uuid4()), EXPIRES_AT)
+        eq_session = EQSession(
+            eq_session_id="sessionid",
+            user_id="someuser",
+            session_data="somedata",
+            expires_at=EXPIRES_AT,
+        )
+
+        # When
+        self.redis.put_many([jti, eq_session])
+
+        # Then
+        self.assertEqual(self.mock_client.get(jti.jti_claim), b"")
+        self.assertEqual(
+            self.redis.get(EQSession, eq_session.eq_session_id).user_id, "someuser"
+        )
+
+        # When
+        deleted = self.redis.delete_many([jti, eq_session])
+
+        # Then
+        self.assertEqual(deleted, 2)
+        self.assertIsNone(self.redis.get(EQSession, eq_session.eq_session_id))
+
+    def test_duplicate_put_many_jti_fails(self):
+        jti = UsedJtiClaim(str(uuid.uuid4()), EXPIRES_AT)
+
+        self.redis.put(jti, overwrite=False)
+
+        with self.assertRaises(ItemAlreadyExistsError):
+            self.redis.put_many([jti], overwrite=False)
+
     def test_delete_handles_connection_error_once(self):
         # Given
         used_at = datetime.now()
@@ -213,3 +320,94 @@ class TestRedisConnectionErrors(AppContextTestCase):
 
         # Then
         assert self.redis.client.delete.call_count == 2
+
+    def test_retries_back_off_exponentially(self):
+        # Given
+        redis = Redis(self.mock_client, max_retries=3, retry_backoff_seconds=0.1)
+        redis.client.get = mock.Mock(
+            side_effect=[RedisConnectionError, RedisConnectionError, None]
+        )
+
+        # When
+        with mock.patch("app.storage.redis.time.sleep") as sleep:
+            redis.get(EQSession, "sessionid")
+
+        # Then
+        self.assertEqual(sleep.call_args_list, [mock.call(0.1), mock.call(0.2)])
+        assert redis.client.get.call_count == 3
+
+
+class TestInstrumentedBlockingConnectionPool(AppContextTestCase):
+    @staticmethod
+    def _get_pool(max_connections=2, connection_class=fakeredis.FakeConnection):
+        return InstrumentedBlockingConnectionPool(
+            max_connections=max_connections,
+            timeout=0,
+            connection_class=connection_class,
+            server=fakeredis.FakeServer(),
+        )
+
+    def test_usage_counts_connections(self):
+        pool = self._get_pool()
+
+        connection = pool.get_connection("get")
+        pool.get_connection("get")
+        pool.release(connection)
+
+        self.assertEqual(
+            pool.usage(),
+            {
+                "max_connections": 2,
+                "in_use_connections": 1,
+                "peak_in_use_connections": 2,
+                "exhausted_count": 0,
+            },
+        )
+
+    def test_usage_counts_exhaustion(self):
+        pool = self._get_pool(max_connections=1)
+        pool.get_connection("get")
+
+        with mock.patch("app.storage.redis.logger") as logger:
+            with self.assertRaises(RedisConnectionError):
+                pool.get_connection("get")
+
+        logger.warning.assert_called_once_with(
+            "redis connection pool exhausted", **pool.usage()
+        )
+        self.assertEqual(pool.usage()["exhausted_count"], 1)
+        self.assertEqual(pool.usage()["in_use_connections"], 1)
+
+    def test_failure_to_connect_is_not_exhaustion(self):
+        class UnreachableConnection(fakeredis.FakeConnection):
+            def connect(self):
+                raise RedisConnectionError("Error connecting")
+
+        pool = self._get_pool(connection_class=UnreachableConnection)
+
+        with self.assertRaises(RedisConnectionError):
+            pool.get_connection("get")
+
+        self.assertEqual(pool.usage()["exhausted_count"], 0)
+        self.assertEqual(pool.usage()["in_use_connections"], 0)
+
+    def test_redis_reports_pool_usage(self):
+        pool = self._get_pool()
+        redis = Redis(mock.Mock(connection_pool=pool))
+
+        self.assertEqual(redis.pool_usage(), pool.usage())
+
+
+class TestPoolUsageLogging(AppContextTestCase):
+    def test_pool_usage_is_logged_with_each_response(self):
+        with mock.patch("app.setup.logger") as logger:
+            self._app.test_client().get("/status")
+
+        response_log = next(
+            call for call in logger.info.call_args_list if call[0] == ("response",)
+        )
+        self.assertEqual(
+            response_log[1]["redis_pool"],
+            self._app.eq["ephemeral_storage"].pool_usage(),
+        )
+        self.assertIn("in_use_connections", response_log[1]["redis_pool"])
@@ -1,8 +1,9 @@
 from unittest import TestCase
 
 import simplejson as json
+from cryptography.exceptions import InvalidTag
 
-from app.storage.storage_encryption import StorageEncryption
+from app.storage.storage_encryption import StorageEncryption, storage_key_cache
 
 
 # pylint: disable=W0212
@@ -56,3 +57,59 @@ class TestStorageEncryption(TestCase):
     def test_no_pepper(self):
         with self.assertRaises(ValueError):
             self.encrypter = StorageEncryption("user_id", "user_ik", None)
+
+    def test_key_is_cached(self):
+        storage_key_cache.cache_clear()
+
+        key1 = StorageEncryption("user1", "user_ik_1", "pepper").key
+        key2 = StorageEncryption("user1", "user_ik_1", "pepper").key
+
+        self.assertIs(key1, key2)
+        self.assertEqual((storage_key_cache.hits, storage_key_cache.misses), (1, 1))
+
+    def test_key_cache_does_not_hold_user_ik(self):
+        storage_key_cache.cache_clear()
+
+        StorageEncryption("user1", "user_ik_1", "pepper")
+
+        self.assertNotIn(b"user_ik_1", b"".join(storage_key_cache._entries))
+
+    def test_aes_gcm_envelope_encryption_decryption(self):
+        encrypter = StorageEncryption(
+            "user_id", "user_ik", "pepper", use_aes_gcm_envelope=True
+        )
+        data = {"data1": "Test Data One", "data2": "Test Data Two"}
+        encrypted_data = encrypter.encrypt_data(data)
+        self.assertIsInstance(encrypted_data, str)
+        self.assertNotIn(".", encrypted_data)
+
+        decrypted_data = json.loads(encrypter.decrypt_data(encrypted_data))
+        self.assertEqual(data, decrypted_data)
+
+    def test_aes_gcm_envelope_decrypts_jwe(self):
+        encrypter = StorageEncryption(
+            "user_id", "user_ik", "pepper", use_aes_gcm_envelope=True
+        )
+        encrypted_data = self.encrypter.encrypt_data(b"data")
+
+        self.assertEqual(encrypter.decrypt_data(encrypted_data), b"data")
+
+    def test_jwe_decrypts_aes_gcm_envelope(self):
+        encrypter = StorageEncryption(
+            "user_id", "user_ik", "pepper", use_aes_gcm_envelope=True
+        )
+        encrypted_data = encrypter.encrypt_data(b"data")
+
+        self.assertEqual(self.encrypter.decrypt_data(encrypted_data), b"data")
+
+    def test_aes_gcm_envelope_with_wrong_key_fails(self):
+        encrypter = StorageEncryption(
+            "user_id", "user_ik", "pepper", use_aes_gcm_envelope=True
+        )
+        other_encrypter = StorageEncryption(
+            "user_id", "other_user_ik", "pepper", use_aes_gcm_envelope=True
+        )
+        encrypted_data = encrypter.encrypt_data(b"data")
+
+        with self.assertRaises(InvalidTag):
+            other_encrypter.decrypt_data(encrypted_data)
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from dateutil.tz import tzutc
+from flask import current_app, g
+from flask import session as cookie_session
+
+from app.data_models import QuestionnaireStore
+from app.data_models.session_data import SessionData
+from app.data_models.session_store import SessionStore
+from app.globals import get_questionnaire_store, get_session_store, session_user_ids
+from app.settings import EQ_SESSION_ID, USER_IK
+from app.storage.encrypted_questionnaire_storage import EncryptedQuestionnaireStorage
+from tests.app.app_context_test_case import AppContextTestCase
+
+
+class TestGlobals(AppContextTestCase):
+    setting_overrides = {"EQ_STORAGE_PREFETCH_ENABLED": True}
+
+    def setUp(self):
+        super().setUp()
+        self.pepper = current_app.eq["secret_store"].get_secret_by_name(
+            "EQ_SERVER_SIDE_STORAGE_ENCRYPTION_USER_PEPPER"
+        )
+        session_data = SessionData(
+            tx_id="tx_id",
+            schema_name="some_schema_name",
+            response_id="response_id",
+            period_str="period_str",
+            language_code=None,
+            launch_language_code=None,
+            survey_url=None,
+            ru_name="ru_name",
+            ru_ref="ru_ref",
+            case_id="case_id",
+            questionnaire_id="questionnaire_id",
+        )
+        SessionStore("user_ik", self.pepper).create(
+            "eq_session_id",
+            "user_id",
+            session_data,
+            datetime.now(tzutc()) + timedelta(seconds=5),
+        ).save()
+
+        questionnaire_store = QuestionnaireStore(
+            EncryptedQuestionnaireStorage("user_id", "user_ik", self.pepper)
+        )
+        questionnaire_store.set_metadata({"tx_id": "tx_id"})
+        questionnaire_store.save()
+
+    def tearDown(self):
+        session_user_ids.cache_clear()
+        super().tearDown()
+
+    @staticmethod
+    def _set_cookie_session(user_id="user_id"):
+        cookie_session[USER_IK] = "user_ik"
+        cookie_session[EQ_SESSION_ID] = "eq_session_id"
+        if user_id:
+            session_user_ids.set("eq_session_id", user_id)
+
+    def test_get_session_store_prefetches_questionnaire_state(self):
+        with self.app_request_context("/status"):
+            self._set_cookie_session()
+
+            with patch.object(
+                current_app.eq["storage"],
+                "get_many",
+                wraps=current_app.eq["storage"].get_many,
+            ) as get_many, patch.object(
+                current_app.eq["storage"], "get", wraps=current_app.eq["storage"].get
+            ) as get:
+                session_store = get_session_store()
+                questionnaire_store = get_questionnaire_store("user_id", "user_ik")
+
+                get_many.assert_called_once()
+                get.assert_not_called()
+
+            self.assertEqual(session_store.user_id, "user_id")
+            self.assertEqual(questionnaire_store.metadata["tx_id"], "tx_id")
+
+    def test_get_session_store_without_known_user_id_does_not_prefetch(self):
+        with self.app_request_context("/status"):
+            self._set_cookie_session(user_id=None)
+
+            with patch.object(current_app.eq["storage"], "get_many") as get_many:
+                session_store = get_session_store()
+                get_many.assert_not_called()
+
+            self.assertEqual(session_store.user_id, "user_id")
+            self.assertEqual(session_user_ids.get("eq_session_id"), "user_id")
+
+    def test_session_user_id_is_not_cached_when_prefetch_disabled(self):
+        with self.app_request_context("/status"), patch.dict(
+            current_app.config, {"EQ_STORAGE_PREFETCH_ENABLED": False}
+        ):
+            self._set_cookie_session(user_id=None)
+
+            session_store = get_session_store()
+
+            self.assertEqual(session_store.user_id, "user_id")
+            self.assertIsNone(session_user_ids.get("eq_session_id"))
+
+    def test_user_id_is_not_stored_in_cookie(self):
+        with self.app_request_context("/status"):
+            self._set_cookie_session()
+
+            get_session_store()
+
+            self.assertNotIn("user_id", cookie_session.values())
+
+    def test_prefetched_questionnaire_state_not_used_for_another_user(self):
+        with self.app_request_context("/status"):
+            self._set_cookie_session(user_id="another_user_id")
+
+            get_session_store()
+
+            self.assertIsNone(g.get("_prefetched_questionnaire_state"))
@@ -45,3 +45,17 @@ class TestSettings(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+    def test_parse_optional_list(self):
+        self.assertEqual(
+            frozenset({"census_household_gb_eng", "census_individual_gb_eng"}),
+            settings.parse_optional_list(
+                "census_household_gb_eng, census_individual_gb_eng,"
+            ),
+        )
+
+    def test_parse_optional_list_without_restriction(self):
+        self.assertIsNone(settings.parse_optional_list("*"))
+
+    def test_parse_optional_list_empty(self):
+        self.assertEqual(frozenset(), settings.parse_optional_list(""))
@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+import pytest
+
+from app.utilities.bloom_filter import BloomFilter
+
+
+def test_might_contain_added_values():
+    bloom_filter = BloomFilter(capacity=100, error_rate=0.001)
+    values = [str(uuid4()) for _ in range(100)]
+
+    for value in values:
+        bloom_filter.add(value)
+
+    assert all(bloom_filter.might_contain(value) for value in values)
+
+
+def test_false_positives_within_error_rate():
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    for _ in range(1000):
+        bloom_filter.add(str(uuid4()))
+
+    false_positives = sum(
+        bloom_filter.might_contain(str(uuid4())) for _ in range(10000)
+    )
+
+    assert false_positives < 300
+
+
+def test_empty_filter_contains_nothing():
+    bloom_filter = BloomFilter(capacity=10, error_rate=0.01)
+
+    assert not bloom_filter.might_contain("value")
+
+
+@pytest.mark.parametrize(
+    "capacity, error_rate", [(0, 0.01), (10, 0), (10, 1)], ids=repr
+)
+def test_invalid_arguments(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
+
+
+def test_is_full_once_capacity_values_added():
+    bloom_filter = BloomFilter(capacity=2, error_rate=0.01)
+
+    bloom_filter.add("first")
+    assert not bloom_filter.is_full
+
+    bloom_filter.add("second")
+    assert bloom_filter.is_full
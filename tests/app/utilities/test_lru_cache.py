@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from app.utilities.lru_cache import LRUCache
+
+
+def test_entries_do_not_expire():
+    cache = LRUCache(max_size=10)
+
+    with patch("app.utilities.lru_cache.time.monotonic", return_value=0):
+        cache.set("key", "value")
+
+    with patch("app.utilities.lru_cache.time.monotonic", return_value=10 ** 9):
+        assert cache.get("key") == "value"
+
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_size=2)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    cache.get("key1")
+    cache.set("key3", "value3")
+
+    assert len(cache) == 2
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") is None
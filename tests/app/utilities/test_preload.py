@@ -0,0 +1,34 @@
+import gc
+from unittest.mock import Mock, patch
+
+from app.utilities.preload import get_memory_usage, preload_questionnaire_schemas
+
+
+def test_get_memory_usage(tmp_path, monkeypatch):
+    statm_path = tmp_path / "statm"
+    statm_path.write_text("1000 200 50 10 0 100 0")
+    monkeypatch.setattr("app.utilities.preload.PROC_STATM_PATH", str(statm_path))
+    monkeypatch.setattr("app.utilities.preload.os.sysconf", Mock(return_value=4096))
+
+    assert get_memory_usage() == {"resident_kb": 800, "shared_kb": 200}
+
+
+def test_get_memory_usage_without_proc(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.utilities.preload.PROC_STATM_PATH", str(tmp_path / "missing")
+    )
+
+    assert get_memory_usage() == {}
+
+
+@patch("app.utilities.preload.cache_questionnaire_schemas")
+def test_preload_questionnaire_schemas_freezes_objects(
+    mock_cache_questionnaire_schemas,
+):
+    try:
+        preload_questionnaire_schemas()
+
+        mock_cache_questionnaire_schemas.assert_called_once()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -1,3 +1,4 @@
+import inspect
 import os
 from unittest.mock import Mock, patch
 
@@ -5,18 +6,25 @@ import pytest
 import responses
 from werkzeug.exceptions import NotFound
 
-from app.questionnaire import QuestionnaireSchema
+from app.questionnaire import QuestionnaireSchema, rules
 from app.setup import create_app
 from app.utilities.schema import (
+    _load_schema_artifact,
+    _load_schema_file,
     _load_schema_from_name,
+    build_schema_artifact,
     cache_questionnaire_schemas,
     get_allowed_languages,
+    get_schema_artifact_layout,
+    get_schema_artifact_path,
     get_schema_list,
     get_schema_name_from_census_params,
     get_schema_path_map,
     load_schema_from_metadata,
     load_schema_from_name,
     load_schema_from_url,
+    schema_url_cache,
+    warm_questionnaire_schemas,
 )
 
 TEST_SCHEMA_URL = "http://test.domain/schema.json"
@@ -140,9 +148,35 @@ def test_schema_cache_on_app_start_up():
     assert cache_info.hits == total_schemas
 
 
+def test_cache_questionnaire_schemas_with_schema_names():
+    _load_schema_from_name.cache_clear()
+
+    cache_questionnaire_schemas(["test_language", "test_textfield"])
+
+    # test_language exists in en, cy and ga
+    assert _load_schema_from_name.cache_info().currsize == 4
+
+
+@patch("app.utilities.schema.EQ_SCHEMA_WARMUP_NAMES", frozenset({"test_textfield"}))
+def test_cache_questionnaire_schemas_uses_warmup_allow_list():
+    _load_schema_from_name.cache_clear()
+
+    cache_questionnaire_schemas()
+
+    assert _load_schema_from_name.cache_info().currsize == 1
+
+
+def test_warm_questionnaire_schemas():
+    _load_schema_from_name.cache_clear()
+
+    warm_questionnaire_schemas(["test_textfield"]).join(10)
+
+    assert _load_schema_from_name.cache_info().currsize == 1
+
+
 @responses.activate
 def test_load_schema_from_url_200():
-    load_schema_from_url.cache_clear()
+    schema_url_cache.cache_clear()
 
     mock_schema = QuestionnaireSchema({}, language_code="cy")
     responses.add(responses.GET, TEST_SCHEMA_URL, json=mock_schema.json, status=200)
@@ -154,7 +188,7 @@ def test_load_schema_from_url_200():
 
 @responses.activate
 def test_load_schema_from_url_404():
-    load_schema_from_url.cache_clear()
+    schema_url_cache.cache_clear()
 
     mock_schema = QuestionnaireSchema({})
     responses.add(responses.GET, TEST_SCHEMA_URL, json=mock_schema.json, status=404)
@@ -165,7 +199,7 @@ def test_load_schema_from_url_404():
 
 @responses.activate
 def test_load_schema_from_metadata_with_survey_url():
-    load_schema_from_url.cache_clear()
+    schema_url_cache.cache_clear()
 
     metadata = {"survey_url": TEST_SCHEMA_URL, "language_code": "cy"}
     mock_schema = QuestionnaireSchema({}, language_code="cy")
@@ -174,3 +208,75 @@ def test_load_schema_from_metadata_with_survey_url():
 
     assert loaded_schema.json == mock_schema.json
     assert loaded_schema.language_code == mock_schema.language_code
+
+
+def test_load_schema_artifact(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.utilities.schema.SCHEMA_ARTIFACT_DIR", str(tmp_path))
+    schema_path = get_schema_path_map(include_test_schemas=True)["en"][
+        "test_skip_condition_block"
+    ]
+
+    artifact_path = build_schema_artifact(schema_path, "en")
+    assert artifact_path == get_schema_artifact_path(schema_path)
+    assert artifact_path.is_file()
+
+    schema = _load_schema_artifact("test_skip_condition_block", "en")
+    expected_schema = QuestionnaireSchema(
+        _load_schema_file("test_skip_condition_block", "en"), "en"
+    )
+
+    assert schema.json == expected_schema.json
+    assert schema.language_code == "en"
+
+    when_rules = schema.get_block("should-skip")["skip_conditions"][0]["when"]
+    assert schema.get_compiled_when_rules(when_rules).when_rules is when_rules
+
+
+def test_load_schema_artifact_missing(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.utilities.schema.SCHEMA_ARTIFACT_DIR", str(tmp_path))
+
+    assert _load_schema_artifact("test_skip_condition_block", "en") is None
+
+
+def test_load_schema_artifact_with_stale_checksum(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.utilities.schema.SCHEMA_ARTIFACT_DIR", str(tmp_path))
+    schema_path = get_schema_path_map(include_test_schemas=True)["en"][
+        "test_skip_condition_block"
+    ]
+    build_schema_artifact(schema_path, "en")
+
+    monkeypatch.setattr(
+        "app.utilities.schema.get_schema_checksum", Mock(return_value="changed")
+    )
+
+    assert _load_schema_artifact("test_skip_condition_block", "en") is None
+
+
+def test_load_schema_artifact_with_stale_layout(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.utilities.schema.SCHEMA_ARTIFACT_DIR", str(tmp_path))
+    schema_path = get_schema_path_map(include_test_schemas=True)["en"][
+        "test_skip_condition_block"
+    ]
+    build_schema_artifact(schema_path, "en")
+
+    monkeypatch.setattr(
+        "app.utilities.schema.get_schema_artifact_layout", Mock(return_value="changed")
+    )
+
+    assert _load_schema_artifact("test_skip_condition_block", "en") is None
+
+
+def test_schema_artifact_layout_covers_compiled_rules(monkeypatch):
+    get_source = inspect.getsource
+    layout = get_schema_artifact_layout()
+
+    monkeypatch.setattr(
+        "app.utilities.schema.inspect.getsource",
+        lambda module: get_source(module) + ("#" if module is rules else ""),
+    )
+    get_schema_artifact_layout.cache_clear()
+
+    try:
+        assert get_schema_artifact_layout() != layout
+    finally:
+        get_schema_artifact_layout.cache_clear()
@@ -0,0 +1,174 @@
+import threading
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import NotFound
+
+from app.utilities.schema_cache import SchemaCache
+
+
+def wait_for_refresh(cache, key):
+    future = cache._in_flight.get(key)  # pylint: disable=protected-access
+    if future:
+        future.exception()
+
+
+def test_get_caches_schema():
+    load_schema = Mock(side_effect=lambda url, language: f"{url}-{language}")
+    cache = SchemaCache(load_schema, max_size=10, ttl_seconds=60)
+
+    assert cache.get(("url", "en")) == "url-en"
+    assert cache.get(("url", "en")) == "url-en"
+    assert cache.get(("url", "cy")) == "url-cy"
+
+    assert load_schema.call_count == 2
+    assert cache.cache_info() == (1, 2, 0, 10, 2)
+
+
+def test_get_evicts_least_recently_used_schema():
+    load_schema = Mock(side_effect=lambda url: url)
+    cache = SchemaCache(load_schema, max_size=2, ttl_seconds=60)
+
+    cache.get(("first",))
+    cache.get(("second",))
+    cache.get(("first",))
+    cache.get(("third",))
+
+    assert cache.cache_info().currsize == 2
+
+    cache.get(("first",))
+    cache.get(("second",))
+
+    assert [call.args for call in load_schema.call_args_list] == [
+        ("first",),
+        ("second",),
+        ("third",),
+        ("second",),
+    ]
+
+
+@patch("app.utilities.schema_cache.time.monotonic")
+def test_get_reloads_expired_schema(mock_monotonic):
+    mock_monotonic.return_value = 0
+    load_schema = Mock(side_effect=["old", "new"])
+    cache = SchemaCache(load_schema, max_size=10, ttl_seconds=60)
+
+    assert cache.get(("url",)) == "old"
+
+    mock_monotonic.return_value = 61
+    assert cache.get(("url",)) == "new"
+    assert cache.cache_info().misses == 2
+
+
+@patch("app.utilities.schema_cache.time.monotonic")
+def test_get_serves_stale_schema_while_refreshing(mock_monotonic):
+    mock_monotonic.return_value = 0
+    load_schema = Mock(side_effect=["old", "new"])
+    cache = SchemaCache(load_schema, max_size=10, ttl_seconds=60, stale_seconds=60)
+
+    assert cache.get(("url",)) == "old"
+
+    mock_monotonic.return_value = 90
+    assert cache.get(("url",)) == "old"
+    wait_for_refresh(cache, ("url",))
+
+    assert cache.get(("url",)) == "new"
+    assert cache.cache_info() == (2, 1, 1, 10, 1)
+
+
+@patch("app.utilities.schema_cache.time.monotonic")
+def test_get_keeps_stale_schema_when_refresh_fails(mock_monotonic):
+    mock_monotonic.return_value = 0
+    load_schema = Mock(side_effect=["old", NotFound, NotFound])
+    cache = SchemaCache(load_schema, max_size=10, ttl_seconds=60, stale_seconds=60)
+
+    cache.get(("url",))
+
+    mock_monotonic.return_value = 90
+    assert cache.get(("url",)) == "old"
+    wait_for_refresh(cache, ("url",))
+
+    assert cache.get(("url",)) == "old"
+    wait_for_refresh(cache, ("url",))
+
+
+@patch("app.utilities.schema_cache.time.monotonic")
+def test_get_backs_off_refreshing_after_refresh_fails(mock_monotonic):
+    mock_monotonic.return_value = 0
+    load_schema = Mock(side_effect=["old", NotFound, "new"])
+    cache = SchemaCache(
+        load_schema,
+        max_size=10,
+        ttl_seconds=60,
+        stale_seconds=600,
+        refresh_backoff_seconds=30,
+    )
+
+    cache.get(("url",))
+
+    mock_monotonic.return_value = 90
+    cache.get(("url",))
+    wait_for_refresh(cache, ("url",))
+
+    mock_monotonic.return_value = 119
+    assert cache.get(("url",)) == "old"
+    assert cache.cache_info().refreshes == 1
+
+    mock_monotonic.return_value = 120
+    assert cache.get(("url",)) == "old"
+    wait_for_refresh(cache, ("url",))
+
+    assert cache.get(("url",)) == "new"
+    assert cache.cache_info().refreshes == 2
+
+
+def test_get_does_not_cache_errors():
+    load_schema = Mock(side_effect=[NotFound, "schema"])
+    cache = SchemaCache(load_schema, max_size=10, ttl_seconds=60)
+
+    with pytest.raises(NotFound):
+        cache.get(("url",))
+
+    assert cache.get(("url",)) == "schema"
+
+
+def test_get_shares_a_single_load_for_concurrent_misses():
+    loading = threading.Event()
+    release = threading.Event()
+
+    def load_schema(url):
+        loading.set()
+        release.wait(5)
+        return url
+
+    load_schema_mock = Mock(side_effect=load_schema)
+    cache = SchemaCache(load_schema_mock, max_size=10, ttl_seconds=60)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(("url",))))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    loading.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["url"] * 5
+    assert load_schema_mock.call_count == 1
+
+
+def test_cache_clear():
+    cache = SchemaCache(Mock(return_value="schema"), max_size=10, ttl_seconds=60)
+    cache.get(("url",))
+    cache._in_flight[("other",)] = Future()  # pylint: disable=protected-access
+
+    cache.cache_clear()
+
+    assert cache.cache_info() == (0, 0, 0, 10, 0)
+    assert not cache._in_flight  # pylint: disable=protected-access
@@ -0,0 +1,59 @@
+from unittest.mock import Mock, patch
+
+from app.utilities.ttl_cache import TTLCache
+
+
+def test_get_or_set_generates_once():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    generate = Mock(return_value="value")
+
+    assert cache.get_or_set("key", generate) == "value"
+    assert cache.get_or_set("key", generate) == "value"
+
+    generate.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_miss_returns_none():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+
+    assert cache.get("key") is None
+    assert cache.misses == 1
+
+
+def test_entries_expire():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    generate = Mock(side_effect=["value1", "value2"])
+
+    with patch("app.utilities.ttl_cache.time.monotonic", return_value=0):
+        assert cache.get_or_set("key", generate) == "value1"
+        assert cache.get_or_set("key", generate) == "value1"
+
+    with patch("app.utilities.ttl_cache.time.monotonic", return_value=60):
+        assert cache.get_or_set("key", generate) == "value2"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    cache.get("key1")
+    cache.set("key3", "value3")
+
+    assert len(cache) == 2
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") is None
+
+
+def test_pop_and_cache_clear():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+
+    cache.pop("key1")
+    cache.pop("missing")
+    assert cache.get("key1") is None
+
+    cache.cache_clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -13,7 +13,7 @@ from sdc.crypto.key_store import KeyStore
 
 from app.keys import KEY_PURPOSE_AUTHENTICATION, KEY_PURPOSE_SUBMISSION
 from app.setup import create_app
-from tests.app.app_context_test_case import MockDatastore
+from tests.app.app_context_test_case import MockDatastore, fake_redis_connection_pool
 from tests.integration.create_token import TokenGenerator
 
 EQ_USER_AUTHENTICATION_RRM_PRIVATE_KEY_KID = "709eb42cfee5570058ce0711f730bfbb7d4c8ade"
@@ -54,6 +54,10 @@ class IntegrationTestCase(unittest.TestCase):  # pylint: disable=too-many-public
 
         self._redis = patch("app.setup.redis.Redis", fakeredis.FakeStrictRedis)
         self._redis.start()
+        self._redis_pool = patch(
+            "app.setup.InstrumentedBlockingConnectionPool", fake_redis_connection_pool
+        )
+        self._redis_pool.start()
 
         from application import (  # pylint: disable=import-outside-toplevel
             configure_logging,
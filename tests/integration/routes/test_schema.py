@@ -1,7 +1,18 @@
 import json
+import time
+import uuid
+from unittest.mock import patch
 
 from tests.integration.integration_test_case import IntegrationTestCase
 
+WARMABLE_SCHEMA_PATH_MAP = {
+    "en": {
+        "census_household_gb_eng": "schemas/en/census_household_gb_eng.json",
+        "census_household_gb_wls": "schemas/en/census_household_gb_wls.json",
+    },
+    "cy": {"census_household_gb_wls": "schemas/cy/census_household_gb_wls.json"},
+}
+
 
 class TestSchema(IntegrationTestCase):
     def test_get_schema_json(self):
@@ -24,3 +35,79 @@ class TestSchema(IntegrationTestCase):
         self.assertIsInstance(parsed_json, list)
         self.assertIsInstance(parsed_json[0], str)
         self.assertIn("test_textfield", parsed_json)
+
+    @patch(
+        "app.routes.schema.get_schema_path_map", return_value=WARMABLE_SCHEMA_PATH_MAP
+    )
+    @patch("app.routes.schema.warm_questionnaire_schemas")
+    def test_warm_schemas(self, mock_warm_questionnaire_schemas, _):
+        response = self._client.post(
+            self.get_warm_url(),
+            json={"schemas": ["census_household_gb_eng", "census_household_gb_wls"]},
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(
+            response.get_json(),
+            {"schemas": ["census_household_gb_eng", "census_household_gb_wls"]},
+        )
+        mock_warm_questionnaire_schemas.assert_called_once_with(
+            ["census_household_gb_eng", "census_household_gb_wls"]
+        )
+
+    @patch(
+        "app.routes.schema.get_schema_path_map", return_value=WARMABLE_SCHEMA_PATH_MAP
+    )
+    @patch("app.routes.schema.warm_questionnaire_schemas")
+    def test_warm_schemas_with_unknown_schema(self, mock_warm_questionnaire_schemas, _):
+        response = self._client.post(
+            self.get_warm_url(),
+            json={"schemas": ["census_household_gb_eng", "doesnt-exist"]},
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json(), {"unknown_schemas": ["doesnt-exist"]})
+        mock_warm_questionnaire_schemas.assert_not_called()
+
+    @patch("app.routes.schema.warm_questionnaire_schemas")
+    def test_warm_schemas_with_test_schema(self, mock_warm_questionnaire_schemas):
+        response = self._client.post(
+            self.get_warm_url(), json={"schemas": ["test_textfield"]}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json(), {"unknown_schemas": ["test_textfield"]})
+        mock_warm_questionnaire_schemas.assert_not_called()
+
+    def test_warm_schemas_without_schema_names(self):
+        response = self._client.post(self.get_warm_url(), json={})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("app.routes.schema.warm_questionnaire_schemas")
+    def test_warm_schemas_without_token(self, mock_warm_questionnaire_schemas):
+        response = self._client.post(
+            "/schemas/warm", json={"schemas": ["census_household_gb_eng"]}
+        )
+
+        self.assertEqual(response.status_code, 403)
+        mock_warm_questionnaire_schemas.assert_not_called()
+
+    @patch("app.routes.schema.warm_questionnaire_schemas")
+    def test_warm_schemas_without_permission(self, mock_warm_questionnaire_schemas):
+        response = self._client.post(
+            self.get_warm_url(roles=["test"]),
+            json={"schemas": ["census_household_gb_eng"]},
+        )
+
+        self.assertEqual(response.status_code, 403)
+        mock_warm_questionnaire_schemas.assert_not_called()
+
+    def get_warm_url(self, roles=("flusher",)):
+        payload = {
+            "jti": str(uuid.uuid4()),
+            "iat": time.time(),
+            "exp": time.time() + 1000,
+            "roles": list(roles),
+        }
+        return "/schemas/warm?token=" + self.token_generator.generate_token(payload)